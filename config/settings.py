@@ -4,6 +4,8 @@
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Попытка импорта decouple, если не установлен - используем os.environ
 try:
     from decouple import config
@@ -30,6 +32,9 @@ DEBUG = config('DEBUG', default='True', cast=bool)
 
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=lambda v: [s.strip() for s in str(v).split(',')] if v else [])
 
+# Адрес сайта для абсолютных ссылок в sitemap.xml и RSS/Atom ленте
+SITE_URL = config('SITE_URL', default='http://localhost:8000')
+
 # Security settings для production
 if not DEBUG:
     # SSL настройки - только если есть реальный SSL сертификат
@@ -79,6 +84,9 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'landing.middleware.EarlyHintsMiddleware',
+    'landing.middleware.ViewCounterMiddleware',
+    'landing.middleware.PrecompressedCacheMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -87,8 +95,14 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Кэширующий загрузчик с минификацией HTML при компиляции шаблона
+            'loaders': [
+                ('landing.template_loaders.MinifyingCachedLoader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -118,6 +132,53 @@ if database_url:
     except ImportError:
         pass  # dj-database-url не установлен
 
+# Cache
+# Версии кэша страниц, токены spam_guard и результаты отправок формы должны
+# быть общими для всех воркеров gunicorn и планировщика публикаций, поэтому
+# в production обязателен REDIS_URL. Локальная память процесса - только
+# для разработки (DEBUG=True).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'burokv',
+    }
+}
+
+redis_url = config('REDIS_URL', default=None)
+if redis_url:
+    if not redis_url.startswith(('redis://', 'rediss://', 'unix://')):
+        raise ImproperlyConfigured(
+            'REDIS_URL должен начинаться с redis://, rediss:// или unix://'
+        )
+    try:
+        import redis  # noqa: F401
+    except ImportError:
+        raise ImproperlyConfigured(
+            'REDIS_URL задан, но пакет redis не установлен: pip install -r requirements.txt'
+        )
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': redis_url,
+    }
+elif not DEBUG:
+    raise ImproperlyConfigured(
+        'Для DEBUG=False укажите REDIS_URL: без общего кэша инвалидация страниц, '
+        'лимиты заявок и защита от повторной отправки работают в каждом воркере отдельно'
+    )
+
+# Время жизни кэша HTML-страниц (секунды). Инвалидация - по версии контента.
+PAGE_CACHE_TIMEOUT = config('PAGE_CACHE_TIMEOUT', default=3600, cast=int)
+# Количество вариантов страниц в LRU-кэше памяти процесса (перед общим кэшем)
+PAGE_CACHE_LOCAL_SIZE = config('PAGE_CACHE_LOCAL_SIZE', default=256, cast=int)
+# Максимальный интервал проверок планировщика отложенных публикаций (секунды)
+PUBLISH_SCHEDULER_INTERVAL = config('PUBLISH_SCHEDULER_INTERVAL', default=60, cast=int)
+# Интервал записи буфера счетчиков просмотров и заявок в БД (секунды, 0 - писать сразу)
+COUNTERS_FLUSH_INTERVAL = config('COUNTERS_FLUSH_INTERVAL', default=10, cast=int)
+# Обработанные и отклоненные заявки старше этого срока (дни) переносятся в архив
+APPLICATION_ARCHIVE_DAYS = config('APPLICATION_ARCHIVE_DAYS', default=180, cast=int)
+# Как часто фоновый процесс (run_publish_scheduler) запускает архивацию (секунды)
+APPLICATION_ARCHIVE_INTERVAL = config('APPLICATION_ARCHIVE_INTERVAL', default=24 * 3600, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -150,7 +211,8 @@ STATICFILES_DIRS = [
 # WhiteNoise для обслуживания статических файлов в production
 if not DEBUG:
     try:
-        STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        # Манифест WhiteNoise + сборка критического CSS при collectstatic
+        STATICFILES_STORAGE = 'landing.storage.CriticalCSSManifestStaticFilesStorage'
         # Вставляем WhiteNoise после SecurityMiddleware
         if 'whitenoise.middleware.WhiteNoiseMiddleware' not in MIDDLEWARE:
             MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
@@ -161,6 +223,16 @@ if not DEBUG:
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Выгружать в XML-фид для порталов и проданные объекты (по умолчанию только непроданные)
+REALTY_FEED_INCLUDE_SOLD = config('REALTY_FEED_INCLUDE_SOLD', default=False, cast=bool)
+
+# Адреса прокси, которым доверяется заголовок X-Real-IP (IP посетителя для лимитов формы заявки).
+# unix - соединения через unix-сокет gunicorn (nginx на том же сервере, см. DEPLOY.md)
+TRUSTED_PROXIES = config('TRUSTED_PROXIES', default='unix,127.0.0.1,::1', cast=lambda v: [s.strip() for s in str(v).split(',')] if v else [])
+
+# Папка на сервере с изображениями для импорта объектов из админки
+PROPERTY_IMPORT_IMAGES_DIR = config('PROPERTY_IMPORT_IMAGES_DIR', default=str(MEDIA_ROOT / 'import'))
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -33,3 +33,14 @@ preload_app = True
 max_requests = 1000
 max_requests_jitter = 50
 
+
+
+def worker_exit(server, worker):
+    """
+    Запись буфера счетчиков и отправка поставленных в очередь заявок
+    при остановке воркера.
+    """
+    from landing.services import applications, counters
+
+    applications.shutdown()
+    counters.flush()
@@ -6,7 +6,9 @@ from .property_admin import PropertyAdmin
 from .article_admin import ArticleAdmin
 from .team_member_admin import TeamMemberAdmin
 from .application_admin import ApplicationAdmin
+from .archived_application_admin import ArchivedApplicationAdmin
 from .telegram_subscriber_admin import TelegramSubscriberAdmin
+from .daily_counter_admin import DailyCounterAdmin
 
-__all__ = ['ServiceAdmin', 'PropertyAdmin', 'ArticleAdmin', 'TeamMemberAdmin', 'ApplicationAdmin', 'TelegramSubscriberAdmin']
+__all__ = ['ServiceAdmin', 'PropertyAdmin', 'ArticleAdmin', 'TeamMemberAdmin', 'ApplicationAdmin', 'ArchivedApplicationAdmin', 'TelegramSubscriberAdmin', 'DailyCounterAdmin']
 
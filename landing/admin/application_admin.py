@@ -1,8 +1,21 @@
 """
 Админ-панель для модели Application.
 """
-from django.contrib import admin
-from landing.models import Application
+from urllib.parse import urlencode
+
+from django.contrib import admin, messages
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils.html import format_html
+from landing.models import Application, ArchivedApplication
+from landing.services import application_actions, application_stats
+from landing.services.application_export import export_response
+from landing.services.applications import describe_previous, get_previous
+from landing.services.full_text_search import ADMIN_SEARCH_LIMIT, ADMIN_SEARCH_LIMIT_MESSAGE, APPLICATION_SEARCH_INDEX
+from landing.services.phones import normalize_phone
 
 
 @admin.register(Application)
@@ -14,6 +27,7 @@ class ApplicationAdmin(admin.ModelAdmin):
         'name',
         'phone',
         'status',
+        'previous_count',
         'is_sent_to_telegram',
         'created_at',
     )
@@ -33,10 +47,12 @@ class ApplicationAdmin(admin.ModelAdmin):
         'updated_at',
         'is_sent_to_telegram',
         'telegram_error',
+        'phone_normalized',
+        'previous_applications',
     )
     fieldsets = (
         ('Основная информация', {
-            'fields': ('name', 'phone', 'message')
+            'fields': ('name', 'phone', 'phone_normalized', 'previous_applications', 'message')
         }),
         ('Статус', {
             'fields': ('status', 'is_sent_to_telegram', 'telegram_error')
@@ -48,6 +64,8 @@ class ApplicationAdmin(admin.ModelAdmin):
     )
     ordering = ('-created_at',)
     date_hierarchy = 'created_at'
+    actions = ('mark_processed', 'mark_rejected', 'resend_to_telegram', 'export_csv', 'export_xlsx')
+    change_list_template = 'admin/landing/application/change_list.html'
     
     def get_readonly_fields(self, request, obj=None):
         """
@@ -56,4 +74,150 @@ class ApplicationAdmin(admin.ModelAdmin):
         if obj is None:
             return self.readonly_fields
         return self.readonly_fields
+    
+    def get_urls(self):
+        """
+        Добавление страницы статистики заявок.
+        """
+        urls = [
+            path(
+                'stats/',
+                self.admin_site.admin_view(self.stats_view),
+                name='landing_application_stats',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def stats_view(self, request):
+        """
+        Статистика заявок по дням: статусы и доставка в Telegram.
+
+        Данные читаются из дневной сводки (по строке на день периода).
+        """
+        if not self.has_view_permission(request):
+            return redirect(reverse('admin:index'))
+
+        try:
+            days = int(request.GET.get('days', application_stats.DEFAULT_PERIOD))
+        except ValueError:
+            days = application_stats.DEFAULT_PERIOD
+        if days not in application_stats.PERIODS:
+            days = application_stats.DEFAULT_PERIOD
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': 'Статистика заявок',
+            'periods': application_stats.PERIODS,
+            'statuses': Application.Status.choices,
+            **application_stats.get_dashboard(days),
+        }
+        return TemplateResponse(request, 'admin/landing/application/stats.html', context)
+
+    def get_queryset(self, request):
+        """
+        Заявки с количеством прошлых заявок того же клиента, включая архив
+        (подзапросы по индексам телефона).
+        """
+        previous = [
+            Coalesce(Subquery(
+                model.objects.filter(
+                    phone_normalized=OuterRef('phone_normalized'),
+                    created_at__lt=OuterRef('created_at'),
+                )
+                .order_by()
+                .values('phone_normalized')
+                .annotate(count=Count('uuid'))
+                .values('count')
+            ), 0)
+            for model in (Application, ArchivedApplication)
+        ]
+        return super().get_queryset(request).annotate(previous_count=previous[0] + previous[1])
+
+    @admin.display(description='Прошлых заявок', ordering='previous_count')
+    def previous_count(self, obj):
+        return obj.previous_count
+
+    @admin.display(description='Прошлые заявки')
+    def previous_applications(self, obj):
+        """
+        «N предыдущих заявок, последняя ...» со ссылкой на все заявки с этим телефоном.
+        """
+        if obj is None or not obj.phone_normalized:
+            return '-'
+        description = describe_previous(*get_previous(obj))
+        if not description:
+            return 'Нет'
+        url = reverse('admin:landing_application_changelist') + '?' + urlencode({'phone_normalized': obj.phone_normalized})
+        return format_html('<a href="{}">{}</a>', url, description)
+
+    @admin.action(description='Отметить как обработанные', permissions=('change',))
+    def mark_processed(self, request, queryset):
+        """
+        Статус «Обработана» у выбранных заявок одним UPDATE.
+        """
+        return self._bulk_result_response(
+            request, application_actions.set_status(queryset, Application.Status.PROCESSED)
+        )
+
+    @admin.action(description='Отметить как отклоненные', permissions=('change',))
+    def mark_rejected(self, request, queryset):
+        """
+        Статус «Отклонена» у выбранных заявок одним UPDATE.
+        """
+        return self._bulk_result_response(
+            request, application_actions.set_status(queryset, Application.Status.REJECTED)
+        )
+
+    @admin.action(description='Повторно отправить в Telegram', permissions=('change',))
+    def resend_to_telegram(self, request, queryset):
+        """
+        Повторная отправка выбранных неотправленных заявок пачками в несколько потоков.
+        """
+        return self._bulk_result_response(request, application_actions.resend(queryset))
+
+    def _bulk_result_response(self, request, result):
+        """
+        Страница с итогами массового действия и результатом по каждой заявке.
+        """
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': result.title,
+            'result': result,
+        }
+        return TemplateResponse(request, 'admin/landing/application/bulk_result.html', context)
+
+    @admin.action(description='Выгрузить в CSV')
+    def export_csv(self, request, queryset):
+        """
+        Потоковая выгрузка выбранных заявок (с «Выбрать все» - всех по фильтру) в CSV.
+        """
+        return export_response(queryset, 'csv')
+
+    @admin.action(description='Выгрузить в Excel (XLSX)')
+    def export_xlsx(self, request, queryset):
+        """
+        Потоковая выгрузка выбранных заявок в XLSX.
+        """
+        return export_response(queryset, 'xlsx')
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Поиск по полнотекстовому индексу вместо icontains по search_fields.
+
+        Запрос, похожий на телефон, ищется точным совпадением по нормализованному номеру.
+        """
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        phone = normalize_phone(search_term)
+        if phone is not None:
+            return queryset.filter(phone_normalized=phone), False
+        pks = APPLICATION_SEARCH_INDEX.search_pks(queryset, search_term, limit=ADMIN_SEARCH_LIMIT + 1)
+        if pks is None:
+            return super().get_search_results(request, queryset, search_term)
+        if len(pks) > ADMIN_SEARCH_LIMIT:
+            pks = pks[:ADMIN_SEARCH_LIMIT]
+            self.message_user(request, ADMIN_SEARCH_LIMIT_MESSAGE, messages.WARNING)
+        return queryset.filter(uuid__in=pks), False
 
@@ -0,0 +1,72 @@
+"""
+Админ-панель для модели ArchivedApplication.
+"""
+from django.contrib import admin, messages
+from landing.models import ArchivedApplication
+from landing.services.full_text_search import ADMIN_SEARCH_LIMIT, ADMIN_SEARCH_LIMIT_MESSAGE, ARCHIVED_APPLICATION_SEARCH_INDEX
+from landing.services.phones import normalize_phone
+
+
+@admin.register(ArchivedApplication)
+class ArchivedApplicationAdmin(admin.ModelAdmin):
+    """
+    Просмотр архива заявок (только чтение).
+    """
+    list_display = (
+        'name',
+        'phone',
+        'status',
+        'is_sent_to_telegram',
+        'created_at',
+        'archived_at',
+    )
+    list_filter = (
+        'status',
+        'is_sent_to_telegram',
+    )
+    search_fields = (
+        'name',
+        'phone',
+        'message',
+    )
+    fieldsets = (
+        ('Основная информация', {
+            'fields': ('name', 'phone', 'phone_normalized', 'message')
+        }),
+        ('Статус', {
+            'fields': ('status', 'is_sent_to_telegram', 'telegram_error')
+        }),
+        ('Системная информация', {
+            'fields': ('uuid', 'created_at', 'updated_at', 'archived_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    ordering = ('-created_at',)
+    # Архив большой: без COUNT(*) по всей таблице на каждой странице
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Поиск по нормализованному телефону или полнотекстовому индексу архива.
+        """
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        phone = normalize_phone(search_term)
+        if phone is not None:
+            return queryset.filter(phone_normalized=phone), False
+        pks = ARCHIVED_APPLICATION_SEARCH_INDEX.search_pks(queryset, search_term, limit=ADMIN_SEARCH_LIMIT + 1)
+        if pks is None:
+            return super().get_search_results(request, queryset, search_term)
+        if len(pks) > ADMIN_SEARCH_LIMIT:
+            pks = pks[:ADMIN_SEARCH_LIMIT]
+            self.message_user(request, ADMIN_SEARCH_LIMIT_MESSAGE, messages.WARNING)
+        return queryset.filter(uuid__in=pks), False
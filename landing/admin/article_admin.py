@@ -1,8 +1,11 @@
 """
 Админ-панель для управления статьями.
 """
-from django.contrib import admin
-from landing.models import Article
+from django.contrib import admin, messages
+from django.db.models import OuterRef, Subquery, Sum
+from landing.models import Article, DailyCounter
+from landing.services import counters
+from landing.services.full_text_search import ADMIN_SEARCH_LIMIT, ADMIN_SEARCH_LIMIT_MESSAGE, ARTICLE_SEARCH_INDEX
 
 
 @admin.register(Article)
@@ -10,7 +13,7 @@ class ArticleAdmin(admin.ModelAdmin):
     """
     Админ-класс для управления статьями и новостями.
     """
-    list_display = ['title', 'published_at', 'is_published', 'order', 'created_at']
+    list_display = ['title', 'published_at', 'is_published', 'order', 'view_count', 'created_at']
     list_filter = ['is_published', 'published_at', 'created_at']
     search_fields = ['title', 'short_description', 'content']
     list_editable = ['order', 'is_published']
@@ -23,7 +26,7 @@ class ArticleAdmin(admin.ModelAdmin):
             'fields': ('title', 'slug', 'short_description')
         }),
         ('Содержание', {
-            'fields': ('content',)
+            'fields': ('content_format', 'content', 'reading_time')
         }),
         ('Медиа', {
             'fields': ('image',)
@@ -37,5 +40,34 @@ class ArticleAdmin(admin.ModelAdmin):
         }),
     )
     
-    readonly_fields = ['uuid', 'created_at', 'updated_at']
+    readonly_fields = ['uuid', 'created_at', 'updated_at', 'reading_time']
+    
+    def get_queryset(self, request):
+        """
+        Статьи с суммой просмотров из таблицы счетчиков (один подзапрос).
+        """
+        views = (
+            DailyCounter.objects.filter(name=counters.ARTICLE_VIEW, key=OuterRef('slug'))
+            .values('key')
+            .annotate(total=Sum('value'))
+            .values('total')
+        )
+        return super().get_queryset(request).annotate(view_count=Subquery(views))
+
+    @admin.display(description='Просмотры', ordering='view_count')
+    def view_count(self, obj):
+        return obj.view_count or 0
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Поиск по полнотекстовому индексу вместо icontains по search_fields.
+        """
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        pks = ARTICLE_SEARCH_INDEX.search_pks(queryset, search_term, limit=ADMIN_SEARCH_LIMIT + 1)
+        if pks is None:
+            return super().get_search_results(request, queryset, search_term)
+        if len(pks) > ADMIN_SEARCH_LIMIT:
+            pks = pks[:ADMIN_SEARCH_LIMIT]
+            self.message_user(request, ADMIN_SEARCH_LIMIT_MESSAGE, messages.WARNING)
+        return queryset.filter(uuid__in=pks), False
@@ -0,0 +1,32 @@
+"""
+Админ-панель для модели DailyCounter.
+"""
+from django.contrib import admin
+from landing.models import DailyCounter
+from landing.services import counters
+
+
+@admin.register(DailyCounter)
+class DailyCounterAdmin(admin.ModelAdmin):
+    """
+    Просмотр счетчиков (только чтение, значения пишет landing.services.counters).
+    """
+    list_display = ('date', 'name', 'key', 'value')
+    list_filter = ('name', 'date')
+    search_fields = ('key',)
+    ordering = ('-date', 'name', '-value')
+    date_hierarchy = 'date'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        """
+        Список счетчиков с конверсией главной страницы в заявки за 30 дней.
+        """
+        extra_context = extra_context or {}
+        extra_context['conversion_rates'] = counters.get_conversion_rates(days=30)
+        return super().changelist_view(request, extra_context=extra_context)
@@ -1,8 +1,26 @@
 """
 Админ-панель для управления объектами недвижимости.
 """
-from django.contrib import admin
+from django import forms
+from django.conf import settings
+from django.contrib import admin, messages
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 from landing.models import Property
+from landing.services.property_import import CSV_COLUMNS, READ_ERRORS, PropertyImporter
+
+
+class PropertyImportForm(forms.Form):
+    """
+    Форма загрузки файла импорта объектов.
+    """
+    file = forms.FileField(label='Файл', help_text='CSV или XML-фид в формате Яндекс.Недвижимости')
+    file_format = forms.ChoiceField(
+        label='Формат',
+        choices=[('csv', 'CSV'), ('xml', 'XML-фид')],
+        initial='csv',
+    )
 
 
 @admin.register(Property)
@@ -15,6 +33,7 @@ class PropertyAdmin(admin.ModelAdmin):
     search_fields = ['title', 'location', 'description']
     list_editable = ['order', 'is_active', 'is_sold']
     ordering = ['order', '-created_at']
+    change_list_template = 'admin/landing/property/change_list.html'
     
     fieldsets = (
         ('Основная информация', {
@@ -29,6 +48,10 @@ class PropertyAdmin(admin.ModelAdmin):
         ('Настройки отображения', {
             'fields': ('order', 'is_active')
         }),
+        ('Импорт', {
+            'fields': ('external_id',),
+            'classes': ('collapse',)
+        }),
         ('Системная информация', {
             'fields': ('uuid', 'created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -36,4 +59,66 @@ class PropertyAdmin(admin.ModelAdmin):
     )
     
     readonly_fields = ['uuid', 'created_at', 'updated_at']
-
+    
+    def get_urls(self):
+        """
+        Добавление страницы импорта объектов.
+        """
+        urls = [
+            path(
+                'import/',
+                self.admin_site.admin_view(self.import_view),
+                name='landing_property_import',
+            ),
+        ]
+        return urls + super().get_urls()
+    
+    def import_view(self, request):
+        """
+        Импорт объектов из загруженного CSV или XML-фида.
+        
+        Изображения ищутся в папке PROPERTY_IMPORT_IMAGES_DIR на сервере.
+        """
+        if not self.has_add_permission(request) or not self.has_change_permission(request):
+            return redirect(reverse('admin:landing_property_changelist'))
+        
+        form = PropertyImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            importer = PropertyImporter(images_dir=settings.PROPERTY_IMPORT_IMAGES_DIR)
+            try:
+                result = importer.import_file(form.cleaned_data['file'].file, form.cleaned_data['file_format'])
+            except READ_ERRORS as e:
+                self.message_user(
+                    request,
+                    f'Не удалось прочитать файл: {e}. Проверьте формат (CSV в UTF-8 или XML-фид). '
+                    f'Объекты из строк до ошибки уже сохранены.',
+                    messages.ERROR,
+                )
+                return self._render_import_form(request, form)
+            
+            level = messages.SUCCESS if not result.errors else messages.WARNING
+            self.message_user(
+                request,
+                f'Создано: {result.created}, обновлено: {result.updated}, без изменений: {result.unchanged}, '
+                f'изображений: {result.images}, пропущено строк: {result.skipped}',
+                level,
+            )
+            for error in result.errors[:20]:
+                self.message_user(request, error, messages.WARNING)
+            return redirect(reverse('admin:landing_property_changelist'))
+        
+        return self._render_import_form(request, form)
+    
+    def _render_import_form(self, request, form):
+        """
+        Страница импорта с формой загрузки.
+        """
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': 'Импорт объектов недвижимости',
+            'form': form,
+            'csv_columns': CSV_COLUMNS,
+            'images_dir': settings.PROPERTY_IMPORT_IMAGES_DIR,
+        }
+        return TemplateResponse(request, 'admin/landing/property/import.html', context)
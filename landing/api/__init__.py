@@ -0,0 +1,3 @@
+"""
+Публичное read-only JSON API контента лендинга.
+"""
@@ -0,0 +1,78 @@
+"""
+Курсорная пагинация API на основе KeysetPaginator.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from landing.services.keyset_pagination import InvalidCursor, KeysetPaginator
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Пагинация ?after=<курсор> / ?before=<курсор> без COUNT(*) и OFFSET.
+
+    Курсоры совместимы со списком статей на сайте. Ссылки на соседние
+    страницы относительные: ответ не зависит от Host и кэшируется.
+    Порядок записей задается атрибутом view `keyset_ordering`.
+    """
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Получение записей страницы по курсору.
+
+        Raises:
+            ValidationError: Если курсор или размер страницы некорректны
+        """
+        self.request = request
+        paginator = KeysetPaginator(queryset, view.keyset_ordering, self.get_page_size(request))
+        try:
+            self.page = paginator.page(
+                after=request.query_params.get('after'),
+                before=request.query_params.get('before'),
+            )
+        except InvalidCursor as e:
+            raise ValidationError({'cursor': str(e)})
+        return self.page.object_list
+
+    def get_page_size(self, request) -> int:
+        """
+        Размер страницы из ?page_size= (не больше max_page_size).
+        """
+        value = request.query_params.get(self.page_size_query_param)
+        if value is None:
+            return self.page_size
+        try:
+            page_size = int(value)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: 'Ожидается целое число'})
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self._link('after', self.page.next_cursor),
+            'previous': self._link('before', self.page.previous_cursor),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        link = {'type': 'string', 'nullable': True}
+        return {
+            'type': 'object',
+            'properties': {'next': link, 'previous': link, 'results': schema},
+        }
+
+    def _link(self, param: str, cursor):
+        """
+        Относительная ссылка на соседнюю страницу.
+        """
+        if cursor is None:
+            return None
+        url = self.request.get_full_path()
+        url = remove_query_param(url, 'before' if param == 'after' else 'after')
+        return replace_query_param(url, param, cursor)
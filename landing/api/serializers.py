@@ -0,0 +1,111 @@
+"""
+Сериализаторы публичного API.
+"""
+from django.urls import reverse
+from rest_framework import serializers
+
+from landing.models import Article, Property, Service, TeamMember
+from landing.services.feeds import absolute_url
+
+
+class MediaURLField(serializers.ImageField):
+    """
+    Абсолютный URL файла по SITE_URL.
+
+    Не зависит от Host запроса, поэтому сериализованный ответ можно
+    кэшировать и отдавать всем клиентам.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return absolute_url(value.url)
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор с выбором полей через ?fields=title,slug.
+    """
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        Инициализация с ограничением набора полей.
+
+        Args:
+            fields: Имена полей для ответа (None - все поля)
+
+        Raises:
+            ValidationError: Если запрошено неизвестное поле
+        """
+        super().__init__(*args, **kwargs)
+        if fields:
+            unknown = set(fields) - set(self.fields)
+            if unknown:
+                raise serializers.ValidationError(
+                    {'fields': f'Неизвестные поля: {", ".join(sorted(unknown))}'}
+                )
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ServiceSerializer(SparseFieldsetSerializer):
+    """
+    Услуга компании.
+    """
+    icon = MediaURLField(read_only=True)
+
+    class Meta:
+        model = Service
+        fields = ['uuid', 'title', 'description', 'icon', 'order']
+
+
+class TeamMemberSerializer(SparseFieldsetSerializer):
+    """
+    Член команды.
+    """
+    photo = MediaURLField(read_only=True)
+
+    class Meta:
+        model = TeamMember
+        fields = ['uuid', 'name', 'position', 'photo', 'order']
+
+
+class PropertySerializer(SparseFieldsetSerializer):
+    """
+    Объект недвижимости.
+    """
+    image = MediaURLField(read_only=True)
+    property_type_display = serializers.CharField(source='get_property_type_display', read_only=True)
+
+    class Meta:
+        model = Property
+        fields = [
+            'uuid', 'title', 'description', 'location', 'price',
+            'property_type', 'property_type_display', 'image', 'is_sold', 'order',
+        ]
+
+
+class ArticleListSerializer(SparseFieldsetSerializer):
+    """
+    Статья в списке (без текста).
+    """
+    image = MediaURLField(read_only=True)
+    url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Article
+        fields = [
+            'uuid', 'title', 'slug', 'short_description', 'image',
+            'published_at', 'updated_at', 'reading_time', 'url',
+        ]
+
+    def get_url(self, obj) -> str:
+        return absolute_url(reverse('landing:article_detail', args=[obj.slug]))
+
+
+class ArticleDetailSerializer(ArticleListSerializer):
+    """
+    Статья с HTML текстом и оглавлением.
+    """
+
+    class Meta(ArticleListSerializer.Meta):
+        fields = ArticleListSerializer.Meta.fields + ['content_html', 'toc']
@@ -0,0 +1,16 @@
+"""
+URL конфигурация публичного API.
+"""
+from rest_framework.routers import SimpleRouter
+
+from landing.api.views import ArticleViewSet, PropertyViewSet, ServiceViewSet, TeamMemberViewSet
+
+app_name = 'api'
+
+router = SimpleRouter()
+router.register('services', ServiceViewSet, basename='service')
+router.register('team', TeamMemberViewSet, basename='team-member')
+router.register('properties', PropertyViewSet, basename='property')
+router.register('articles', ArticleViewSet, basename='article')
+
+urlpatterns = router.urls
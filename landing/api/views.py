@@ -0,0 +1,146 @@
+"""
+Read-only ViewSet'ы публичного API.
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import permissions, viewsets
+from rest_framework.renderers import JSONRenderer
+
+from landing.api.pagination import KeysetCursorPagination
+from landing.api.serializers import (
+    ArticleDetailSerializer,
+    ArticleListSerializer,
+    PropertySerializer,
+    ServiceSerializer,
+    TeamMemberSerializer,
+)
+from landing.models import Article, Property, Service, TeamMember
+from landing.services import page_cache, publishing
+
+
+API_KEY_PREFIX = 'landing:api'
+
+# Параметры запроса, влияющие на ответ (остальные не попадают в ключ кэша)
+CACHE_KEY_PARAMS = ('fields', 'after', 'before', 'page_size')
+
+
+class CachedReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Публичный read-only ViewSet с кэшем сериализованных ответов.
+
+    Готовый JSON хранится в кэше с версией контента в ключе, поэтому
+    сохранение услуги, объекта, статьи или члена команды сразу делает
+    старые ответы недоступными (см. landing.signals). ETag - хеш тела
+    ответа: при совпадении If-None-Match отдается 304 без тела.
+    """
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [JSONRenderer]
+    pagination_class = KeysetCursorPagination
+    keyset_ordering = ('order', 'created_at', 'uuid')
+
+    def list(self, request, *args, **kwargs):
+        build = super().list
+        return self._cached_response(request, lambda: build(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        build = super().retrieve
+        return self._cached_response(request, lambda: build(request, *args, **kwargs))
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Сериализатор с полями из ?fields=title,slug.
+        """
+        fields = self.request.query_params.get('fields')
+        if fields:
+            kwargs['fields'] = [name.strip() for name in fields.split(',') if name.strip()]
+        return super().get_serializer(*args, **kwargs)
+
+    def _cached_response(self, request, build):
+        """
+        Ответ из кэша или сборка, сериализация и сохранение в кэш.
+
+        Args:
+            request: HTTP запрос
+            build: Функция, возвращающая Response DRF
+
+        Returns:
+            HttpResponse: JSON ответ или 304 Not Modified
+        """
+        key = self._cache_key(request)
+        cached = cache.get(key)
+        if cached is None:
+            response = build()
+            if response.status_code != 200:
+                return response
+            body = JSONRenderer().render(response.data)
+            cached = (f'"{hashlib.md5(body).hexdigest()}"', body)
+            timeout = publishing.cap_timeout(getattr(settings, 'PAGE_CACHE_TIMEOUT', 3600))
+            cache.set(key, cached, timeout=timeout)
+
+        etag, body = cached
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        # Клиент хранит ответ, но перепроверяет его по ETag при каждом запросе
+        response['Cache-Control'] = 'public, no-cache'
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _cache_key(self, request) -> str:
+        """
+        Ключ кэша: версия контента, путь и значимые параметры запроса.
+        """
+        params = urlencode(sorted(
+            (name, request.query_params[name]) for name in CACHE_KEY_PARAMS if name in request.query_params
+        ))
+        digest = hashlib.md5(f'{request.path}?{params}'.encode('utf-8')).hexdigest()
+        return f'{API_KEY_PREFIX}:{page_cache.get_content_version()}:{digest}'
+
+
+class ServiceViewSet(CachedReadOnlyViewSet):
+    """
+    Активные услуги компании.
+    """
+    serializer_class = ServiceSerializer
+    queryset = Service.objects.filter(is_active=True)
+
+
+class TeamMemberViewSet(CachedReadOnlyViewSet):
+    """
+    Активные члены команды.
+    """
+    serializer_class = TeamMemberSerializer
+    queryset = TeamMember.objects.filter(is_active=True)
+
+
+class PropertyViewSet(CachedReadOnlyViewSet):
+    """
+    Объекты недвижимости, отображаемые на сайте.
+    """
+    serializer_class = PropertySerializer
+    queryset = Property.objects.filter(is_active=True)
+    keyset_ordering = ('order', '-created_at', 'uuid')
+
+
+class ArticleViewSet(CachedReadOnlyViewSet):
+    """
+    Опубликованные статьи. Детальная информация - по slug.
+    """
+    lookup_field = 'slug'
+    keyset_ordering = ('-published_at', '-uuid')
+
+    def get_queryset(self):
+        return Article.objects.published()
+
+    def get_serializer_class(self):
+        return ArticleDetailSerializer if self.action == 'retrieve' else ArticleListSerializer
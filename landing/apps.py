@@ -10,6 +10,9 @@ class LandingConfig(AppConfig):
     
     def ready(self):
         """Запуск при инициализации приложения."""
+        # Подключаем обработчики сигналов (инвалидация кэша страниц)
+        from landing import signals  # noqa
+
         # Запускаем Telegram polling в фоновом потоке (только при явном включении).
         #
         # Важно:
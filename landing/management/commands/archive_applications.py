@@ -0,0 +1,30 @@
+"""
+Команда переноса старых закрытых заявок в архив.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from landing.services.application_archive import archive_applications
+
+
+class Command(BaseCommand):
+    """
+    Перенос обработанных и отклоненных заявок в архив.
+    """
+    help = 'Переносит обработанные и отклоненные заявки старше заданного срока в архив'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'APPLICATION_ARCHIVE_DAYS', 180),
+            help='Переносить заявки старше указанного количества дней',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help='Заявок в одной транзакции')
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        count = archive_applications(days=options['days'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Готово! Перенесено в архив заявок: {count}'))
@@ -0,0 +1,33 @@
+"""
+Команда для пересборки критического CSS.
+"""
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Команда для пересборки критического CSS без полного collectstatic.
+
+    При обычном деплое критический CSS собирается автоматически
+    во время collectstatic (см. landing.storage).
+    """
+    help = 'Собирает критический CSS для страниц лендинга из собранного style.css'
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        if not hasattr(staticfiles_storage, 'build_critical_css'):
+            raise CommandError(
+                'STATICFILES_STORAGE не поддерживает сборку критического CSS. '
+                'Используйте landing.storage.CriticalCSSManifestStaticFilesStorage.'
+            )
+
+        try:
+            sizes = staticfiles_storage.build_critical_css()
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Не удалось собрать критический CSS: {e}. Сначала выполните collectstatic.')
+
+        for page, size in sizes.items():
+            self.stdout.write(self.style.SUCCESS(f'✓ {page}: {size} байт'))
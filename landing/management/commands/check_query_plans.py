@@ -0,0 +1,132 @@
+"""
+Команда для проверки планов выполнения запросов публичных страниц.
+"""
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from landing.models import Application, Article
+from landing.views import ArticleDetailView, ArticlesListView, LandingView, PropertyCatalogView
+
+
+class Command(BaseCommand):
+    """
+    Команда выполняет view лендинга, собирает их SQL-запросы и запускает
+    для каждого EXPLAIN. Если запрос читает таблицу полным сканированием
+    и затем сортирует результат, команда завершается с ошибкой.
+
+    Дополнительно проверяются запросы changelist заявок в админке.
+    """
+    help = 'Проверяет, что запросы страниц лендинга используют индексы (EXPLAIN)'
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        queries = self._collect_view_queries() + self._admin_queries()
+
+        failures = []
+        for label, sql, params in queries:
+            plan = self._explain(sql, params)
+            if self._is_full_scan_with_sort(plan):
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f'✗ {label}: полное сканирование + сортировка'))
+                self.stdout.write(f'    {sql}')
+                for line in plan:
+                    self.stdout.write(f'    {line}')
+            else:
+                self.stdout.write(self.style.SUCCESS(f'✓ {label}'))
+
+        if failures:
+            raise CommandError(f'Запросов без подходящего индекса: {len(failures)}')
+        self.stdout.write(self.style.SUCCESS(f'\nГотово! Проверено запросов: {len(queries)}'))
+
+    def _collect_view_queries(self) -> list:
+        """
+        Выполнение view с захватом SQL-запросов.
+
+        Returns:
+            list: Кортежи (описание, SQL, параметры) для SELECT-запросов
+        """
+        factory = RequestFactory()
+        pages = [
+            ('landing:index', LandingView, reverse('landing:index'), {}),
+            ('landing:articles_list', ArticlesListView, reverse('landing:articles_list'), {}),
+            ('landing:properties_list', PropertyCatalogView, reverse('landing:properties_list'), {}),
+        ]
+        article = Article.objects.published().only('slug').first()
+        if article is not None:
+            pages.append((
+                'landing:article_detail',
+                ArticleDetailView,
+                reverse('landing:article_detail', args=[article.slug]),
+                {'slug': article.slug},
+            ))
+        else:
+            self.stdout.write(self.style.WARNING('Нет опубликованных статей, article_detail пропущен'))
+
+        queries = []
+        for name, view_class, path, kwargs in pages:
+            request = factory.get(path)
+            request.user = AnonymousUser()
+            with CaptureQueriesContext(connection) as captured:
+                response = view_class.as_view()(request, **kwargs)
+                if hasattr(response, 'render'):
+                    response.render()
+            for index, query in enumerate(captured.captured_queries, start=1):
+                if query['sql'].lstrip().upper().startswith('SELECT'):
+                    queries.append((f'{name} #{index}', query['sql'], None))
+        return queries
+
+    @staticmethod
+    def _admin_queries() -> list:
+        """
+        Запросы changelist заявок: фильтр по статусу и сортировка по дате.
+
+        Returns:
+            list: Кортежи (описание, SQL, параметры)
+        """
+        querysets = [
+            ('admin:application status filter', Application.objects.filter(status=Application.Status.NEW).order_by('-created_at')[:100]),
+            ('admin:application changelist', Application.objects.order_by('-created_at')[:100]),
+        ]
+        return [(label, *queryset.query.sql_with_params()) for label, queryset in querysets]
+
+    @staticmethod
+    def _explain(sql: str, params=None) -> list:
+        """
+        Получение плана выполнения запроса.
+
+        Для PostgreSQL последовательное сканирование отключается в рамках
+        транзакции: на маленьких таблицах планировщик иначе всегда выбирает
+        Seq Scan, и проверка не показала бы, есть ли подходящий индекс.
+
+        Returns:
+            list: Строки плана
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute(f'EXPLAIN {sql}', params)
+                return [row[0] for row in cursor.fetchall()]
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                return [row[-1] for row in cursor.fetchall()]
+            cursor.execute(f'EXPLAIN {sql}', params)
+            return [' '.join(str(value) for value in row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _is_full_scan_with_sort(plan: list) -> bool:
+        """
+        Проверка плана на полное сканирование таблицы с последующей сортировкой.
+        """
+        if connection.vendor == 'sqlite':
+            full_scan = any(line.startswith('SCAN ') and 'USING' not in line for line in plan)
+            sort = any('USE TEMP B-TREE FOR ORDER BY' in line for line in plan)
+        else:
+            full_scan = any('Seq Scan' in line for line in plan)
+            sort = any(line.strip().lstrip('-> ').startswith('Sort') for line in plan)
+        return full_scan and sort
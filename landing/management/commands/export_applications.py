@@ -0,0 +1,63 @@
+"""
+Команда выгрузки заявок в CSV или XLSX.
+"""
+from datetime import datetime, time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from landing.models import Application
+from landing.services.application_export import FORMATS, write_export
+
+
+class Command(BaseCommand):
+    """
+    Выгрузка заявок в файл (потоково, без загрузки всех строк в память).
+    """
+    help = 'Выгружает заявки в CSV или XLSX'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Путь к файлу (.csv или .xlsx)')
+        parser.add_argument(
+            '--format',
+            choices=sorted(FORMATS),
+            help='Формат файла (по умолчанию по расширению)',
+        )
+        parser.add_argument(
+            '--status',
+            action='append',
+            choices=Application.Status.values,
+            help='Только заявки в статусе (можно указать несколько раз)',
+        )
+        parser.add_argument('--since', help='Заявки начиная с даты (ГГГГ-ММ-ДД)')
+        parser.add_argument('--until', help='Заявки до даты включительно (ГГГГ-ММ-ДД)')
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        path = Path(options['output'])
+        file_format = options['format'] or path.suffix.lower().lstrip('.')
+        if file_format not in FORMATS:
+            raise CommandError('Укажите --format csv или xlsx')
+
+        queryset = Application.objects.all()
+        if options['status']:
+            queryset = queryset.filter(status__in=options['status'])
+        if options['since']:
+            queryset = queryset.filter(created_at__gte=self._parse_date(options['since'], time.min))
+        if options['until']:
+            queryset = queryset.filter(created_at__lte=self._parse_date(options['until'], time.max))
+
+        with open(path, 'wb') as f:
+            size = write_export(queryset, file_format, f)
+        self.stdout.write(self.style.SUCCESS(f'Готово! {path} ({size / 1024:.0f} КБ)'))
+
+    @staticmethod
+    def _parse_date(value: str, at: time) -> datetime:
+        try:
+            day = datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f'Некорректная дата {value!r}, нужен формат ГГГГ-ММ-ДД')
+        return timezone.make_aware(datetime.combine(day, at))
@@ -0,0 +1,33 @@
+"""
+Команда выгрузки XML-фида объектов недвижимости.
+"""
+from django.core.management.base import BaseCommand
+
+from landing.services.realty_feed import build_realty_feed, get_feed_path
+
+
+class Command(BaseCommand):
+    """
+    Выгрузка объектов в формате фида Яндекс.Недвижимости.
+    """
+    help = 'Выгружает объекты недвижимости в XML-фид для порталов'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help='Путь к файлу (по умолчанию фид, который отдается по /feeds/yandex-realty.xml)',
+        )
+        parser.add_argument(
+            '--include-sold',
+            action='store_true',
+            default=None,
+            help='Выгрузить и проданные объекты (по умолчанию - настройка REALTY_FEED_INCLUDE_SOLD)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        count = build_realty_feed(path=options['output'], include_sold=options['include_sold'])
+        path = options['output'] or get_feed_path()
+        self.stdout.write(self.style.SUCCESS(f'Готово! Выгружено объектов: {count} -> {path}'))
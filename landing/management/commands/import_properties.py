@@ -0,0 +1,59 @@
+"""
+Команда массового импорта объектов недвижимости.
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from landing.services.property_import import CSV_COLUMNS, READ_ERRORS, PropertyImporter
+
+
+class Command(BaseCommand):
+    """
+    Импорт объектов из CSV или XML-фида (формат Яндекс.Недвижимости).
+    """
+    help = (
+        'Импортирует объекты недвижимости из CSV или XML-фида. '
+        f'Колонки CSV: {", ".join(CSV_COLUMNS)}'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к файлу импорта')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'xml'],
+            help='Формат файла (по умолчанию по расширению)',
+        )
+        parser.add_argument(
+            '--images-dir',
+            help='Папка с изображениями (по умолчанию папка файла импорта)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Размер пачки записи в БД')
+        parser.add_argument('--workers', type=int, default=8, help='Потоков обработки изображений')
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        path = Path(options['path'])
+        if not path.is_file():
+            raise CommandError(f'Файл {path} не найден')
+
+        file_format = options['format'] or ('xml' if path.suffix.lower() == '.xml' else 'csv')
+        importer = PropertyImporter(
+            images_dir=options['images_dir'] or path.parent,
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+        )
+        try:
+            with open(path, 'rb') as f:
+                result = importer.import_file(f, file_format)
+        except READ_ERRORS as e:
+            raise CommandError(f'Не удалось прочитать файл {path}: {e}. Объекты из строк до ошибки уже сохранены.')
+
+        for error in result.errors:
+            self.stdout.write(self.style.WARNING(error))
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово! Создано: {result.created}, обновлено: {result.updated}, без изменений: {result.unchanged}, '
+            f'изображений: {result.images}, пропущено строк: {result.skipped}'
+        ))
@@ -0,0 +1,57 @@
+"""
+Команда заполнения нормализованных телефонов у существующих заявок.
+"""
+from django.core.management.base import BaseCommand
+
+from landing.models import Application
+from landing.services.phones import normalize_phone
+
+
+class Command(BaseCommand):
+    """
+    Заполнение Application.phone_normalized пачками.
+    """
+    help = 'Приводит телефоны заявок к формату E.164 (для поиска повторных обращений)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Размер пачки записи в БД')
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Пересчитать и уже заполненные номера',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+
+        Заявки перебираются по первичному ключу (keyset), поэтому номера,
+        которые не удалось нормализовать, не читаются повторно.
+        """
+        batch_size = options['batch_size']
+        queryset = Application.objects.order_by('uuid').only('uuid', 'phone', 'phone_normalized')
+        if not options['all']:
+            queryset = queryset.filter(phone_normalized__isnull=True)
+
+        updated = invalid = 0
+        last_pk = None
+        while True:
+            batch = list(queryset.filter(uuid__gt=last_pk)[:batch_size] if last_pk else queryset[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            changed = []
+            for application in batch:
+                phone = normalize_phone(application.phone)
+                if phone is None:
+                    invalid += 1
+                if phone != application.phone_normalized:
+                    application.phone_normalized = phone
+                    changed.append(application)
+            Application.objects.bulk_update(changed, ['phone_normalized'])
+            updated += len(changed)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово! Обновлено заявок: {updated}, телефонов не в формате номера: {invalid}'
+        ))
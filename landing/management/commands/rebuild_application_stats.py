@@ -0,0 +1,28 @@
+"""
+Команда пересчета дневной статистики заявок.
+"""
+from django.core.management.base import BaseCommand
+
+from landing.services.application_stats import rebuild
+
+
+class Command(BaseCommand):
+    """
+    Пересчет сводки ApplicationDailyStats по заявкам и архиву.
+    """
+    help = 'Пересчитывает дневную статистику заявок (после обновления или ручных правок в БД)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Пересчитать только последние N дней (по умолчанию все)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        count = rebuild(days=options['days'])
+        self.stdout.write(self.style.SUCCESS(f'Готово! Дней в статистике: {count}'))
@@ -0,0 +1,55 @@
+"""
+Команда запуска планировщика отложенных публикаций.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from landing.services.application_archive import archive_applications
+from landing.services.publishing import PeriodicTask, PublishScheduler
+
+
+class Command(BaseCommand):
+    """
+    Фоновый процесс, сбрасывающий кэш страниц к моменту публикации статей
+    и выполняющий регулярные задачи обслуживания (архивация заявок).
+    """
+    help = 'Запускает планировщик отложенных публикаций статей'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=getattr(settings, 'PUBLISH_SCHEDULER_INTERVAL', 60),
+            help='Максимальный интервал между проверками в секундах',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить одну проверку и выйти (для запуска из cron)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Основной метод выполнения команды.
+        """
+        tasks = [
+            PeriodicTask(
+                name='archive_applications',
+                func=archive_applications,
+                interval=getattr(settings, 'APPLICATION_ARCHIVE_INTERVAL', 24 * 3600),
+            ),
+        ]
+        scheduler = PublishScheduler(interval=options['interval'], tasks=tasks)
+        if options['once']:
+            slugs = scheduler.run_once()
+            if slugs:
+                self.stdout.write(self.style.SUCCESS(f'Опубликованы статьи: {", ".join(slugs)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS('Проверка выполнена, новых публикаций нет'))
+            return
+
+        self.stdout.write(f'Планировщик публикаций запущен (интервал {options["interval"]} с), Ctrl+C для остановки')
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            scheduler.stop()
@@ -0,0 +1,8 @@
+"""
+Middleware landing приложения.
+"""
+from .early_hints import EarlyHintsMiddleware
+from .precompressed_cache import PrecompressedCacheMiddleware
+from .view_counter import ViewCounterMiddleware
+
+__all__ = ['EarlyHintsMiddleware', 'PrecompressedCacheMiddleware', 'ViewCounterMiddleware']
@@ -0,0 +1,100 @@
+"""
+Middleware для preload-заголовков и 103 Early Hints критических ресурсов.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from django.templatetags.static import static
+from django.urls import Resolver404, resolve
+from loguru import logger
+
+
+# Критические ресурсы первого экрана по имени URL: (путь в static, тип ресурса)
+CRITICAL_ASSETS = {
+    'landing:index': (
+        ('css/style.css', 'style'),
+        ('images/logo_light.png', 'image'),
+        ('images/HeroBG.png', 'image'),
+    ),
+    'landing:articles_list': (
+        ('css/style.css', 'style'),
+        ('images/logo_light.png', 'image'),
+        ('images/LightBG.png', 'image'),
+    ),
+    'landing:article_detail': (
+        ('css/style.css', 'style'),
+        ('images/logo_light.png', 'image'),
+        ('images/LightBG.png', 'image'),
+    ),
+    'landing:properties_list': (
+        ('css/style.css', 'style'),
+        ('images/logo_light.png', 'image'),
+        ('images/LightBG.png', 'image'),
+    ),
+}
+
+# Ключ WSGI environ, через который сервер может предоставлять отправку 103 Early Hints
+EARLY_HINTS_ENVIRON_KEY = 'wsgi.early_hints'
+
+
+class EarlyHintsMiddleware:
+    """
+    Сообщает браузеру о критических ресурсах страницы до разбора HTML.
+
+    Для каждой страницы из CRITICAL_ASSETS добавляет заголовок
+    `Link: <...>; rel=preload` с URL из манифеста статики. Если сервер
+    предоставляет в environ функцию отправки 103 Early Hints, подсказки
+    уходят клиенту еще до выполнения view. Gunicorn этого не умеет, но
+    CDN (например, Cloudflare Early Hints) сам превращает Link-заголовки
+    ответа в 103 для последующих запросов.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._links: Dict[str, Optional[str]] = {}
+
+    def __call__(self, request):
+        link = self._get_link(request) if request.method in ('GET', 'HEAD') else None
+        if link is None:
+            return self.get_response(request)
+
+        send_early_hints = request.META.get(EARLY_HINTS_ENVIRON_KEY)
+        if callable(send_early_hints):
+            try:
+                send_early_hints([('Link', link)])
+            except Exception as e:
+                logger.warning(f'Не удалось отправить 103 Early Hints: {e}')
+
+        response = self.get_response(request)
+        if response.status_code == 200 and not response.has_header('Link'):
+            response['Link'] = link
+        return response
+
+    def _get_link(self, request) -> Optional[str]:
+        """
+        Получение значения заголовка Link для страницы (кэшируется по имени URL).
+        """
+        try:
+            view_name = resolve(request.path_info).view_name
+        except Resolver404:
+            return None
+
+        if view_name not in self._links:
+            assets = CRITICAL_ASSETS.get(view_name)
+            self._links[view_name] = self._build_link(assets) if assets else None
+        return self._links[view_name]
+
+    @staticmethod
+    def _build_link(assets: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+        """
+        Формирование заголовка Link с URL ресурсов из манифеста статики.
+        """
+        parts: List[str] = []
+        for path, kind in assets:
+            try:
+                url = static(path)
+            except ValueError as e:
+                # Файла нет в манифесте (collectstatic не выполнен)
+                logger.warning(f'Ресурс {path} не найден в манифесте статики: {e}')
+                continue
+            parts.append(f'<{url}>; rel=preload; as={kind}')
+        return ', '.join(parts) or None
@@ -0,0 +1,140 @@
+"""
+Middleware кэша HTML-страниц с предварительно сжатыми вариантами.
+"""
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+from loguru import logger
+
+from landing.services import page_cache, publishing
+
+
+# Страницы, ответы которых можно кэшировать и отдавать всем посетителям,
+# и параметры запроса, которые они читают. Остальные параметры (utm_*,
+# fbclid и т.п.) в ключ кэша не входят, иначе каждый уникальный query
+# string занимал бы отдельные записи и вытеснял горячие страницы
+CACHEABLE_URL_NAMES = {
+    'landing:index': (),
+    # page - старые ссылки, которые view перенаправляет на курсорные
+    'landing:articles_list': ('after', 'before', 'q', 'page'),
+    'landing:article_detail': (),
+    'landing:properties_list': ('type', 'price', 'location', 'after', 'before'),
+}
+
+
+class PrecompressedCacheMiddleware:
+    """
+    Кэширует HTML публичных страниц вместе с его brotli/gzip-вариантами.
+
+    Сжатие выполняется один раз при промахе кэша, дальше клиенту отдаются
+    готовые байты в кодировке, выбранной по Accept-Encoding. Ключ кэша
+    включает версию страницы (см. landing.services.page_cache), поэтому
+    изменения в админке сразу приводят к перерендеру. Версию статьи
+    запоминает ArticleDetailView при первом рендере. Время жизни записей
+    не превышает времени до ближайшей отложенной публикации.
+
+    Кэш не используется для запросов с сессией или flash-сообщениями
+    и для ответов, которые выставляют cookie. Ключ страницы - путь и только
+    те параметры запроса, которые читает страница (CACHEABLE_URL_NAMES).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        match = self._match_cacheable_request(request)
+        if match is None:
+            return self.get_response(request)
+
+        path = self._cache_path(request, CACHEABLE_URL_NAMES[match.view_name])
+        encoding = page_cache.negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        version = page_cache.get_page_version(match.view_name, match.kwargs)
+
+        if version is not None:
+            cached = page_cache.get_page(path, encoding, version)
+            if cached is not None:
+                content_type, body = cached
+                return self._build_response(request, body, content_type, encoding, 'HIT')
+
+        response = self.get_response(request)
+        if not self._is_cacheable_response(response):
+            return response
+
+        if version is None:
+            # Версия появляется после рендера (например, статья запомнила свою версию)
+            version = page_cache.get_page_version(match.view_name, match.kwargs)
+            if version is None:
+                return response
+
+        content_type = response.get('Content-Type', 'text/html; charset=utf-8')
+        try:
+            timeout = publishing.cap_timeout(getattr(settings, 'PAGE_CACHE_TIMEOUT', 3600))
+            encoded = page_cache.store_page(path, response.content, content_type, version, timeout)
+        except Exception as e:
+            logger.error(f'Не удалось сохранить страницу {path} в кэш: {e}')
+            return response
+
+        return self._build_response(request, encoded[encoding], content_type, encoding, 'MISS')
+
+    @staticmethod
+    def _match_cacheable_request(request):
+        """
+        Проверка, что запрос можно обслужить из общего кэша.
+
+        Returns:
+            ResolverMatch | None: Совпадение URL или None, если кэш не используется
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        # Авторизованные пользователи и flash-сообщения - персональный контент
+        if settings.SESSION_COOKIE_NAME in request.COOKIES or 'messages' in request.COOKIES:
+            return None
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        return match if match.view_name in CACHEABLE_URL_NAMES else None
+
+    @staticmethod
+    def _cache_path(request, params) -> str:
+        """
+        Путь для ключа кэша: путь запроса и значимые параметры в постоянном порядке.
+
+        Args:
+            request: HTTP запрос
+            params: Параметры запроса, которые читает страница
+
+        Returns:
+            str: Например /properties/?location=...&type=flat
+        """
+        query = urlencode([
+            (name, value)
+            for name in sorted(params)
+            for value in request.GET.getlist(name)
+        ])
+        return f'{request.path}?{query}' if query else request.path
+
+    @staticmethod
+    def _is_cacheable_response(response) -> bool:
+        """
+        Проверка, что ответ одинаков для всех посетителей и его можно сохранить.
+        """
+        if response.status_code != 200 or response.streaming:
+            return False
+        if response.cookies or response.has_header('Content-Encoding'):
+            return False
+        if not response.get('Content-Type', '').startswith('text/html'):
+            return False
+        cache_control = response.get('Cache-Control', '')
+        return 'private' not in cache_control and 'no-store' not in cache_control
+
+    @staticmethod
+    def _build_response(request, body: bytes, content_type: str, encoding: str, status: str) -> HttpResponse:
+        """
+        Формирование ответа из готовых байтов с отметкой HIT/MISS.
+        """
+        response = page_cache.build_response(request, body, content_type, encoding)
+        response['X-Page-Cache'] = status
+        return response
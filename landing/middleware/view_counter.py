@@ -0,0 +1,57 @@
+"""
+Middleware подсчета просмотров публичных страниц.
+"""
+from django.urls import Resolver404, resolve
+
+from landing.services import counters
+
+
+# Страницы, просмотры которых считаются
+COUNTED_URL_NAMES = {
+    'landing:index',
+    'landing:articles_list',
+    'landing:article_detail',
+    'landing:properties_list',
+}
+
+# Подстроки User-Agent поисковых роботов и мониторинга
+BOT_MARKERS = ('bot', 'spider', 'crawl', 'slurp', 'monitor', 'curl', 'wget', 'python-requests')
+
+
+class ViewCounterMiddleware:
+    """
+    Считает успешные GET-просмотры страниц и статей.
+
+    Стоит перед PrecompressedCacheMiddleware, поэтому учитывает и ответы
+    из кэша страниц. Запись в БД не выполняется: значение увеличивается
+    в буфере процесса (см. landing.services.counters).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method == 'GET' and response.status_code == 200 and not self._is_bot(request):
+            self._count(request)
+        return response
+
+    @staticmethod
+    def _count(request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            # Ответ из кэша страниц: view не вызывался
+            try:
+                match = resolve(request.path_info)
+            except Resolver404:
+                return
+        if match.view_name not in COUNTED_URL_NAMES:
+            return
+        counters.increment(counters.PAGE_VIEW, match.view_name)
+        if match.view_name == 'landing:article_detail':
+            counters.increment(counters.ARTICLE_VIEW, match.kwargs['slug'])
+
+    @staticmethod
+    def _is_bot(request) -> bool:
+        user_agent = request.META.get('HTTP_USER_AGENT', '').lower()
+        return not user_agent or any(marker in user_agent for marker in BOT_MARKERS)
@@ -0,0 +1,26 @@
+# Полнотекстовые индексы: FTS5 (SQLite) или tsvector + GIN (PostgreSQL)
+
+from django.db import migrations
+
+from landing.services.full_text_search import APPLICATION_SEARCH_INDEX, ARTICLE_SEARCH_INDEX
+
+
+def create_indexes(apps, schema_editor):
+    ARTICLE_SEARCH_INDEX.create(schema_editor)
+    APPLICATION_SEARCH_INDEX.create(schema_editor)
+
+
+def drop_indexes(apps, schema_editor):
+    ARTICLE_SEARCH_INDEX.drop(schema_editor)
+    APPLICATION_SEARCH_INDEX.drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0005_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
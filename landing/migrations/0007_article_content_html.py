@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:58
+
+from django.db import migrations, models
+
+from landing.services.article_renderer import render_article
+
+
+def render_existing_articles(apps, schema_editor):
+    """Рендеринг HTML для уже существующих статей пачками."""
+    Article = apps.get_model('landing', 'Article')
+    batch = []
+    for article in Article.objects.only('uuid', 'content', 'content_format').iterator(chunk_size=500):
+        rendered = render_article(article.content, article.content_format)
+        article.content_html = rendered.html
+        article.reading_time = rendered.reading_time
+        article.toc = rendered.toc
+        batch.append(article)
+        if len(batch) >= 500:
+            Article.objects.bulk_update(batch, ['content_html', 'reading_time', 'toc'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['content_html', 'reading_time', 'toc'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0006_full_text_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_format',
+            field=models.CharField(choices=[('text', 'Обычный текст'), ('markdown', 'Markdown')], default='text', max_length=20, verbose_name='Формат текста'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='content_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Формируется автоматически при сохранении', verbose_name='HTML статьи'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=1, editable=False, verbose_name='Время чтения (мин)'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='toc',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='Оглавление'),
+        ),
+        migrations.RunPython(render_existing_articles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0007_article_content_html'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='published_at',
+            field=models.DateTimeField(help_text='Статья с датой в будущем появится на сайте автоматически', verbose_name='Дата публикации'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0008_article_scheduled_publishing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='external_id',
+            field=models.CharField(blank=True, help_text='Идентификатор объекта в файле импорта (CSV или XML-фид)', max_length=100, null=True, unique=True, verbose_name='Внешний ID'),
+        ),
+    ]
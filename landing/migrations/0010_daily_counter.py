@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0009_property_external_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='Счетчик')),
+                ('key', models.CharField(help_text='Slug статьи, имя страницы или раздел лендинга', max_length=200, verbose_name='Ключ')),
+                ('date', models.DateField(verbose_name='Дата')),
+                ('value', models.PositiveBigIntegerField(default=0, verbose_name='Значение')),
+            ],
+            options={
+                'verbose_name': 'Счетчик',
+                'verbose_name_plural': 'Счетчики',
+                'ordering': ['-date', 'name', '-value'],
+                'indexes': [models.Index(fields=['name', '-date'], name='daily_counter_name_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailycounter',
+            constraint=models.UniqueConstraint(fields=('name', 'key', 'date'), name='daily_counter_unique'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0010_daily_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, help_text='Повторная отправка той же формы не создает новую заявку', max_length=64, null=True, unique=True, verbose_name='Ключ идемпотентности'),
+        ),
+    ]
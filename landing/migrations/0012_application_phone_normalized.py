@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0011_application_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='phone_normalized',
+            field=models.CharField(blank=True, editable=False, help_text='Заполняется при сохранении, по нему ищутся прошлые заявки клиента', max_length=16, null=True, verbose_name='Телефон (E.164)'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['phone_normalized', '-created_at'], name='application_phone_idx'),
+        ),
+    ]
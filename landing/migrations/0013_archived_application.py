@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:18
+
+from django.db import migrations, models
+
+from landing.services.full_text_search import ARCHIVED_APPLICATION_SEARCH_INDEX
+
+
+def create_search_index(apps, schema_editor):
+    ARCHIVED_APPLICATION_SEARCH_INDEX.create(schema_editor)
+
+
+def drop_search_index(apps, schema_editor):
+    ARCHIVED_APPLICATION_SEARCH_INDEX.drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0012_application_phone_normalized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('uuid', models.UUIDField(editable=False, primary_key=True, serialize=False, verbose_name='UUID')),
+                ('name', models.CharField(max_length=200, verbose_name='Имя клиента')),
+                ('phone', models.CharField(max_length=20, verbose_name='Телефон')),
+                ('phone_normalized', models.CharField(blank=True, max_length=16, null=True, verbose_name='Телефон (E.164)')),
+                ('message', models.TextField(blank=True, null=True, verbose_name='Сообщение')),
+                ('status', models.CharField(choices=[('new', 'Новая'), ('processed', 'Обработана'), ('rejected', 'Отклонена')], max_length=20, verbose_name='Статус')),
+                ('is_sent_to_telegram', models.BooleanField(default=False, verbose_name='Отправлено в Telegram')),
+                ('telegram_error', models.TextField(blank=True, null=True, verbose_name='Ошибка отправки в Telegram')),
+                ('created_at', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(verbose_name='Дата обновления')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата архивации')),
+            ],
+            options={
+                'verbose_name': 'Архивная заявка',
+                'verbose_name_plural': 'Архив заявок',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='archived_app_created_idx'), models.Index(fields=['phone_normalized', '-created_at'], name='archived_app_phone_idx')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0013_archived_application'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='Дата')),
+                ('received', models.PositiveIntegerField(default=0, verbose_name='Заявок')),
+                ('new', models.PositiveIntegerField(default=0, verbose_name='Новых')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='Обработано')),
+                ('rejected', models.PositiveIntegerField(default=0, verbose_name='Отклонено')),
+                ('sent_to_telegram', models.PositiveIntegerField(default=0, verbose_name='Отправлено в Telegram')),
+                ('delivery_failed', models.PositiveIntegerField(default=0, verbose_name='Ошибок отправки в Telegram')),
+            ],
+            options={
+                'verbose_name': 'Статистика заявок за день',
+                'verbose_name_plural': 'Статистика заявок',
+                'ordering': ['-date'],
+            },
+        ),
+    ]
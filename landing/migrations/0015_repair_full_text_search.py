@@ -0,0 +1,23 @@
+# Восстановление триггеров FTS5: на SQLite их удалили пересоздания таблиц
+# в 0007 (landing_article) и 0011 (landing_application)
+
+from django.db import migrations
+
+from landing.services.full_text_search import SEARCH_INDEXES
+
+
+def repair_indexes(apps, schema_editor):
+    for index in SEARCH_INDEXES:
+        if index.is_broken(schema_editor.connection):
+            index.repair(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0014_application_daily_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(repair_indexes, migrations.RunPython.noop),
+    ]
@@ -6,7 +6,10 @@ from .property import Property
 from .article import Article
 from .team_member import TeamMember
 from .application import Application
+from .archived_application import ArchivedApplication
 from .telegram_subscriber import TelegramSubscriber
+from .counter import DailyCounter
+from .application_stats import ApplicationDailyStats
 
-__all__ = ['Service', 'Property', 'Article', 'TeamMember', 'Application', 'TelegramSubscriber']
+__all__ = ['Service', 'Property', 'Article', 'TeamMember', 'Application', 'ArchivedApplication', 'TelegramSubscriber', 'DailyCounter', 'ApplicationDailyStats']
 
@@ -3,6 +3,7 @@
 """
 from django.db import models
 from core.models import BaseModel
+from landing.services.phones import normalize_phone
 
 
 class Application(BaseModel):
@@ -21,6 +22,14 @@ class Application(BaseModel):
         max_length=20,
         verbose_name='Телефон'
     )
+    phone_normalized = models.CharField(
+        max_length=16,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Телефон (E.164)',
+        help_text='Заполняется при сохранении, по нему ищутся прошлые заявки клиента'
+    )
     message = models.TextField(
         blank=True,
         null=True,
@@ -50,11 +59,37 @@ class Application(BaseModel):
         verbose_name='Ошибка отправки в Telegram'
     )
 
+    idempotency_key = models.CharField(
+        max_length=64,
+        unique=True,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Ключ идемпотентности',
+        help_text='Повторная отправка той же формы не создает новую заявку'
+    )
+
     class Meta:
         verbose_name = 'Заявка'
         verbose_name_plural = 'Заявки'
         ordering = ['-created_at']
+        indexes = [
+            # Changelist в админке: фильтр по статусу и сортировка по дате
+            models.Index(fields=['status', '-created_at'], name='application_status_idx'),
+            models.Index(fields=['-created_at'], name='application_created_idx'),
+            # Прошлые заявки того же клиента
+            models.Index(fields=['phone_normalized', '-created_at'], name='application_phone_idx'),
+        ]
 
     def __str__(self):
         return f'{self.name} - {self.phone} ({self.get_status_display()})'
 
+    def save(self, *args, **kwargs):
+        """
+        Сохранение с нормализацией телефона.
+        """
+        self.phone_normalized = normalize_phone(self.phone)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'phone' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'phone_normalized'}
+        super().save(*args, **kwargs)
@@ -0,0 +1,52 @@
+"""
+Модель дневной сводки по заявкам (статистика для админки).
+"""
+from django.db import models
+
+
+class ApplicationDailyStats(models.Model):
+    """
+    Модель дневной сводки по заявкам.
+
+    Строка хранит количество заявок, созданных за день, в разрезе
+    статуса и результата отправки в Telegram. Значения обновляются
+    инкрементально при создании и изменении заявки (см.
+    landing.services.application_stats), поэтому страница статистики
+    читает по строке на день, а не пересчитывает все заявки.
+    """
+    date = models.DateField(
+        unique=True,
+        verbose_name='Дата'
+    )
+    received = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Заявок'
+    )
+    new = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Новых'
+    )
+    processed = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Обработано'
+    )
+    rejected = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Отклонено'
+    )
+    sent_to_telegram = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Отправлено в Telegram'
+    )
+    delivery_failed = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Ошибок отправки в Telegram'
+    )
+
+    class Meta:
+        verbose_name = 'Статистика заявок за день'
+        verbose_name_plural = 'Статистика заявок'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f'{self.date}: {self.received}'
@@ -0,0 +1,77 @@
+"""
+Модель архивной заявки.
+"""
+from django.db import models
+
+from .application import Application
+
+
+class ArchivedApplication(models.Model):
+    """
+    Обработанная или отклоненная заявка, перенесенная из Application.
+
+    Рабочая таблица заявок остается небольшой: старые закрытые заявки
+    переносятся сюда командой archive_applications (см.
+    landing.services.application_archive). Архив только для чтения,
+    UUID и даты сохраняются как были.
+    """
+    uuid = models.UUIDField(
+        primary_key=True,
+        editable=False,
+        verbose_name='UUID'
+    )
+    name = models.CharField(
+        max_length=200,
+        verbose_name='Имя клиента'
+    )
+    phone = models.CharField(
+        max_length=20,
+        verbose_name='Телефон'
+    )
+    phone_normalized = models.CharField(
+        max_length=16,
+        blank=True,
+        null=True,
+        verbose_name='Телефон (E.164)'
+    )
+    message = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name='Сообщение'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Application.Status.choices,
+        verbose_name='Статус'
+    )
+    is_sent_to_telegram = models.BooleanField(
+        default=False,
+        verbose_name='Отправлено в Telegram'
+    )
+    telegram_error = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name='Ошибка отправки в Telegram'
+    )
+    created_at = models.DateTimeField(
+        verbose_name='Дата создания'
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата обновления'
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Дата архивации'
+    )
+
+    class Meta:
+        verbose_name = 'Архивная заявка'
+        verbose_name_plural = 'Архив заявок'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='archived_app_created_idx'),
+            models.Index(fields=['phone_normalized', '-created_at'], name='archived_app_phone_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} - {self.phone} ({self.get_status_display()})'
@@ -2,7 +2,27 @@
 Модель статьи/новости.
 """
 from django.db import models
+from django.utils import timezone
 from core.models import BaseModel
+from landing.services.article_renderer import render_article
+
+
+class ArticleQuerySet(models.QuerySet):
+    """
+    QuerySet статей.
+    """
+    
+    def published(self, now=None):
+        """
+        Статьи, видимые на сайте: включены и дата публикации наступила.
+        
+        Args:
+            now: Момент времени для проверки (по умолчанию текущий)
+        
+        Returns:
+            QuerySet: Опубликованные статьи
+        """
+        return self.filter(is_published=True, published_at__lte=now or timezone.now())
 
 
 class Article(BaseModel):
@@ -29,6 +49,35 @@ class Article(BaseModel):
     content = models.TextField(
         verbose_name='Содержание статьи'
     )
+    
+    class ContentFormat(models.TextChoices):
+        TEXT = 'text', 'Обычный текст'
+        MARKDOWN = 'markdown', 'Markdown'
+    
+    content_format = models.CharField(
+        max_length=20,
+        choices=ContentFormat.choices,
+        default=ContentFormat.TEXT,
+        verbose_name='Формат текста'
+    )
+    content_html = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name='HTML статьи',
+        help_text='Формируется автоматически при сохранении'
+    )
+    reading_time = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name='Время чтения (мин)'
+    )
+    toc = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name='Оглавление'
+    )
     image = models.ImageField(
         upload_to='articles/',
         blank=True,
@@ -36,7 +85,8 @@ class Article(BaseModel):
         verbose_name='Изображение'
     )
     published_at = models.DateTimeField(
-        verbose_name='Дата публикации'
+        verbose_name='Дата публикации',
+        help_text='Статья с датой в будущем появится на сайте автоматически'
     )
     is_published = models.BooleanField(
         default=True,
@@ -47,11 +97,38 @@ class Article(BaseModel):
         verbose_name='Порядок отображения'
     )
 
+    objects = ArticleQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Статья'
         verbose_name_plural = 'Статьи'
         ordering = ['order', '-published_at']
+        indexes = [
+            # Лента опубликованных статей (главная и keyset пагинация списка)
+            models.Index(
+                fields=['-published_at', '-uuid'],
+                condition=models.Q(is_published=True),
+                name='article_published_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
+    
+    def save(self, *args, **kwargs):
+        """
+        Сохранение с рендерингом HTML, времени чтения и оглавления.
+        """
+        self.render_content()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'content', 'content_format'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'content_html', 'reading_time', 'toc'}
+        super().save(*args, **kwargs)
+    
+    def render_content(self):
+        """Рендеринг текста статьи в HTML (без сохранения в БД)."""
+        rendered = render_article(self.content, self.content_format)
+        self.content_html = rendered.html
+        self.reading_time = rendered.reading_time
+        self.toc = rendered.toc
 
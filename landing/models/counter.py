@@ -0,0 +1,46 @@
+"""
+Модель дневного счетчика (просмотры страниц, заявки).
+"""
+from django.db import models
+
+
+class DailyCounter(models.Model):
+    """
+    Модель дневного счетчика.
+
+    Строка хранит сумму событий одного вида по ключу за день, например
+    просмотры статьи по slug. Строки не создаются на каждый запрос:
+    инкременты копятся в памяти процесса и записываются пачками
+    (см. landing.services.counters).
+    """
+    name = models.CharField(
+        max_length=50,
+        verbose_name='Счетчик'
+    )
+    key = models.CharField(
+        max_length=200,
+        verbose_name='Ключ',
+        help_text='Slug статьи, имя страницы или раздел лендинга'
+    )
+    date = models.DateField(
+        verbose_name='Дата'
+    )
+    value = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name='Значение'
+    )
+
+    class Meta:
+        verbose_name = 'Счетчик'
+        verbose_name_plural = 'Счетчики'
+        ordering = ['-date', 'name', '-value']
+        constraints = [
+            # Цель upsert при сбросе буфера счетчиков
+            models.UniqueConstraint(fields=['name', 'key', 'date'], name='daily_counter_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['name', '-date'], name='daily_counter_name_date_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name}:{self.key} {self.date} = {self.value}'
@@ -60,11 +60,27 @@ class Property(BaseModel):
         default=True,
         verbose_name='Отображать на сайте'
     )
+    external_id = models.CharField(
+        max_length=100,
+        unique=True,
+        blank=True,
+        null=True,
+        verbose_name='Внешний ID',
+        help_text='Идентификатор объекта в файле импорта (CSV или XML-фид)'
+    )
 
     class Meta:
         verbose_name = 'Объект недвижимости'
         verbose_name_plural = 'Объекты недвижимости'
         ordering = ['order', '-created_at']
+        indexes = [
+            # Выборка активных записей для главной страницы
+            models.Index(
+                fields=['order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='property_active_order_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.location}"
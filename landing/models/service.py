@@ -38,6 +38,14 @@ class Service(BaseModel):
         verbose_name = 'Услуга'
         verbose_name_plural = 'Услуги'
         ordering = ['order', 'created_at']
+        indexes = [
+            # Выборка активных записей для главной страницы
+            models.Index(
+                fields=['order', 'created_at'],
+                condition=models.Q(is_active=True),
+                name='service_active_order_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
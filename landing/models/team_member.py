@@ -37,6 +37,14 @@ class TeamMember(BaseModel):
         verbose_name = 'Член команды'
         verbose_name_plural = 'Члены команды'
         ordering = ['order', 'created_at']
+        indexes = [
+            # Выборка активных записей для главной страницы
+            models.Index(
+                fields=['order', 'created_at'],
+                condition=models.Q(is_active=True),
+                name='teammember_active_order_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.position}"
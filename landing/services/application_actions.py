@@ -0,0 +1,183 @@
+"""
+Массовые действия с заявками из админки.
+
+- set_status() меняет статус выбранных заявок одним UPDATE и учитывает
+  изменение в дневной статистике (QuerySet.update() не вызывает сигналы);
+- resend() повторно отправляет в Telegram заявки, которые не удалось
+  доставить: заявки читаются пачками по RESEND_BATCH_SIZE и отправляются
+  параллельно в RESEND_WORKERS потоков, а результаты пачки записываются
+  из основного потока в одной транзакции (параллельная запись из потоков
+  на SQLite упирается в блокировку БД). Новые пачки не начинаются после
+  RESEND_TIME_LIMIT секунд, чтобы запрос уложился в таймаут воркера;
+  оставшиеся заявки отправляются повторным запуском действия.
+
+Оба действия возвращают BulkResult с итогами и результатом по каждой
+заявке для страницы результата в админке.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import Application
+from landing.services import application_stats
+from landing.services.applications import deliver, record_delivery
+
+
+RESEND_WORKERS = 4
+RESEND_BATCH_SIZE = 50
+RESEND_TIME_LIMIT = 60
+
+# Строк с результатами на странице (итоги считаются по всем заявкам)
+RESULT_ROWS_LIMIT = 1000
+
+_STATUS_LABELS = dict(Application.Status.choices)
+
+
+@dataclass
+class RowResult:
+    """
+    Результат действия для одной заявки.
+    """
+    pk: str
+    label: str
+    ok: bool
+    detail: str
+
+
+@dataclass
+class BulkResult:
+    """
+    Итоги массового действия.
+
+    Attributes:
+        title: Название действия
+        succeeded: Заявок, для которых действие выполнено
+        failed: Заявок с ошибкой
+        skipped: Заявок, не требующих действия или не обработанных
+        rows: Результаты по заявкам (не больше RESULT_ROWS_LIMIT)
+        notes: Пояснения к итогам
+    """
+    title: str
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    rows: List[RowResult] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+
+    def add(self, row: RowResult):
+        if row.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if len(self.rows) < RESULT_ROWS_LIMIT:
+            self.rows.append(row)
+
+    @property
+    def hidden_rows(self) -> int:
+        return self.succeeded + self.failed - len(self.rows)
+
+
+def set_status(queryset: QuerySet, status: str) -> BulkResult:
+    """
+    Смена статуса заявок одним UPDATE.
+
+    Args:
+        queryset: Выбранные заявки
+        status: Новый статус
+
+    Returns:
+        BulkResult: Итоги (заявки, уже бывшие в этом статусе, пропускаются)
+    """
+    label = _STATUS_LABELS[status]
+    result = BulkResult(title=f'Смена статуса на «{label}»')
+    queryset = queryset.order_by()
+    with transaction.atomic():
+        total = queryset.count()
+        pending = queryset.exclude(status=status)
+        deltas = application_stats.get_status_deltas(pending, status)
+        rows = list(
+            pending.order_by('-created_at')
+            .values_list('uuid', 'name', 'phone', 'status')[:RESULT_ROWS_LIMIT]
+        )
+        updated = pending.update(status=status, updated_at=timezone.now())
+        application_stats.apply_deltas(deltas)
+
+    result.rows = [
+        RowResult(
+            pk=str(pk),
+            label=f'{name} - {phone}',
+            ok=True,
+            detail=f'{_STATUS_LABELS.get(old_status, old_status)} → {label}',
+        )
+        for pk, name, phone, old_status in rows
+    ]
+    result.succeeded = updated
+    result.skipped = total - updated
+    logger.info(f'Статус «{label}» установлен у заявок: {updated}, уже в этом статусе: {result.skipped}')
+    return result
+
+
+def resend(queryset: QuerySet) -> BulkResult:
+    """
+    Повторная отправка в Telegram заявок, которые не были доставлены.
+
+    Args:
+        queryset: Выбранные заявки (уже отправленные пропускаются)
+
+    Returns:
+        BulkResult: Итоги и результат отправки по каждой заявке
+    """
+    result = BulkResult(title='Повторная отправка в Telegram')
+    queryset = queryset.order_by()
+    pks = list(queryset.filter(is_sent_to_telegram=False).order_by('created_at').values_list('uuid', flat=True))
+    result.skipped = queryset.filter(is_sent_to_telegram=True).count()
+    if result.skipped:
+        result.notes.append(f'Уже отправлены ранее: {result.skipped}')
+    if not pks:
+        return result
+
+    deadline = time.monotonic() + RESEND_TIME_LIMIT
+    with ThreadPoolExecutor(max_workers=RESEND_WORKERS, thread_name_prefix='application-resend') as executor:
+        for start in range(0, len(pks), RESEND_BATCH_SIZE):
+            if time.monotonic() > deadline:
+                left = len(pks) - start
+                result.skipped += left
+                result.notes.append(
+                    f'Не отправлено из-за ограничения времени: {left}. Запустите действие еще раз.'
+                )
+                break
+            batch = Application.objects.in_bulk(pks[start:start + RESEND_BATCH_SIZE])
+            applications = list(batch.values())
+            errors = list(executor.map(_deliver, applications))
+            with transaction.atomic():
+                for application, error in zip(applications, errors):
+                    record_delivery(application, error)
+            for application, error in zip(applications, errors):
+                result.add(RowResult(
+                    pk=str(application.pk),
+                    label=f'{application.name} - {application.phone}',
+                    ok=error is None,
+                    detail='Отправлено' if error is None else error,
+                ))
+            logger.info(
+                f'Повторная отправка заявок: обработано {result.succeeded + result.failed} из {len(pks)}, '
+                f'ошибок {result.failed}'
+            )
+    return result
+
+
+def _deliver(application: Application):
+    """
+    Отправка одной заявки в потоке пула.
+    """
+    try:
+        return deliver(application)
+    finally:
+        # Пул живет только на время действия - соединение потока не переиспользуется
+        connection.close()
@@ -0,0 +1,66 @@
+"""
+Перенос старых закрытых заявок в архив.
+
+Заявки в статусе «Обработана» или «Отклонена» старше
+APPLICATION_ARCHIVE_DAYS дней переносятся в ArchivedApplication. Каждая
+пачка копируется и удаляется из рабочей таблицы в одной транзакции,
+поэтому прерванный перенос не теряет и не дублирует заявки, а запись
+в БД блокируется только на время одной пачки.
+"""
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import Application, ArchivedApplication
+
+
+ARCHIVABLE_STATUSES = (Application.Status.PROCESSED, Application.Status.REJECTED)
+
+# Поля, копируемые в архив
+ARCHIVED_FIELDS = (
+    'uuid', 'name', 'phone', 'phone_normalized', 'message', 'status',
+    'is_sent_to_telegram', 'telegram_error', 'created_at', 'updated_at',
+)
+
+
+def archive_applications(days: Optional[int] = None, batch_size: int = 1000) -> int:
+    """
+    Перенос закрытых заявок старше заданного срока в архив.
+
+    Args:
+        days: Возраст заявки в днях (по умолчанию APPLICATION_ARCHIVE_DAYS)
+        batch_size: Количество заявок в одной транзакции
+
+    Returns:
+        int: Количество перенесенных заявок
+    """
+    if days is None:
+        days = getattr(settings, 'APPLICATION_ARCHIVE_DAYS', 180)
+    cutoff = timezone.now() - timedelta(days=days)
+    queryset = (
+        Application.objects.filter(status__in=ARCHIVABLE_STATUSES, created_at__lt=cutoff)
+        .order_by('created_at')
+        .values(*ARCHIVED_FIELDS)
+    )
+
+    total = 0
+    while True:
+        with transaction.atomic():
+            rows = list(queryset[:batch_size])
+            if not rows:
+                break
+            # Заявка, уже скопированная прерванным ранее переносом, не дублируется
+            ArchivedApplication.objects.bulk_create(
+                [ArchivedApplication(**row) for row in rows],
+                ignore_conflicts=True,
+            )
+            Application.objects.filter(uuid__in=[row['uuid'] for row in rows]).delete()
+        total += len(rows)
+
+    if total:
+        logger.info(f'В архив перенесено заявок: {total} (старше {days} дней)')
+    return total
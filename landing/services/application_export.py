@@ -0,0 +1,261 @@
+"""
+Потоковая выгрузка заявок в CSV и XLSX.
+
+Строки читаются из БД через QuerySet.iterator() пачками по
+ITERATOR_CHUNK_SIZE (на PostgreSQL - серверным курсором) и сразу
+отдаются клиенту частями StreamingHttpResponse, поэтому память воркера
+не зависит от количества заявок.
+
+XLSX собирается без сторонних библиотек: zipfile пишет архив в
+буфер без seek (с data descriptor после каждого файла), лист
+записывается строка за строкой с inline-строками, готовые байты
+забираются из буфера после каждой пачки строк.
+
+Значения CSV, которые Excel принял бы за формулу (начинаются с =, +, -,
+@, табуляции или перевода строки), экранируются апострофом. Числа
+и телефоны (+79991234567, -5) остаются как есть: из цифр формулу
+со ссылками или функциями не составить. Inline-строки XLSX формулами
+не считаются.
+"""
+import csv
+import re
+import zipfile
+from typing import IO, Iterable, Iterator, List
+from xml.sax.saxutils import escape
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from landing.models import Application
+
+
+# Колонки выгрузки: заголовок и поле модели
+COLUMNS = (
+    ('Дата', 'created_at'),
+    ('Имя', 'name'),
+    ('Телефон', 'phone'),
+    ('Телефон (E.164)', 'phone_normalized'),
+    ('Статус', 'status'),
+    ('Сообщение', 'message'),
+    ('Отправлено в Telegram', 'is_sent_to_telegram'),
+)
+
+ITERATOR_CHUNK_SIZE = 2000
+# Количество строк, отдаваемых клиенту одной частью
+ROWS_PER_CHUNK = 500
+
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+_STATUS_LABELS = dict(Application.Status.choices)
+
+# Символы, недопустимые в XML 1.0
+_XML_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Первые символы, с которых табличные редакторы начинают формулу
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# Число или телефон со знаком: цифры, пробелы, скобки, дефисы
+_PLAIN_NUMBER = re.compile(r'^[+-][\d ().-]*\d[\d ().-]*$')
+
+
+def export_response(queryset: QuerySet, file_format: str) -> StreamingHttpResponse:
+    """
+    Ответ с потоковой выгрузкой заявок.
+
+    Args:
+        queryset: Заявки для выгрузки
+        file_format: 'csv' или 'xlsx'
+
+    Returns:
+        StreamingHttpResponse: Файл выгрузки
+    """
+    chunks = stream_csv(queryset) if file_format == 'csv' else stream_xlsx(queryset)
+    response = StreamingHttpResponse(chunks, content_type=FORMATS[file_format])
+    filename = f'applications-{timezone.localdate():%Y-%m-%d}.{file_format}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def write_export(queryset: QuerySet, file_format: str, stream: IO[bytes]) -> int:
+    """
+    Запись выгрузки в бинарный поток (файл).
+
+    Returns:
+        int: Количество записанных байт
+    """
+    chunks = stream_csv(queryset) if file_format == 'csv' else stream_xlsx(queryset)
+    size = 0
+    for chunk in chunks:
+        stream.write(chunk)
+        size += len(chunk)
+    return size
+
+
+def iter_rows(queryset: QuerySet) -> Iterator[List[str]]:
+    """
+    Строки выгрузки в виде текстовых значений колонок.
+
+    Args:
+        queryset: Заявки
+
+    Yields:
+        list: Значения колонок COLUMNS
+    """
+    fields = [name for _, name in COLUMNS]
+    rows = queryset.order_by('-created_at').values_list(*fields).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+    for row in rows:
+        values = dict(zip(fields, row))
+        yield [
+            f'{timezone.localtime(values["created_at"]):%d.%m.%Y %H:%M}',
+            values['name'],
+            values['phone'],
+            values['phone_normalized'] or '',
+            _STATUS_LABELS.get(values['status'], values['status']),
+            values['message'] or '',
+            'Да' if values['is_sent_to_telegram'] else 'Нет',
+        ]
+
+
+def stream_csv(queryset: QuerySet) -> Iterator[bytes]:
+    """
+    CSV (UTF-8 с BOM и разделителем «;» - открывается в Excel без импорта).
+
+    Yields:
+        bytes: Части файла
+    """
+    buffer = _StreamBuffer()
+    text = _TextAdapter(buffer)
+    writer = csv.writer(text, delimiter=';')
+    buffer.write('\ufeff'.encode('utf-8'))
+    writer.writerow(header for header, _ in COLUMNS)
+    for rows in _batched(iter_rows(queryset), ROWS_PER_CHUNK):
+        writer.writerows([_csv_cell(value) for value in row] for row in rows)
+        yield buffer.pop()
+    yield buffer.pop()
+
+
+def stream_xlsx(queryset: QuerySet) -> Iterator[bytes]:
+    """
+    XLSX (один лист, значения - строки).
+
+    Yields:
+        bytes: Части файла
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        yield buffer.pop()
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(_SHEET_HEADER + _xlsx_row(header for header, _ in COLUMNS))
+            for rows in _batched(iter_rows(queryset), ROWS_PER_CHUNK):
+                sheet.write(b''.join(_xlsx_row(row) for row in rows))
+                yield buffer.pop()
+            sheet.write(_SHEET_FOOTER)
+    yield buffer.pop()
+
+
+class _StreamBuffer:
+    """
+    Бинарный буфер без seek, из которого забираются записанные байты.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _TextAdapter:
+    """
+    Текстовый интерфейс над _StreamBuffer для csv.writer.
+    """
+
+    def __init__(self, buffer: _StreamBuffer):
+        self._buffer = buffer
+
+    def write(self, text: str) -> int:
+        return self._buffer.write(text.encode('utf-8'))
+
+
+def _batched(rows: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_cell(value: str) -> str:
+    if value.startswith(_FORMULA_PREFIXES) and not _PLAIN_NUMBER.match(value):
+        return f"'{value}"
+    return value
+
+
+def _xlsx_row(values: Iterable[str]) -> bytes:
+    cells = ''.join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_XML_ILLEGAL.sub("", value))}</t></is></c>'
+        for value in values
+    )
+    return f'<row>{cells}</row>'.encode('utf-8')
+
+
+_SHEET_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_FOOTER = b'</sheetData></worksheet>'
+
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Заявки" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
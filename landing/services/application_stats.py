@@ -0,0 +1,225 @@
+"""
+Дневная сводка по заявкам для страницы статистики в админке.
+
+Сводка (ApplicationDailyStats) ведется инкрементально: при сохранении
+заявки сигнал сравнивает ее вклад в сводку до и после сохранения
+(день создания, статус, результат отправки в Telegram) и прибавляет
+разницу к строке дня через F(). Страница статистики читает по строке
+на день, поэтому время ее построения не зависит от числа заявок.
+
+Сводка считает полученные заявки: удаление заявки (в том числе перенос
+в архив) значения не уменьшает. Массовые изменения через QuerySet.update()
+сигналов не вызывают и должны передавать изменения в apply_deltas()
+(см. get_status_deltas).
+Для заполнения сводки по старым заявкам и после ручных правок в БД -
+rebuild() (команда rebuild_application_stats).
+"""
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+from landing.models import Application, ApplicationDailyStats, ArchivedApplication
+
+
+# Вклад заявки в сводку: (день создания, статус, отправлена, ошибка отправки)
+State = Tuple[date, str, bool, bool]
+
+# Поля заявки, от которых зависит ее вклад в сводку
+TRACKED_FIELDS = ('created_at', 'status', 'is_sent_to_telegram', 'telegram_error')
+
+# Периоды страницы статистики, дней
+PERIODS = (7, 30, 90, 365)
+DEFAULT_PERIOD = 30
+
+_FAILED = Q(is_sent_to_telegram=False, telegram_error__isnull=False) & ~Q(telegram_error='')
+
+
+def get_state(application: Application) -> Optional[State]:
+    """
+    Вклад заявки в сводку.
+
+    Returns:
+        tuple | None: Состояние или None, если заявка загружена без нужных полей
+    """
+    if application.created_at is None or application.get_deferred_fields() & set(TRACKED_FIELDS):
+        return None
+    sent = bool(application.is_sent_to_telegram)
+    return (
+        timezone.localdate(application.created_at),
+        application.status,
+        sent,
+        bool(application.telegram_error) and not sent,
+    )
+
+
+def load_state(pk) -> Optional[State]:
+    """
+    Вклад заявки в сводку по данным из БД.
+    """
+    application = Application.objects.filter(pk=pk).only(*TRACKED_FIELDS).first()
+    return get_state(application) if application is not None else None
+
+
+def record_change(old: Optional[State], new: Optional[State]):
+    """
+    Учет изменения заявки в сводке.
+
+    Args:
+        old: Состояние до сохранения (None - новая заявка)
+        new: Состояние после сохранения
+    """
+    deltas: Dict[date, Counter] = defaultdict(Counter)
+    if old is not None:
+        deltas[old[0]].subtract(_contribution(old))
+    if new is not None:
+        deltas[new[0]].update(_contribution(new))
+    apply_deltas(deltas)
+
+
+def get_status_deltas(queryset: QuerySet, status: str) -> Dict[date, Counter]:
+    """
+    Изменения сводки при смене статуса заявок (считать до UPDATE в той же транзакции).
+
+    Args:
+        queryset: Заявки, статус которых меняется
+        status: Новый статус
+
+    Returns:
+        dict: Изменения полей сводки по дням для apply_deltas()
+    """
+    rows = (
+        queryset.exclude(status=status)
+        .annotate(day=TruncDate('created_at'))
+        .order_by()
+        .values('day', 'status')
+        .annotate(count=Count('uuid'))
+    )
+    deltas: Dict[date, Counter] = defaultdict(Counter)
+    for row in rows:
+        deltas[row['day']][row['status']] -= row['count']
+        deltas[row['day']][status] += row['count']
+    return deltas
+
+
+def apply_deltas(deltas: Dict[date, Counter]):
+    """
+    Прибавление изменений к строкам сводки (строка дня создается при необходимости).
+
+    Значения не опускаются ниже нуля: до первого rebuild() в сводке нет
+    заявок, созданных раньше ее появления.
+
+    Args:
+        deltas: Изменения полей сводки по дням
+    """
+    with transaction.atomic():
+        for day, changes in deltas.items():
+            changes = {field: value for field, value in changes.items() if value}
+            if not changes:
+                continue
+            ApplicationDailyStats.objects.get_or_create(date=day)
+            ApplicationDailyStats.objects.filter(date=day).update(
+                **{field: Greatest(F(field) + value, 0) for field, value in changes.items()}
+            )
+
+
+def rebuild(days: Optional[int] = None) -> int:
+    """
+    Пересчет сводки по заявкам, включая архив.
+
+    Args:
+        days: Пересчитать последние N дней, включая сегодня (по умолчанию все)
+
+    Returns:
+        int: Количество строк сводки
+    """
+    since = timezone.localdate() - timedelta(days=days - 1) if days else None
+    totals: Dict[date, Counter] = defaultdict(Counter)
+    for model in (Application, ArchivedApplication):
+        queryset = model.objects.annotate(day=TruncDate('created_at'))
+        if since is not None:
+            queryset = queryset.filter(day__gte=since)
+        rows = queryset.order_by().values('day', 'status').annotate(
+            count=Count('uuid'),
+            sent=Count('uuid', filter=Q(is_sent_to_telegram=True)),
+            failed=Count('uuid', filter=_FAILED),
+        )
+        for row in rows:
+            day = totals[row['day']]
+            day['received'] += row['count']
+            day[row['status']] += row['count']
+            day['sent_to_telegram'] += row['sent']
+            day['delivery_failed'] += row['failed']
+
+    fields = _stats_fields()
+    with transaction.atomic():
+        stale = ApplicationDailyStats.objects.all()
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        ApplicationDailyStats.objects.bulk_create([
+            ApplicationDailyStats(date=day, **{field: values[field] for field in fields})
+            for day, values in sorted(totals.items())
+        ])
+    return len(totals)
+
+
+def get_dashboard(days: int = DEFAULT_PERIOD) -> dict:
+    """
+    Данные страницы статистики за последние N дней (только из сводки).
+
+    Args:
+        days: Период в днях, включая сегодня
+
+    Returns:
+        dict: Строки по дням (дни без заявок - нулевые), итоги и масштаб графика
+    """
+    today = timezone.localdate()
+    since = today - timedelta(days=days - 1)
+    fields = _stats_fields()
+    stored = {
+        row['date']: row
+        for row in ApplicationDailyStats.objects.filter(date__gte=since).values('date', *fields)
+    }
+
+    rows = []
+    totals = Counter()
+    for offset in range(days):
+        day = since + timedelta(days=offset)
+        row = stored.get(day) or dict.fromkeys(fields, 0)
+        totals.update({field: row[field] for field in fields})
+        rows.append({'date': day, **{field: row[field] for field in fields}})
+
+    scale = max((row['received'] for row in rows), default=0) or 1
+    for row in rows:
+        row['delivery_rate'] = _rate(row['sent_to_telegram'], row['received'])
+        # Высота столбцов графика, % от максимума за период
+        row['bars'] = [
+            (status, label, row[status] * 100 / scale)
+            for status, label in Application.Status.choices
+            if row[status]
+        ]
+    return {
+        'days': days,
+        'rows': rows,
+        'totals': {field: totals[field] for field in fields},
+        'delivery_rate': _rate(totals['sent_to_telegram'], totals['received']),
+        'scale': scale,
+    }
+
+
+def _contribution(state: State) -> Dict[str, int]:
+    _, status, sent, failed = state
+    return {'received': 1, status: 1, 'sent_to_telegram': int(sent), 'delivery_failed': int(failed)}
+
+
+def _stats_fields():
+    return [field.name for field in ApplicationDailyStats._meta.concrete_fields if field.name not in ('id', 'date')]
+
+
+def _rate(part: int, total: int) -> float:
+    return round(part * 100 / total, 1) if total else 0.0
@@ -0,0 +1,323 @@
+"""
+Прием заявок с формы на главной странице.
+
+Общий код для обычной отправки формы (LandingView.post) и JSON-эндпоинта
+(ApplicationSubmitView):
+
+- accept() проверяет заявку (spam_guard, обязательные поля, повтор
+  по ключу идемпотентности) и создает Application;
+- notify() отправляет заявку в Telegram (с числом прошлых заявок
+  клиента, deliver()) и запоминает результат (record_delivery());
+- notify_async() ставит отправку в очередь потоков процесса, чтобы
+  JSON-эндпоинт отвечал 202 сразу после записи заявки. Очередь
+  дожидается завершения отправок при остановке воркера (см. shutdown()
+  и gunicorn_config.py).
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.contrib import messages
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Count, Max
+from django.db.utils import OperationalError, ProgrammingError
+from django.utils import timezone
+from django.utils.dateformat import format as format_date
+from loguru import logger
+
+from landing.models import Application, ArchivedApplication
+from landing.services import counters, idempotency, spam_guard
+from landing.services.telegram import TelegramService
+
+
+SUCCESS_MESSAGE = 'Спасибо! Ваша заявка успешно отправлена. Мы свяжемся с вами в ближайшее время.'
+SAVED_MESSAGE = 'Заявка сохранена, но произошла ошибка при отправке уведомления. Мы обработаем вашу заявку вручную.'
+REQUIRED_MESSAGE = 'Пожалуйста, заполните все обязательные поля.'
+ERROR_MESSAGE = 'Произошла ошибка при отправке заявки. Попробуйте позже.'
+NOT_READY_MESSAGE = 'Сервер не готов: база данных не инициализирована. Обратитесь к администратору.'
+RATE_LIMIT_MESSAGE = 'Слишком много заявок. Попробуйте позже или позвоните нам.'
+TOO_FAST_MESSAGE = 'Форма отправлена слишком быстро. Проверьте данные и отправьте заявку еще раз через несколько секунд.'
+
+# Отказы spam_guard: сообщение и HTTP-статус для JSON-ответа (кроме «тихих» отказов для ботов)
+REJECTIONS = {
+    spam_guard.EXPIRED_TOKEN: ('Форма устарела. Обновите страницу и отправьте заявку еще раз.', 400),
+    spam_guard.TOO_FAST: (TOO_FAST_MESSAGE, 429),
+    spam_guard.BAD_PHONE: ('Проверьте номер телефона: нужно 10-15 цифр.', 400),
+    spam_guard.IP_LIMIT: (RATE_LIMIT_MESSAGE, 429),
+    spam_guard.GLOBAL_LIMIT: (RATE_LIMIT_MESSAGE, 429),
+}
+
+# Потоки отправки уведомлений на процесс
+NOTIFY_WORKERS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+class SubmissionRejected(Exception):
+    """
+    Заявка не принята.
+
+    Attributes:
+        message: Текст для посетителя
+        level: Уровень сообщения django.contrib.messages
+        status: HTTP-статус для JSON-ответа
+    """
+
+    def __init__(self, message: str, level: int = messages.ERROR, status: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.level = level
+        self.status = status
+
+
+@dataclass
+class Submission:
+    """
+    Принятая отправка формы.
+
+    Attributes:
+        application: Новая заявка (None для повтора)
+        key: Ключ идемпотентности
+        replayed: Результат исходной отправки, если это повтор (idempotency.SENT / SAVED)
+    """
+    application: Optional[Application]
+    key: Optional[str]
+    replayed: Optional[str] = None
+
+
+def accept(request) -> Submission:
+    """
+    Проверка и запись заявки.
+
+    Args:
+        request: POST-запрос формы заявки
+
+    Returns:
+        Submission: Новая заявка или повтор ранее принятой
+
+    Raises:
+        SubmissionRejected: Если заявка не принята
+    """
+    rejection = spam_guard.check_submission(request)
+    if rejection is not None:
+        logger.debug(f'Заявка отклонена: {rejection}')
+        if rejection not in REJECTIONS:
+            # Бот получает обычный ответ об успехе
+            raise SubmissionRejected(SUCCESS_MESSAGE, level=messages.SUCCESS, status=202)
+        message, status = REJECTIONS[rejection]
+        raise SubmissionRejected(message, status=status)
+
+    name = request.POST.get('name', '').strip()
+    phone = request.POST.get('phone', '').strip()
+    message = request.POST.get('message', '').strip()
+
+    # Валидация обязательных полей
+    if not name or not phone:
+        raise SubmissionRejected(REQUIRED_MESSAGE)
+
+    # Повтор той же отправки (двойной клик, обновление после POST)
+    key = idempotency.get_key(request.POST.get(spam_guard.TOKEN_FIELD, ''), phone)
+    replayed = idempotency.get_result(key) if key else None
+    if replayed is not None:
+        logger.info('Повторная отправка формы заявки, новая заявка не создана')
+        return Submission(application=None, key=key, replayed=replayed)
+
+    try:
+        with transaction.atomic():
+            application = Application.objects.create(
+                name=name,
+                phone=phone,
+                message=message if message else None,
+                idempotency_key=key,
+            )
+    except IntegrityError as e:
+        # Повтор пришел, пока первая отправка еще обрабатывается
+        original = Application.objects.filter(idempotency_key=key).only('telegram_error').first() if key else None
+        if original is None:
+            logger.error(f'Ошибка создания заявки: {e}')
+            raise SubmissionRejected(ERROR_MESSAGE, status=500)
+        logger.info('Повторная отправка формы заявки, новая заявка не создана')
+        return Submission(
+            application=None,
+            key=key,
+            replayed=idempotency.SAVED if original.telegram_error else idempotency.SENT,
+        )
+    except (OperationalError, ProgrammingError) as e:
+        logger.error(
+            "Заявка не сохранена: база данных не инициализирована (нет таблиц). "
+            "Выполните миграции: python manage.py migrate. Причина: {error}",
+            error=str(e),
+        )
+        raise SubmissionRejected(NOT_READY_MESSAGE, status=503)
+    except Exception as e:
+        logger.error(f'Ошибка создания заявки: {e}')
+        raise SubmissionRejected(ERROR_MESSAGE, status=500)
+
+    logger.info(f'Создана новая заявка: {application}')
+    counters.increment(counters.FORM_SUBMIT, counters.clean_section(request.POST.get('source', '')))
+    return Submission(application=application, key=key)
+
+
+def notify(application: Application, key: Optional[str] = None) -> str:
+    """
+    Отправка заявки в Telegram с отметкой результата в заявке.
+
+    Args:
+        application: Новая заявка
+        key: Ключ идемпотентности отправки
+
+    Returns:
+        str: idempotency.SENT или idempotency.SAVED (уведомление не отправлено)
+    """
+    error = deliver(application)
+    try:
+        record_delivery(application, error)
+    except Exception as e:
+        logger.error(f'Не удалось сохранить результат отправки заявки {application}: {e}')
+    outcome = idempotency.SENT if error is None else idempotency.SAVED
+
+    if key:
+        idempotency.store_result(key, outcome)
+    return outcome
+
+
+def deliver(application: Application) -> Optional[str]:
+    """
+    Отправка заявки в Telegram без записи результата в БД.
+
+    Args:
+        application: Заявка
+
+    Returns:
+        str | None: Текст ошибки или None, если заявка отправлена
+    """
+    try:
+        telegram_service = TelegramService()
+        result = telegram_service.send_application(
+            application.name,
+            application.phone,
+            application.message or '',
+            history=describe_previous(*get_previous(application)),
+        )
+    except Exception as e:
+        logger.error(f'Критическая ошибка отправки заявки {application} в Telegram: {e}')
+        return str(e)
+
+    if result.get('ok') or result.get('sent_count', 0) > 0:
+        logger.info(f'Заявка {application} успешно отправлена в Telegram. Отправлено: {result.get("sent_count", 0)}')
+        return None
+    error_msg = result.get('error', 'Неизвестная ошибка')
+    logger.warning(f'Ошибка отправки заявки {application} в Telegram: {error_msg}')
+    return error_msg
+
+
+def record_delivery(application: Application, error: Optional[str]):
+    """
+    Отметка результата отправки в заявке.
+
+    Args:
+        application: Заявка
+        error: Текст ошибки или None, если заявка отправлена
+    """
+    if error is None:
+        application.is_sent_to_telegram = True
+        # Ошибка прошлой попытки (при повторной отправке) больше не актуальна
+        application.telegram_error = None
+        update_fields = ['is_sent_to_telegram', 'telegram_error']
+    else:
+        application.telegram_error = error
+        update_fields = ['telegram_error']
+    # Вместе с дневной статистикой заявок (сигнал post_save)
+    with transaction.atomic():
+        application.save(update_fields=update_fields)
+
+
+def get_previous(application: Application) -> Tuple[int, Optional[datetime]]:
+    """
+    Прошлые заявки с тем же телефоном, включая архив (поиск по индексам телефона).
+
+    Args:
+        application: Заявка
+
+    Returns:
+        tuple: (количество прошлых заявок, дата последней из них)
+    """
+    if not application.phone_normalized:
+        return 0, None
+    count, last = 0, None
+    for model in (Application, ArchivedApplication):
+        stats = model.objects.filter(
+            phone_normalized=application.phone_normalized,
+            created_at__lt=application.created_at,
+        ).aggregate(count=Count('uuid'), last=Max('created_at'))
+        count += stats['count']
+        if stats['last'] is not None and (last is None or stats['last'] > last):
+            last = stats['last']
+    return count, last
+
+
+def describe_previous(count: int, last: Optional[datetime]) -> str:
+    """
+    Текст о прошлых заявках клиента.
+
+    Returns:
+        str: Например «2 предыдущие заявки, последняя 12.10.2026» или пустая строка
+    """
+    if not count:
+        return ''
+    if count % 10 == 1 and count % 100 != 11:
+        noun = 'предыдущая заявка'
+    elif 2 <= count % 10 <= 4 and not 12 <= count % 100 <= 14:
+        noun = 'предыдущие заявки'
+    else:
+        noun = 'предыдущих заявок'
+    return f'{count} {noun}, последняя {format_date(timezone.localtime(last), "d.m.Y")}'
+
+
+def notify_async(application: Application, key: Optional[str] = None):
+    """
+    Отправка заявки в Telegram в фоновом потоке процесса.
+
+    Args:
+        application: Новая заявка
+        key: Ключ идемпотентности отправки
+    """
+    _get_executor().submit(_notify_in_thread, application, key)
+
+
+def shutdown():
+    """
+    Ожидание отправки поставленных в очередь уведомлений (остановка воркера).
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None and _executor_pid == os.getpid():
+        executor.shutdown(wait=True)
+
+
+def _notify_in_thread(application: Application, key: Optional[str]):
+    try:
+        notify(application, key)
+    except Exception as e:
+        logger.error(f'Ошибка фоновой отправки заявки {application}: {e}')
+    finally:
+        close_old_connections()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Пул потоков текущего процесса (после fork пул родителя не работает).
+    """
+    global _executor, _executor_pid
+    pid = os.getpid()
+    with _executor_lock:
+        if _executor is None or _executor_pid != pid:
+            _executor = ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix='application-notify')
+            _executor_pid = pid
+        return _executor
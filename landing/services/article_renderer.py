@@ -0,0 +1,108 @@
+"""
+Рендеринг текста статьи в HTML при сохранении.
+
+Помимо HTML вычисляются время чтения и оглавление (якоря заголовков),
+чтобы страница статьи не делала эту работу на каждый запрос.
+"""
+import re
+from dataclasses import dataclass, field
+from html import unescape
+from typing import Dict, List
+
+from django.utils.html import linebreaks, strip_tags
+from django.utils.text import slugify
+from loguru import logger
+
+try:
+    import markdown
+    import nh3
+except ImportError:
+    markdown = None  # Markdown/nh3 не установлены, доступен только обычный текст
+    nh3 = None
+
+
+# Скорость чтения русского текста (слов в минуту)
+WORDS_PER_MINUTE = 180
+
+# Теги и атрибуты, разрешенные в HTML из Markdown
+ALLOWED_TAGS = {
+    'p', 'br', 'hr', 'h2', 'h3', 'h4', 'strong', 'em', 'b', 'i', 'u', 's',
+    'ul', 'ol', 'li', 'blockquote', 'code', 'pre', 'a', 'img',
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'th': {'align'},
+    'td': {'align'},
+}
+
+_HEADING_RE = re.compile(r'<h([23])>(.*?)</h\1>', re.S)
+_WORD_RE = re.compile(r'\w+', re.U)
+
+
+@dataclass
+class RenderedArticle:
+    """
+    Результат рендеринга статьи.
+    """
+    html: str
+    reading_time: int
+    toc: List[Dict] = field(default_factory=list)
+
+
+def render_article(content: str, content_format: str = 'text') -> RenderedArticle:
+    """
+    Рендеринг текста статьи.
+
+    Args:
+        content: Исходный текст статьи
+        content_format: Формат текста: 'text' (абзацы по переносам строк) или 'markdown'
+
+    Returns:
+        RenderedArticle: HTML, время чтения в минутах и оглавление
+    """
+    content = content or ''
+    if content_format == 'markdown' and markdown is not None:
+        html = markdown.markdown(content, extensions=['extra', 'sane_lists'], output_format='html')
+        html = nh3.clean(
+            html,
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            link_rel='noopener noreferrer',
+        )
+    else:
+        if content_format == 'markdown':
+            logger.warning('Markdown или nh3 не установлены, статья отрендерена как обычный текст')
+        # То же, что фильтр |linebreaks с автоэкранированием
+        html = linebreaks(content, autoescape=True)
+
+    html, toc = _add_heading_anchors(html)
+    words = len(_WORD_RE.findall(unescape(strip_tags(html))))
+    reading_time = max(1, round(words / WORDS_PER_MINUTE))
+    return RenderedArticle(html=html, reading_time=reading_time, toc=toc)
+
+
+def _add_heading_anchors(html: str):
+    """
+    Добавление id заголовкам h2/h3 и сборка оглавления.
+
+    Returns:
+        tuple: (HTML с якорями, список пунктов оглавления)
+    """
+    toc = []
+    used = set()
+
+    def replace(match):
+        level, inner = match.group(1), match.group(2)
+        title = unescape(strip_tags(inner)).strip()
+        anchor = base = slugify(title, allow_unicode=True) or 'section'
+        suffix = 2
+        while anchor in used:
+            anchor = f'{base}-{suffix}'
+            suffix += 1
+        used.add(anchor)
+        toc.append({'level': int(level), 'title': title, 'anchor': anchor})
+        return f'<h{level} id="{anchor}">{inner}</h{level}>'
+
+    return _HEADING_RE.sub(replace, html), toc
@@ -0,0 +1,223 @@
+"""
+Буферизованные счетчики просмотров и заявок.
+
+Запрос не пишет в БД: increment() только увеличивает значение в словаре
+памяти процесса. Фоновый поток раз в COUNTERS_FLUSH_INTERVAL секунд
+записывает накопленные суммы одним пакетным upsert
+(INSERT ... ON CONFLICT DO UPDATE SET value = value + excluded.value),
+поэтому на SQLite на одну запись приходится не один запрос, а сотни.
+При остановке воркера остаток буфера записывается из хука worker_exit
+Gunicorn (см. gunicorn_config.py) и через atexit.
+
+Чтение (get_totals, get_conversion_rates) идет из таблицы DailyCounter
+и не влияет на обработку запросов. Значения отстают от реальных
+не больше чем на интервал сброса.
+"""
+import atexit
+import os
+import threading
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import DailyCounter
+
+
+# Виды счетчиков
+PAGE_VIEW = 'page_view'
+ARTICLE_VIEW = 'article_view'
+FORM_SUBMIT = 'form_submit'
+FORM_REJECTED = 'form_rejected'
+
+# Разделы лендинга, из которых посетитель переходит к форме заявки
+LANDING_SECTIONS = ('header', 'hero', 'about', 'team', 'services', 'objects', 'articles', 'contact-form', 'footer')
+DEFAULT_SECTION = 'contact-form'
+
+_buffer: Dict[Tuple[str, str, date], int] = defaultdict(int)
+_lock = threading.Lock()
+_flusher: Optional['CounterFlusher'] = None
+_flusher_pid: Optional[int] = None
+
+
+def increment(name: str, key: str, amount: int = 1):
+    """
+    Увеличение счетчика в буфере процесса.
+
+    Args:
+        name: Вид счетчика (PAGE_VIEW, ARTICLE_VIEW, FORM_SUBMIT, FORM_REJECTED)
+        key: Ключ внутри вида (slug статьи, имя страницы, раздел)
+        amount: Величина увеличения
+    """
+    interval = getattr(settings, 'COUNTERS_FLUSH_INTERVAL', 10)
+    with _lock:
+        _buffer[(name, key[:200], timezone.localdate())] += amount
+    if interval <= 0:
+        # Буферизация отключена (например, при отладке) - пишем сразу
+        flush()
+    else:
+        _ensure_flusher(interval)
+
+
+def flush() -> int:
+    """
+    Запись накопленных значений в БД.
+
+    При ошибке записи значения возвращаются в буфер и будут записаны
+    при следующем сбросе.
+
+    Returns:
+        int: Количество записанных строк счетчиков
+    """
+    global _buffer
+    with _lock:
+        if not _buffer:
+            return 0
+        pending, _buffer = _buffer, defaultdict(int)
+
+    try:
+        _upsert(pending)
+    except Exception as e:
+        logger.error(f'Не удалось записать счетчики ({len(pending)} строк): {e}')
+        with _lock:
+            for counter_key, amount in pending.items():
+                _buffer[counter_key] += amount
+        return 0
+    return len(pending)
+
+
+def get_totals(name: str, keys: Optional[Iterable[str]] = None, days: Optional[int] = None) -> Dict[str, int]:
+    """
+    Суммы счетчика по ключам.
+
+    Args:
+        name: Вид счетчика
+        keys: Ограничить ключами (по умолчанию все)
+        days: Учитывать последние N дней, включая сегодня (по умолчанию за все время)
+
+    Returns:
+        dict: Сумма по ключу
+    """
+    queryset = DailyCounter.objects.filter(name=name)
+    if keys is not None:
+        queryset = queryset.filter(key__in=list(keys))
+    if days is not None:
+        queryset = queryset.filter(date__gt=timezone.localdate() - timedelta(days=days))
+    rows = queryset.values('key').annotate(total=Sum('value')).order_by()
+    return {row['key']: row['total'] for row in rows}
+
+
+def get_conversion_rates(days: Optional[int] = None) -> List[dict]:
+    """
+    Конверсия главной страницы в заявки по разделам лендинга.
+
+    Раздел - место, откуда посетитель перешел к форме (кнопка
+    «Получить консультацию» в первом экране, карточка услуги и т.д.).
+
+    Args:
+        days: Учитывать последние N дней (по умолчанию за все время)
+
+    Returns:
+        list: Словари с разделом, числом заявок и долей от просмотров главной (%)
+    """
+    views = get_totals(PAGE_VIEW, keys=['landing:index'], days=days).get('landing:index', 0)
+    submissions = get_totals(FORM_SUBMIT, days=days)
+    return [
+        {
+            'section': section,
+            'submissions': count,
+            'rate': round(count * 100 / views, 2) if views else 0.0,
+        }
+        for section, count in sorted(submissions.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+
+def rename_key(name: str, old_key: str, new_key: str):
+    """
+    Перенос значений на новый ключ (например, при смене slug статьи).
+    """
+    flush()
+    with transaction.atomic():
+        for row in DailyCounter.objects.filter(name=name, key=old_key):
+            updated = DailyCounter.objects.filter(name=name, key=new_key, date=row.date).update(
+                value=F('value') + row.value
+            )
+            if updated:
+                row.delete()
+            else:
+                row.key = new_key
+                row.save(update_fields=['key'])
+
+
+def clean_section(value: str) -> str:
+    """
+    Раздел лендинга из поля формы (неизвестные значения не попадают в БД).
+    """
+    return value if value in LANDING_SECTIONS else DEFAULT_SECTION
+
+
+class CounterFlusher(threading.Thread):
+    """
+    Фоновый поток периодического сброса буфера счетчиков.
+    """
+
+    def __init__(self, interval: int):
+        super().__init__(name='counter-flusher', daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            flush()
+            # Соединение потока не должно пережить CONN_MAX_AGE
+            close_old_connections()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _ensure_flusher(interval: int):
+    """
+    Запуск потока сброса в текущем процессе (после fork потоки родителя не наследуются).
+    """
+    global _flusher, _flusher_pid
+    pid = os.getpid()
+    if _flusher_pid == pid:
+        return
+    with _lock:
+        if _flusher_pid == pid:
+            return
+        _flusher = CounterFlusher(interval)
+        _flusher.start()
+        _flusher_pid = pid
+        atexit.register(flush)
+
+
+def _upsert(pending: Dict[Tuple[str, str, date], int]):
+    """
+    Пакетная запись: значения прибавляются к существующим строкам.
+    """
+    rows = [(name, key, day, amount) for (name, key, day), amount in pending.items()]
+    if connection.vendor in ('sqlite', 'postgresql'):
+        quote = connection.ops.quote_name
+        table = quote(DailyCounter._meta.db_table)
+        unique = ', '.join(quote(column) for column in ('name', 'key', 'date'))
+        value = quote('value')
+        sql = (
+            f'INSERT INTO {table} ({unique}, {value}) VALUES (%s, %s, %s, %s) '
+            f'ON CONFLICT ({unique}) DO UPDATE SET {value} = {table}.{value} + excluded.{value}'
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+        return
+
+    with transaction.atomic():
+        for name, key, day, amount in rows:
+            updated = DailyCounter.objects.filter(name=name, key=key, date=day).update(value=F('value') + amount)
+            if not updated:
+                DailyCounter.objects.create(name=name, key=key, date=day, value=amount)
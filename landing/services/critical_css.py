@@ -0,0 +1,322 @@
+"""
+Сервис извлечения критического CSS для страниц лендинга.
+
+Из полного `css/style.css` выбираются только правила, селекторы которых
+встречаются в разметке «первого экрана» шаблона. Результат инлайнится
+в <head>, а полный файл стилей загружается асинхронно.
+"""
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from loguru import logger
+
+
+# Исходный файл стилей (путь внутри static)
+SOURCE_CSS = 'css/style.css'
+
+# Куда складываются собранные файлы критического CSS внутри STATIC_ROOT
+CRITICAL_CSS_DIR = 'css/critical'
+
+# Маркер в шаблоне: всё, что ниже, не попадает на первый экран
+FOLD_MARKER = '{# critical-css:fold #}'
+
+# Страницы и шаблоны, разметка которых видна на первом экране
+CRITICAL_CSS_PAGES = {
+    'index': ('base.html', 'includes/header.html', 'landing/index.html'),
+    'articles_list': (
+        'base.html',
+        'includes/header.html',
+        'includes/articles_search_form.html',
+        'landing/articles_list.html',
+    ),
+    'article_detail': ('base.html', 'includes/header.html', 'landing/article_detail.html'),
+    'properties_list': ('base.html', 'includes/header.html', 'landing/properties_list.html'),
+}
+
+# Элементы, которые всегда присутствуют на странице
+_ALWAYS_PRESENT_TAGS = {'html', 'body', 'head', 'main'}
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_DJANGO_COMMENT_RE = re.compile(r'{#.*?#}', re.S)
+_DJANGO_TAG_RE = re.compile(r'{%.*?%}|{{.*?}}', re.S)
+_PSEUDO_RE = re.compile(r'::?[a-zA-Z-]+(\([^)]*\))?')
+_ATTRIBUTE_RE = re.compile(r'\[[^\]]*\]')
+_CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_ID_RE = re.compile(r'#(-?[_a-zA-Z][\w-]*)')
+_TAG_RE = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SOURCE_HEADER_RE = re.compile(r'^/\* source: (\S+) \*/')
+
+
+class _MarkupCollector(HTMLParser):
+    """
+    Сборщик тегов, классов и id из HTML-разметки шаблона.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag.lower())
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == 'class':
+                self.classes.update(value.split())
+            elif name == 'id':
+                self.ids.add(value.strip())
+
+
+class CriticalCSSBuilder:
+    """
+    Построитель критического CSS.
+
+    Разбирает таблицу стилей на правила (с учетом @media/@supports)
+    и оставляет только селекторы, совпадающие с разметкой страницы.
+    """
+
+    def __init__(self, css: str):
+        """
+        Инициализация построителя.
+
+        Args:
+            css: Полный текст таблицы стилей
+        """
+        self.css = _COMMENT_RE.sub('', css)
+
+    def build(self, templates: Iterable[str]) -> str:
+        """
+        Сборка критического CSS для набора шаблонов.
+
+        Args:
+            templates: Имена шаблонов, формирующих первый экран страницы
+
+        Returns:
+            str: Минифицированный критический CSS
+        """
+        collector = _MarkupCollector()
+        for template_name in templates:
+            collector.feed(self._above_the_fold(template_name))
+        collector.close()
+
+        markup = (
+            collector.tags | _ALWAYS_PRESENT_TAGS,
+            collector.classes,
+            collector.ids,
+        )
+        return ''.join(self._filter_block(self.css, markup))
+
+    @staticmethod
+    def _above_the_fold(template_name: str) -> str:
+        """
+        Получение разметки шаблона до маркера первого экрана.
+
+        Args:
+            template_name: Имя шаблона
+
+        Returns:
+            str: HTML без шаблонных тегов Django
+        """
+        try:
+            source = get_template(template_name).template.source
+        except TemplateDoesNotExist:
+            logger.warning(f'Шаблон {template_name} не найден, пропускаем при сборке критического CSS')
+            return ''
+
+        source = source.split(FOLD_MARKER, 1)[0]
+        source = _DJANGO_COMMENT_RE.sub('', source)
+        return _DJANGO_TAG_RE.sub(' ', source)
+
+    def _filter_block(self, css: str, markup: Tuple[Set[str], Set[str], Set[str]]) -> List[str]:
+        """
+        Фильтрация блока CSS (верхнего уровня или содержимого @media).
+
+        Args:
+            css: Текст блока
+            markup: Теги, классы и id разметки страницы
+
+        Returns:
+            list: Оставленные правила в минифицированном виде
+        """
+        result = []
+        for prelude, body in self._split_rules(css):
+            if prelude.startswith('@'):
+                if prelude.startswith(('@media', '@supports')):
+                    inner = self._filter_block(body, markup)
+                    if inner:
+                        result.append(f'{prelude}{{{"".join(inner)}}}')
+                elif prelude.startswith(('@font-face', '@keyframes', '@-webkit-keyframes')):
+                    result.append(f'{prelude}{{{self._minify(body)}}}')
+                continue
+
+            selectors = [s.strip() for s in prelude.split(',') if self._matches(s, markup)]
+            if selectors:
+                result.append(f'{",".join(selectors)}{{{self._minify(body)}}}')
+        return result
+
+    @staticmethod
+    def _split_rules(css: str) -> List[Tuple[str, str]]:
+        """
+        Разбиение CSS на пары (прелюдия, тело) с учетом вложенных скобок.
+
+        Args:
+            css: Текст CSS
+
+        Returns:
+            list: Список кортежей (селектор или at-правило, содержимое блока)
+        """
+        rules = []
+        position = 0
+        length = len(css)
+        while position < length:
+            start = css.find('{', position)
+            if start == -1:
+                break
+            prelude = _WHITESPACE_RE.sub(' ', css[position:start]).strip()
+            # At-правила без блока (@import, @charset) отделены точкой с запятой
+            if ';' in prelude and prelude.startswith('@'):
+                prelude = prelude.rsplit(';', 1)[-1].strip()
+
+            depth = 1
+            end = start + 1
+            while end < length and depth:
+                if css[end] == '{':
+                    depth += 1
+                elif css[end] == '}':
+                    depth -= 1
+                end += 1
+
+            rules.append((prelude, css[start + 1:end - 1]))
+            position = end
+        return rules
+
+    @staticmethod
+    def _matches(selector: str, markup: Tuple[Set[str], Set[str], Set[str]]) -> bool:
+        """
+        Проверка, что селектор может совпасть с разметкой страницы.
+
+        Args:
+            selector: Одиночный CSS-селектор
+            markup: Теги, классы и id разметки страницы
+
+        Returns:
+            bool: True, если все классы, id и теги селектора есть в разметке
+        """
+        tags, classes, ids = markup
+        selector = selector.strip()
+        if selector.startswith(':root'):
+            return True
+
+        simplified = _ATTRIBUTE_RE.sub('', _PSEUDO_RE.sub('', selector))
+        if not set(_CLASS_RE.findall(simplified)) <= classes:
+            return False
+        if not set(_ID_RE.findall(simplified)) <= ids:
+            return False
+        return {tag.lower() for tag in _TAG_RE.findall(simplified)} <= tags
+
+    @staticmethod
+    def _minify(declarations: str) -> str:
+        """
+        Сжатие блока объявлений CSS.
+
+        Args:
+            declarations: Содержимое блока правил
+
+        Returns:
+            str: Объявления без лишних пробелов
+        """
+        declarations = _WHITESPACE_RE.sub(' ', declarations).strip()
+        declarations = re.sub(r'\s*([:;{},])\s*', r'\1', declarations)
+        return declarations.rstrip(';')
+
+
+def build_critical_css(css: str, source_name: str) -> Dict[str, str]:
+    """
+    Сборка критического CSS для всех страниц из CRITICAL_CSS_PAGES.
+
+    Args:
+        css: Полный текст таблицы стилей
+        source_name: Имя файла стилей (с хешем манифеста), из которого собран CSS
+
+    Returns:
+        dict: Критический CSS по имени страницы, с заголовком-источником
+    """
+    builder = CriticalCSSBuilder(css)
+    header = f'/* source: {source_name} */\n'
+    return {page: header + builder.build(templates) for page, templates in CRITICAL_CSS_PAGES.items()}
+
+
+_cache: Dict[str, Tuple[Optional[float], Optional[str]]] = {}
+
+
+def get_critical_css(page: str) -> Optional[str]:
+    """
+    Получение критического CSS для страницы.
+
+    В production читает файл, собранный при collectstatic, и проверяет,
+    что он собран из актуальной (по манифесту) версии style.css.
+    Без собранной статики (DEBUG) строит CSS на лету из исходника.
+    Результат кэшируется в памяти процесса.
+
+    Args:
+        page: Имя страницы из CRITICAL_CSS_PAGES
+
+    Returns:
+        str | None: CSS без заголовка или None, если собрать не удалось
+    """
+    if page not in CRITICAL_CSS_PAGES:
+        return None
+
+    source_path = finders.find(SOURCE_CSS)
+    mtime = Path(source_path).stat().st_mtime if source_path else None
+    cached = _cache.get(page)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    css = _load_collected(page)
+    if css is None and source_path:
+        css = build_critical_css(Path(source_path).read_text(encoding='utf-8'), SOURCE_CSS)[page]
+    if css is not None:
+        css = _SOURCE_HEADER_RE.sub('', css, count=1).strip()
+
+    _cache[page] = (mtime, css)
+    return css
+
+
+def _load_collected(page: str) -> Optional[str]:
+    """
+    Чтение собранного при collectstatic критического CSS.
+
+    Args:
+        page: Имя страницы
+
+    Returns:
+        str | None: Содержимое файла или None, если файла нет или он устарел
+    """
+    name = f'{CRITICAL_CSS_DIR}/{page}.css'
+    try:
+        if not staticfiles_storage.exists(name):
+            return None
+        with staticfiles_storage.open(name) as f:
+            css = f.read().decode('utf-8')
+    except (OSError, ValueError):
+        return None
+
+    match = _SOURCE_HEADER_RE.match(css)
+    try:
+        current = staticfiles_storage.stored_name(SOURCE_CSS)
+    except (AttributeError, ValueError):
+        current = SOURCE_CSS
+    if not match or match.group(1) != current:
+        logger.warning(f'Критический CSS {name} устарел относительно манифеста, выполните collectstatic')
+        return None
+    return css
@@ -0,0 +1,212 @@
+"""
+sitemap.xml и RSS/Atom лента статей.
+
+Документы хранятся в кэше сразу во всех кодировках (см. page_cache.compress)
+и не генерируются на каждый запрос. Ключи документов включают версию:
+изменение статьи или объекта после коммита увеличивает ее (invalidate()),
+и первый следующий запрос собирает документы заново. Версия читается
+до чтения БД, поэтому сборка, которую обогнало изменение, сохраняется
+под старой версией и не отдается. Sitemap и лента строятся двумя
+запросами: опубликованные статьи и последние FEED_ITEMS статей.
+"""
+from datetime import timezone as dt_timezone
+from typing import Dict, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.urls import reverse
+from django.utils import feedgenerator, timezone
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from landing.models import Article, Property
+from landing.services import publishing
+from landing.services.page_cache import compress
+
+
+VERSION_KEY = 'landing:feed:version'
+DOCUMENT_KEY = 'landing:feed:{version}:{name}'
+
+# Время жизни документов в кэше (секунды), не дольше ближайшей публикации
+FEED_CACHE_TIMEOUT = 24 * 3600
+
+# Количество статей в RSS/Atom ленте
+FEED_ITEMS = 20
+
+FEED_TITLE = 'Бюро Квартир - статьи и новости'
+FEED_DESCRIPTION = 'Статьи и новости агентства недвижимости Бюро Квартир'
+
+DOCUMENTS = {
+    'sitemap': 'application/xml; charset=utf-8',
+    'rss': 'application/rss+xml; charset=utf-8',
+    'atom': 'application/atom+xml; charset=utf-8',
+}
+
+_SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_SITEMAP_FOOTER = '</urlset>\n'
+
+
+def absolute_url(path: str) -> str:
+    """
+    Абсолютный URL страницы сайта.
+
+    Args:
+        path: Путь, например /articles/
+
+    Returns:
+        str: URL с доменом из настройки SITE_URL
+    """
+    return getattr(settings, 'SITE_URL', 'http://localhost:8000').rstrip('/') + path
+
+
+def get_document(name: str) -> Tuple[str, Dict[str, bytes]]:
+    """
+    Получение документа из кэша (со сборкой при промахе).
+
+    Args:
+        name: Имя документа из DOCUMENTS
+
+    Returns:
+        tuple: (Content-Type, тело документа по кодировке)
+    """
+    version = _get_version()
+    encoded = cache.get(DOCUMENT_KEY.format(version=version, name=name))
+    if encoded is None:
+        encoded = rebuild_all(version)[name]
+    return DOCUMENTS[name], encoded
+
+
+def rebuild_all(version: Optional[int] = None) -> Dict[str, Dict[str, bytes]]:
+    """
+    Сборка sitemap и ленты из БД с сохранением в кэш.
+
+    Args:
+        version: Версия, прочитанная до обращения к БД (по умолчанию текущая)
+
+    Returns:
+        dict: Сжатые документы по имени
+    """
+    if version is None:
+        version = _get_version()
+    documents = {name: compress(content) for name, content in _build_documents().items()}
+    cache.set_many(
+        {DOCUMENT_KEY.format(version=version, name=name): encoded for name, encoded in documents.items()},
+        timeout=publishing.cap_timeout(FEED_CACHE_TIMEOUT),
+    )
+    return documents
+
+
+def invalidate():
+    """
+    Пересборка документов при следующем запросе (после коммита текущей транзакции).
+    """
+    transaction.on_commit(_bump_version)
+
+
+def _get_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def _bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Ключа нет (кэш очищен) - любая новая версия отличается от сохраненных документов
+        cache.add(VERSION_KEY, 2, timeout=None)
+
+
+def _sitemap_url(path: str, lastmod=None) -> str:
+    """
+    Фрагмент <url> sitemap.
+    """
+    loc = escape(absolute_url(path))
+    if lastmod is None:
+        return f'<url><loc>{loc}</loc></url>\n'
+    return f'<url><loc>{loc}</loc><lastmod>{_w3c_datetime(lastmod)}</lastmod></url>\n'
+
+
+def _build_documents() -> Dict[str, bytes]:
+    """
+    Сборка sitemap (главная, каталог объектов, список и страницы статей) и ленты.
+
+    Returns:
+        dict: Несжатые документы по имени
+    """
+    articles = list(
+        Article.objects.published()
+        .only('uuid', 'slug', 'published_at', 'updated_at')
+        .order_by('-published_at', '-uuid')
+    )
+    properties_lastmod = Property.objects.filter(is_active=True).aggregate(lastmod=Max('updated_at'))['lastmod']
+
+    parts = [
+        _SITEMAP_HEADER,
+        _sitemap_url(reverse('landing:index')),
+        _sitemap_url(reverse('landing:properties_list'), properties_lastmod),
+        _sitemap_url(
+            reverse('landing:articles_list'),
+            max((article.updated_at for article in articles), default=None),
+        ),
+    ]
+    parts.extend(
+        _sitemap_url(reverse('landing:article_detail', args=[article.slug]), article.updated_at)
+        for article in articles
+    )
+    parts.append(_SITEMAP_FOOTER)
+
+    recent = list(Article.objects.published().order_by('-published_at', '-uuid')[:FEED_ITEMS])
+    return {
+        'sitemap': ''.join(parts).encode('utf-8'),
+        'rss': _build_feed(feedgenerator.Rss201rev2Feed, 'landing:articles_rss', recent),
+        'atom': _build_feed(feedgenerator.Atom1Feed, 'landing:articles_atom', recent),
+    }
+
+
+def _build_feed(feed_class, url_name: str, articles) -> bytes:
+    """
+    Сборка ленты статей.
+
+    Args:
+        feed_class: Класс из django.utils.feedgenerator
+        url_name: Имя URL самой ленты
+        articles: Статьи в порядке убывания даты публикации
+
+    Returns:
+        bytes: XML ленты
+    """
+    feed = feed_class(
+        title=FEED_TITLE,
+        link=absolute_url(reverse('landing:articles_list')),
+        description=FEED_DESCRIPTION,
+        language='ru',
+        feed_url=absolute_url(reverse(url_name)),
+    )
+    for article in articles:
+        link = absolute_url(reverse('landing:article_detail', args=[article.slug]))
+        description = article.short_description or Truncator(strip_tags(article.content_html)).words(50)
+        feed.add_item(
+            title=article.title,
+            link=link,
+            description=description,
+            unique_id=link,
+            pubdate=article.published_at,
+            updateddate=article.updated_at,
+        )
+    return feed.writeString('utf-8').encode('utf-8')
+
+
+def _w3c_datetime(value) -> str:
+    """
+    Дата в формате W3C Datetime для <lastmod>.
+    """
+    return value.astimezone(dt_timezone.utc).isoformat(timespec='seconds')
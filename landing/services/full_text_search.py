@@ -0,0 +1,296 @@
+"""
+Полнотекстовый поиск на нативных индексах БД.
+
+- SQLite: виртуальная таблица FTS5, синхронизируемая триггерами;
+- PostgreSQL: генерируемая колонка tsvector (словарь russian) с GIN-индексом.
+
+SQLite выполняет большинство AlterField/AddField пересозданием таблицы,
+при котором триггеры удаляются. После каждого migrate обработчик
+post_migrate (см. landing.signals) вызывает repair_indexes(), который
+восстанавливает пропавшие триггеры и заново заполняет индекс.
+
+На остальных СУБД поиск деградирует до icontains по тем же полям.
+"""
+import re
+from typing import Dict, List, Optional
+
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+
+# Результатов поиска в списке админки (самые релевантные)
+ADMIN_SEARCH_LIMIT = 500
+ADMIN_SEARCH_LIMIT_MESSAGE = (
+    f'Найдено больше {ADMIN_SEARCH_LIMIT} совпадений, показаны {ADMIN_SEARCH_LIMIT} самых релевантных. '
+    'Уточните запрос, чтобы увидеть остальные.'
+)
+
+_TOKEN_RE = re.compile(r'\w+', re.U)
+
+# Окончания для облегченного стемминга русских слов в запросах к FTS5.
+# FTS5 не умеет морфологию русского языка, поэтому термин запроса
+# усекается до основы и ищется как префикс: «квартиры» -> квартир*.
+_RUSSIAN_ENDINGS = sorted((
+    'иями', 'ями', 'ами', 'иях', 'ией', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими',
+    'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ый', 'ий', 'ой', 'ом', 'ем', 'ам', 'ям',
+    'ах', 'ях', 'ов', 'ев', 'ей', 'ию', 'ия', 'ью', 'ть',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й',
+), key=len, reverse=True)
+_MIN_STEM_LENGTH = 3
+
+
+def stem_russian(word: str) -> str:
+    """
+    Облегченный стемминг: отсечение типичного окончания.
+
+    Args:
+        word: Слово в нижнем регистре
+
+    Returns:
+        str: Основа слова (не короче _MIN_STEM_LENGTH символов)
+    """
+    for ending in _RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+    return word
+
+
+class FullTextIndex:
+    """
+    Описание полнотекстового индекса модели.
+
+    Поля задаются с весами PostgreSQL (A - самый важный). Для FTS5 веса
+    переводятся в коэффициенты bm25.
+    """
+
+    _BM25_WEIGHTS = {'A': 10.0, 'B': 5.0, 'C': 1.0, 'D': 0.5}
+
+    def __init__(self, table: str, pk_column: str, fields: Dict[str, str]):
+        """
+        Инициализация описания индекса.
+
+        Args:
+            table: Имя таблицы модели
+            pk_column: Колонка первичного ключа
+            fields: Колонки и их веса, например {'title': 'A', 'content': 'C'}
+        """
+        self.table = table
+        self.pk_column = pk_column
+        self.fields = fields
+        self.fts_table = f'{table}_fts'
+        self.vector_column = 'search_vector'
+
+    # --- DDL для миграций -------------------------------------------------
+
+    def create(self, schema_editor):
+        """
+        Создание индекса (вызывается из миграции).
+        """
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            statements = self._sqlite_create_sql()
+        elif vendor == 'postgresql':
+            statements = self._postgres_create_sql()
+        else:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    def drop(self, schema_editor):
+        """
+        Удаление индекса (откат миграции).
+        """
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            for name in self._sqlite_trigger_names():
+                schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            schema_editor.execute(f'DROP TABLE IF EXISTS {self.fts_table}')
+        elif vendor == 'postgresql':
+            schema_editor.execute(f'DROP INDEX IF EXISTS {self.table}_search_idx')
+            schema_editor.execute(f'ALTER TABLE {self.table} DROP COLUMN IF EXISTS {self.vector_column}')
+
+    def is_broken(self, using_connection=None) -> bool:
+        """
+        Проверка, что таблица FTS5 есть, а триггеров синхронизации нет (только SQLite).
+        """
+        using_connection = using_connection or connection
+        if using_connection.vendor != 'sqlite':
+            return False
+        with using_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT type, name FROM sqlite_master WHERE (type = 'table' AND name = %s) "
+                "OR (type = 'trigger' AND name IN (%s, %s, %s))",
+                [self.fts_table, *self._sqlite_trigger_names()],
+            )
+            found = {name for _, name in cursor.fetchall()}
+        return self.fts_table in found and not set(self._sqlite_trigger_names()) <= found
+
+    def repair(self, schema_editor):
+        """
+        Пересоздание триггеров и повторное заполнение индекса FTS5.
+
+        Индекс, созданный миграцией, но потерявший триггеры, не содержит
+        записей, добавленных после потери, поэтому заполняется заново.
+        """
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for name in self._sqlite_trigger_names():
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        schema_editor.execute(f'DELETE FROM {self.fts_table}')
+        # Все, кроме CREATE VIRTUAL TABLE: триггеры и заполнение
+        for statement in self._sqlite_create_sql()[1:]:
+            schema_editor.execute(statement)
+
+    def _sqlite_trigger_names(self) -> List[str]:
+        return [f'{self.fts_table}_{suffix}' for suffix in ('ai', 'ad', 'au')]
+
+    def _sqlite_create_sql(self) -> List[str]:
+        """
+        Таблица FTS5 с копией текста и триггеры синхронизации.
+
+        Используется обычная (не external content) таблица с колонкой pk:
+        rowid таблиц с UUID-ключом может измениться при VACUUM.
+        """
+        columns = ', '.join(self.fields)
+        new_values = ', '.join(f'new.{name}' for name in self.fields)
+        pk = self.pk_column
+        return [
+            f"CREATE VIRTUAL TABLE {self.fts_table} USING fts5("
+            f"{pk} UNINDEXED, {columns}, tokenize = 'unicode61 remove_diacritics 2')",
+            f'CREATE TRIGGER {self.fts_table}_ai AFTER INSERT ON {self.table} BEGIN '
+            f'INSERT INTO {self.fts_table} ({pk}, {columns}) VALUES (new.{pk}, {new_values}); END',
+            f'CREATE TRIGGER {self.fts_table}_ad AFTER DELETE ON {self.table} BEGIN '
+            f'DELETE FROM {self.fts_table} WHERE {pk} = old.{pk}; END',
+            f'CREATE TRIGGER {self.fts_table}_au AFTER UPDATE ON {self.table} BEGIN '
+            f'DELETE FROM {self.fts_table} WHERE {pk} = old.{pk}; '
+            f'INSERT INTO {self.fts_table} ({pk}, {columns}) VALUES (new.{pk}, {new_values}); END',
+            f'INSERT INTO {self.fts_table} ({pk}, {columns}) SELECT {pk}, {columns} FROM {self.table}',
+        ]
+
+    def _postgres_create_sql(self) -> List[str]:
+        """
+        Генерируемая колонка tsvector с весами и GIN-индекс.
+        """
+        vector = ' || '.join(
+            f"setweight(to_tsvector('russian', coalesce({name}, '')), '{weight}')"
+            for name, weight in self.fields.items()
+        )
+        return [
+            f'ALTER TABLE {self.table} ADD COLUMN {self.vector_column} tsvector '
+            f'GENERATED ALWAYS AS ({vector}) STORED',
+            f'CREATE INDEX {self.table}_search_idx ON {self.table} USING GIN ({self.vector_column})',
+        ]
+
+    # --- Поиск --------------------------------------------------------------
+
+    def search(self, queryset: QuerySet, query: str, limit: int = 50) -> List:
+        """
+        Поиск записей, отсортированных по релевантности.
+
+        Args:
+            queryset: Базовый QuerySet (фильтры, например только опубликованные)
+            query: Поисковая строка пользователя
+            limit: Максимальное количество результатов
+
+        Returns:
+            list: Экземпляры модели в порядке убывания релевантности
+        """
+        pks = self.search_pks(queryset, query, limit)
+        if pks is None:
+            return list(self._fallback(queryset, query)[:limit])
+        objects = queryset.in_bulk(pks)
+        return [objects[pk] for pk in pks if pk in objects]
+
+    def search_pks(self, queryset: QuerySet, query: str, limit: Optional[int] = 50) -> Optional[List]:
+        """
+        Поиск первичных ключей по индексу.
+
+        Args:
+            queryset: Базовый QuerySet для фильтрации
+            query: Поисковая строка пользователя
+            limit: Максимальное количество результатов (None - без ограничения)
+
+        Returns:
+            list | None: Ключи по релевантности или None, если СУБД не поддерживается
+        """
+        terms = [token.lower() for token in _TOKEN_RE.findall(query or '')]
+        if not terms:
+            return []
+
+        base_sql, base_params = queryset.order_by().values('pk').query.sql_with_params()
+        limit_sql = ' LIMIT %s' if limit else ''
+        limit_params = [limit] if limit else []
+
+        if connection.vendor == 'sqlite':
+            match = ' '.join(f'"{stem_russian(term)}"*' for term in terms)
+            weights = ', '.join(str(self._BM25_WEIGHTS[w]) for w in self.fields.values())
+            sql = (
+                f'SELECT f.{self.pk_column} FROM {self.fts_table} f '
+                f'WHERE {self.fts_table} MATCH %s AND f.{self.pk_column} IN ({base_sql}) '
+                f'ORDER BY bm25({self.fts_table}, 0.0, {weights}){limit_sql}'
+            )
+            params = [match, *base_params, *limit_params]
+        elif connection.vendor == 'postgresql':
+            sql = (
+                f'SELECT t.{self.pk_column} FROM {self.table} t, '
+                f"websearch_to_tsquery('russian', %s) q "
+                f'WHERE t.{self.vector_column} @@ q AND t.{self.pk_column} IN ({base_sql}) '
+                f'ORDER BY ts_rank(t.{self.vector_column}, q) DESC{limit_sql}'
+            )
+            params = [query, *base_params, *limit_params]
+        else:
+            return None
+
+        pk_field = queryset.model._meta.pk
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [pk_field.to_python(row[0]) for row in cursor.fetchall()]
+
+    def _fallback(self, queryset: QuerySet, query: str) -> QuerySet:
+        """
+        Поиск через icontains для СУБД без поддержки полнотекстового индекса.
+        """
+        condition = Q()
+        for token in _TOKEN_RE.findall(query or ''):
+            token_condition = Q()
+            for name in self.fields:
+                token_condition |= Q(**{f'{name}__icontains': token})
+            condition &= token_condition
+        return queryset.filter(condition)
+
+
+ARTICLE_SEARCH_INDEX = FullTextIndex(
+    table='landing_article',
+    pk_column='uuid',
+    fields={'title': 'A', 'short_description': 'B', 'content': 'C'},
+)
+
+APPLICATION_SEARCH_INDEX = FullTextIndex(
+    table='landing_application',
+    pk_column='uuid',
+    fields={'name': 'A', 'phone': 'A', 'message': 'B'},
+)
+
+ARCHIVED_APPLICATION_SEARCH_INDEX = FullTextIndex(
+    table='landing_archivedapplication',
+    pk_column='uuid',
+    fields={'name': 'A', 'phone': 'A', 'message': 'B'},
+)
+
+SEARCH_INDEXES = (ARTICLE_SEARCH_INDEX, APPLICATION_SEARCH_INDEX, ARCHIVED_APPLICATION_SEARCH_INDEX)
+
+
+def repair_indexes(using_connection=None) -> List[str]:
+    """
+    Восстановление индексов FTS5, потерявших триггеры (например, после AlterField на SQLite).
+
+    Returns:
+        list: Таблицы восстановленных индексов
+    """
+    using_connection = using_connection or connection
+    broken = [index for index in SEARCH_INDEXES if index.is_broken(using_connection)]
+    if broken:
+        with using_connection.schema_editor() as schema_editor:
+            for index in broken:
+                index.repair(schema_editor)
+    return [index.table for index in broken]
@@ -0,0 +1,68 @@
+"""
+Идемпотентность отправки формы заявки.
+
+Двойной клик по кнопке или обновление страницы после POST повторяют
+ту же отправку. Ключ отправки - хеш случайного значения из токена
+формы (см. spam_guard.issue_form_token) и цифр телефона: токен в HTML
+закэшированной страницы общий для ее посетителей, телефон у разных
+людей разный, а у повтора той же отправки совпадает.
+
+Ключ хранится в Application.idempotency_key с уникальным индексом,
+результат обработки - в кэше на время жизни токена. Повтор получает
+исходный результат без новой заявки и без отправки в Telegram.
+"""
+import hashlib
+from typing import Optional
+
+from django.core.cache import cache
+
+from landing.services import spam_guard
+
+
+RESULT_KEY = 'landing:application:idempotency:{key}'
+
+# Повтор возможен, пока действует токен формы
+IDEMPOTENCY_WINDOW = spam_guard.FORM_TOKEN_MAX_AGE
+
+# Результаты обработки заявки
+SENT = 'sent'
+SAVED = 'saved'
+
+
+def get_key(token: str, phone: str) -> Optional[str]:
+    """
+    Ключ идемпотентности отправки.
+
+    Args:
+        token: Токен формы
+        phone: Телефон из формы
+
+    Returns:
+        str | None: sha256-хеш или None, если токен не прошел проверку подписи
+    """
+    payload = spam_guard.read_form_token(token)
+    if payload is None or not payload.get('n'):
+        return None
+    digits = ''.join(char for char in phone if char.isdigit())
+    return hashlib.sha256(f'{payload["n"]}:{digits}'.encode()).hexdigest()
+
+
+def get_result(key: str) -> Optional[str]:
+    """
+    Результат ранее обработанной отправки.
+
+    Returns:
+        str | None: SENT, SAVED или None, если отправки с этим ключом не было
+    """
+    return cache.get(RESULT_KEY.format(key=key))
+
+
+def store_result(key: str, result: str):
+    """
+    Сохранение результата обработки отправки.
+
+    Args:
+        key: Ключ идемпотентности
+        result: SENT или SAVED
+    """
+    cache.set(RESULT_KEY.format(key=key), result, timeout=IDEMPOTENCY_WINDOW)
@@ -0,0 +1,182 @@
+"""
+Keyset (cursor) пагинация QuerySet без COUNT(*) и OFFSET.
+
+Страница определяется курсором - значениями полей сортировки последней
+(или первой) записи соседней страницы. Запрос всегда идет по индексу
+с условием «строго после/до курсора», поэтому глубокие страницы
+не медленнее первой.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from functools import reduce
+from typing import List, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    """Курсор не удалось разобрать."""
+
+
+@dataclass
+class KeysetPage:
+    """
+    Страница результатов keyset пагинации.
+    """
+    object_list: List
+    has_next: bool
+    has_previous: bool
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Пагинатор по набору полей сортировки.
+
+    Последнее поле сортировки должно быть уникальным (например, uuid),
+    чтобы порядок записей был однозначным.
+    """
+
+    def __init__(self, queryset: QuerySet, ordering: Sequence[str], per_page: int):
+        """
+        Инициализация пагинатора.
+
+        Args:
+            queryset: Исходный QuerySet
+            ordering: Поля сортировки, например ('-published_at', '-uuid')
+            per_page: Количество записей на странице
+        """
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields: Tuple[Tuple[str, bool], ...] = tuple(
+            (name.lstrip('-'), name.startswith('-')) for name in self.ordering
+        )
+
+    def page(self, after: Optional[str] = None, before: Optional[str] = None) -> KeysetPage:
+        """
+        Получение страницы.
+
+        Args:
+            after: Курсор, после которого начинается страница (ссылка «Вперед»)
+            before: Курсор, до которого заканчивается страница (ссылка «Назад»)
+
+        Returns:
+            KeysetPage: Страница результатов
+
+        Raises:
+            InvalidCursor: Если курсор поврежден
+        """
+        if before:
+            values = self.decode_cursor(before)
+            reverse_ordering = tuple(self._reverse(name) for name in self.ordering)
+            rows = list(
+                self.queryset.filter(self._compare(values, forward=False))
+                .order_by(*reverse_ordering)[:self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            if not has_previous:
+                # Дошли до начала списка - отдаем первую страницу целиком
+                return self.page()
+            rows = rows[:self.per_page][::-1]
+            return self._make_page(rows, has_next=True, has_previous=True)
+
+        queryset = self.queryset
+        if after:
+            queryset = queryset.filter(self._compare(self.decode_cursor(after), forward=True))
+        rows = list(queryset.order_by(*self.ordering)[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        return self._make_page(rows[:self.per_page], has_next=has_next, has_previous=bool(after))
+
+    def cursor_for(self, obj) -> str:
+        """
+        Формирование курсора для записи.
+
+        Args:
+            obj: Экземпляр модели
+
+        Returns:
+            str: Курсор в URL-безопасном base64
+        """
+        values = [self._serialize(getattr(obj, name)) for name, _ in self.fields]
+        raw = json.dumps(values, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> list:
+        """
+        Разбор курсора в значения полей сортировки.
+
+        Args:
+            cursor: Курсор из URL
+
+        Returns:
+            list: Значения полей, приведенные к типам полей модели
+
+        Raises:
+            InvalidCursor: Если курсор поврежден
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        except (ValueError, binascii.Error, UnicodeError) as e:
+            raise InvalidCursor(f'Некорректный курсор: {e}')
+
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise InvalidCursor('Курсор не соответствует полям сортировки')
+
+        model = self.queryset.model
+        try:
+            return [model._meta.get_field(name).to_python(value) for (name, _), value in zip(self.fields, values)]
+        except ValidationError as e:
+            raise InvalidCursor(f'Некорректное значение в курсоре: {e}')
+
+    def _compare(self, values: list, forward: bool) -> Q:
+        """
+        Условие «запись строго после (или до) курсора» в порядке сортировки.
+
+        Для полей (a, b) и курсора (x, y) вперед: a > x OR (a = x AND b > y),
+        где направление сравнения зависит от направления сортировки поля.
+        """
+        conditions = []
+        for index, (name, descending) in enumerate(self.fields):
+            lookup = 'lt' if descending == forward else 'gt'
+            equal = {prev_name: values[i] for i, (prev_name, _) in enumerate(self.fields[:index])}
+            conditions.append(Q(**equal, **{f'{name}__{lookup}': values[index]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    def _make_page(self, rows: list, has_next: bool, has_previous: bool) -> KeysetPage:
+        """
+        Сборка страницы с курсорами соседних страниц.
+        """
+        return KeysetPage(
+            object_list=rows,
+            has_next=has_next and bool(rows),
+            has_previous=has_previous and bool(rows),
+            next_cursor=self.cursor_for(rows[-1]) if has_next and rows else None,
+            previous_cursor=self.cursor_for(rows[0]) if has_previous and rows else None,
+        )
+
+    @staticmethod
+    def _reverse(name: str) -> str:
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    @staticmethod
+    def _serialize(value):
+        """
+        Приведение значения поля к JSON-совместимому виду.
+        """
+        if value is None or isinstance(value, (int, float, str, bool)):
+            return value
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
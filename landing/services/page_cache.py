@@ -0,0 +1,310 @@
+"""
+Кэш HTML-страниц с предварительно сжатыми вариантами (brotli/gzip).
+
+Ключи кэша включают версию контента: при изменении услуг, объектов,
+статей или команды версия увеличивается, и все страницы становятся
+устаревшими без явного перебора ключей. Страница статьи зависит только
+от самой статьи, поэтому ее версия - время последнего изменения статьи.
+
+Перед общим кэшем стоит небольшой LRU в памяти процесса: горячие
+страницы отдаются без сетевого обращения за телом страницы.
+"""
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Brotli не установлен, отдаем только gzip
+
+
+CONTENT_VERSION_KEY = 'landing:content_version'
+ARTICLE_VERSION_KEY = 'landing:article_version:{slug}'
+PAGE_KEY_PREFIX = 'landing:page'
+
+# Время жизни записи, подтянутой в LRU из общего кэша (секунды)
+LOCAL_CACHE_REFILL_TIMEOUT = 60
+
+# Кодировки в порядке предпочтения
+ENCODINGS = ('br', 'gzip', 'identity') if brotli else ('gzip', 'identity')
+
+
+class LocalLRUCache:
+    """
+    Потокобезопасный LRU-кэш в памяти процесса.
+
+    Ключи страниц содержат версию, поэтому устаревшие записи никогда
+    не отдаются и просто вытесняются по мере заполнения. Время жизни
+    записи совпадает с временем жизни в общем кэше.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: int):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local_cache = LocalLRUCache(getattr(settings, 'PAGE_CACHE_LOCAL_SIZE', 256))
+
+
+def get_content_version() -> int:
+    """
+    Получение текущей версии контента.
+
+    Returns:
+        int: Версия контента
+    """
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(CONTENT_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def get_article_version(slug: str) -> Optional[str]:
+    """
+    Получение версии опубликованной статьи.
+
+    Args:
+        slug: URL-адрес статьи
+
+    Returns:
+        str | None: Версия или None, если статья еще не рендерилась
+    """
+    return cache.get(ARTICLE_VERSION_KEY.format(slug=slug))
+
+
+def set_article_version(article) -> str:
+    """
+    Запоминание версии статьи по времени ее последнего изменения.
+
+    Args:
+        article: Экземпляр Article
+
+    Returns:
+        str: Версия статьи
+    """
+    version = f'article-{int(article.updated_at.timestamp() * 1_000_000)}'
+    cache.set(ARTICLE_VERSION_KEY.format(slug=article.slug), version, timeout=None)
+    return version
+
+
+def delete_article_version(slug: str):
+    """
+    Сброс версии статьи (статья удалена или сменила адрес).
+
+    Args:
+        slug: URL-адрес статьи
+    """
+    cache.delete(ARTICLE_VERSION_KEY.format(slug=slug))
+
+
+def get_page_version(view_name: str, kwargs: dict) -> Optional[str]:
+    """
+    Версия, от которой зависит страница.
+
+    Args:
+        view_name: Имя URL (например, landing:article_detail)
+        kwargs: Параметры URL
+
+    Returns:
+        str | None: Версия или None, если она пока неизвестна
+    """
+    if view_name == 'landing:article_detail':
+        return get_article_version(kwargs['slug'])
+    return f'v{get_content_version()}'
+
+
+def bump_content_version() -> int:
+    """
+    Увеличение версии контента (инвалидация всех закэшированных страниц).
+
+    Returns:
+        int: Новая версия контента
+    """
+    try:
+        return cache.incr(CONTENT_VERSION_KEY)
+    except ValueError:
+        # Ключа нет (кэш очищен или еще не создан)
+        cache.set(CONTENT_VERSION_KEY, 2, timeout=None)
+        return 2
+
+
+def page_key(path: str, encoding: str, version: str) -> str:
+    """
+    Формирование ключа кэша для варианта страницы.
+
+    Args:
+        path: Путь запроса со значимыми параметрами
+        encoding: Кодировка (br, gzip, identity)
+        version: Версия контента
+
+    Returns:
+        str: Ключ кэша
+    """
+    digest = hashlib.md5(path.encode('utf-8')).hexdigest()
+    return f'{PAGE_KEY_PREFIX}:{version}:{digest}:{encoding}'
+
+
+def compress(content: bytes) -> Dict[str, bytes]:
+    """
+    Сжатие тела ответа во все поддерживаемые кодировки.
+
+    Args:
+        content: Несжатое тело ответа
+
+    Returns:
+        dict: Тело ответа по кодировке
+    """
+    encoded = {
+        'identity': content,
+        'gzip': gzip.compress(content, compresslevel=9, mtime=0),
+    }
+    if brotli:
+        encoded['br'] = brotli.compress(content, mode=brotli.MODE_TEXT)
+    return encoded
+
+
+def store_page(
+    path: str,
+    content: bytes,
+    content_type: str,
+    version: str,
+    timeout: Optional[int] = None,
+) -> Dict[str, bytes]:
+    """
+    Сохранение страницы в кэш во всех кодировках.
+
+    Args:
+        path: Путь запроса со значимыми параметрами
+        content: Несжатое тело ответа
+        content_type: Значение заголовка Content-Type
+        version: Версия контента, для которой страница отрендерена
+        timeout: Время жизни в секундах (по умолчанию PAGE_CACHE_TIMEOUT)
+
+    Returns:
+        dict: Тело ответа по кодировке
+    """
+    if timeout is None:
+        timeout = getattr(settings, 'PAGE_CACHE_TIMEOUT', 3600)
+    encoded = compress(content)
+    entries = {
+        page_key(path, encoding, version): (content_type, body)
+        for encoding, body in encoded.items()
+    }
+    cache.set_many(entries, timeout=timeout)
+    for key, value in entries.items():
+        _local_cache.set(key, value, timeout)
+    return encoded
+
+
+def get_page(path: str, encoding: str, version: str) -> Optional[tuple]:
+    """
+    Получение варианта страницы из кэша.
+
+    Args:
+        path: Путь запроса со значимыми параметрами
+        encoding: Кодировка (br, gzip, identity)
+        version: Версия контента
+
+    Returns:
+        tuple | None: (Content-Type, тело ответа) или None при промахе
+    """
+    key = page_key(path, encoding, version)
+    value = _local_cache.get(key)
+    if value is None:
+        value = cache.get(key)
+        if value is not None:
+            # Оставшийся срок жизни в общем кэше неизвестен, держим недолго
+            _local_cache.set(key, value, LOCAL_CACHE_REFILL_TIMEOUT)
+    return value
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """
+    Выбор кодировки по заголовку Accept-Encoding с учетом q-значений.
+
+    Args:
+        accept_encoding: Значение заголовка Accept-Encoding
+
+    Returns:
+        str: Наиболее предпочтительная поддерживаемая кодировка
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+
+    best, best_quality = 'identity', 0.0
+    for encoding in ENCODINGS:
+        if encoding == 'identity':
+            continue
+        quality = weights.get(encoding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def build_response(request, body: bytes, content_type: str, encoding: str) -> HttpResponse:
+    """
+    Формирование ответа из готовых байтов в выбранной кодировке.
+
+    Args:
+        request: HTTP запрос (для HEAD тело не отправляется)
+        body: Тело ответа в кодировке encoding
+        content_type: Значение заголовка Content-Type
+        encoding: Кодировка (br, gzip, identity)
+
+    Returns:
+        HttpResponse: Ответ с Content-Encoding и Vary: Accept-Encoding
+    """
+    response = HttpResponse(b'' if request.method == 'HEAD' else body, content_type=content_type)
+    response['Content-Length'] = str(len(body))
+    if encoding != 'identity':
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
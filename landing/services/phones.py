@@ -0,0 +1,49 @@
+"""
+Нормализация телефонов к формату E.164.
+
+Клиенты пишут номер как угодно: «8 (999) 123-45-67», «+7 999 1234567»,
+«9991234567». Для поиска повторных заявок номер приводится к одному
+виду (+79991234567) и хранится в индексируемом поле
+Application.phone_normalized.
+
+Номера без кода страны считаются российскими: 10 цифр - номер без
+кода, 11 цифр с первой 8 - внутренний формат. Российский номер без
+кода не начинается с 0, такие номера отклоняются.
+"""
+import re
+from typing import Optional
+
+
+DEFAULT_COUNTRY_CODE = '7'
+
+_ALLOWED = re.compile(r'^\+?[\d\s().-]+$')
+
+
+def normalize_phone(phone: str) -> Optional[str]:
+    """
+    Приведение телефона к формату E.164.
+
+    Args:
+        phone: Телефон в произвольном формате
+
+    Returns:
+        str | None: Номер вида +79991234567 или None, если это не телефон
+    """
+    phone = (phone or '').strip()
+    if not _ALLOWED.match(phone):
+        return None
+    digits = ''.join(char for char in phone if char.isdigit())
+
+    if not phone.startswith('+'):
+        if len(digits) == 11 and digits[0] == '8':
+            digits = digits[1:]
+        if len(digits) == 10:
+            # Код города или оператора не начинается с 0
+            if digits[0] == '0':
+                return None
+            digits = DEFAULT_COUNTRY_CODE + digits
+
+    # E.164: код страны без ведущего нуля, всего не больше 15 цифр
+    if not 10 <= len(digits) <= 15 or digits[0] == '0':
+        return None
+    return f'+{digits}'
@@ -0,0 +1,182 @@
+"""
+Фасеты каталога объектов недвижимости.
+
+Счетчики объектов хранятся в кэше как матрица «тип × ценовой диапазон»
+и пересчитываются при сохранении или удалении объекта (см. landing.signals).
+Страница каталога только суммирует ячейки матрицы с учетом выбранных
+фильтров и не выполняет GROUP BY на каждый запрос.
+"""
+from decimal import Decimal
+from functools import reduce
+from typing import Dict, Iterable, List
+
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Q, QuerySet, Value, When
+
+from landing.models import Property
+from landing.models.property import PropertyType
+
+
+FACETS_KEY = 'landing:property_facets'
+
+# Ценовые диапазоны: ключ для URL, подпись, нижняя граница, верхняя граница (не включая)
+PRICE_BUCKETS = (
+    ('lt3', 'до 3 млн ₽', None, Decimal('3000000')),
+    ('3-5', '3–5 млн ₽', Decimal('3000000'), Decimal('5000000')),
+    ('5-10', '5–10 млн ₽', Decimal('5000000'), Decimal('10000000')),
+    ('gt10', 'от 10 млн ₽', Decimal('10000000'), None),
+)
+PRICE_BUCKET_KEYS = tuple(key for key, _, _, _ in PRICE_BUCKETS)
+
+
+def price_bucket_q(key: str) -> Q:
+    """
+    Условие попадания цены в диапазон.
+
+    Args:
+        key: Ключ диапазона из PRICE_BUCKETS
+
+    Returns:
+        Q: Условие для фильтрации
+    """
+    for bucket_key, _, low, high in PRICE_BUCKETS:
+        if bucket_key == key:
+            condition = Q()
+            if low is not None:
+                condition &= Q(price__gte=low)
+            if high is not None:
+                condition &= Q(price__lt=high)
+            return condition
+    raise KeyError(key)
+
+
+def filter_properties(
+    queryset: QuerySet,
+    types: Iterable[str] = (),
+    buckets: Iterable[str] = (),
+    location: str = '',
+) -> QuerySet:
+    """
+    Применение фильтров каталога.
+
+    Внутри одного фасета значения объединяются через ИЛИ,
+    разные фасеты - через И.
+
+    Args:
+        queryset: Объекты недвижимости
+        types: Выбранные типы недвижимости
+        buckets: Выбранные ценовые диапазоны
+        location: Часть адреса
+
+    Returns:
+        QuerySet: Отфильтрованные объекты
+    """
+    types = list(types)
+    buckets = list(buckets)
+    if types:
+        queryset = queryset.filter(property_type__in=types)
+    if buckets:
+        queryset = queryset.filter(reduce(lambda left, right: left | right, map(price_bucket_q, buckets)))
+    if location:
+        queryset = queryset.filter(location__icontains=location)
+    return queryset
+
+
+def get_facet_matrix() -> Dict[str, Dict[str, int]]:
+    """
+    Матрица счетчиков «тип -> диапазон -> количество».
+
+    Returns:
+        dict: Количество активных объектов по типу и ценовому диапазону
+    """
+    matrix = cache.get(FACETS_KEY)
+    if matrix is None:
+        matrix = refresh_facets()
+    return matrix
+
+
+def refresh_facets() -> Dict[str, Dict[str, int]]:
+    """
+    Пересчет матрицы счетчиков одним GROUP BY и сохранение в кэш.
+
+    Returns:
+        dict: Новая матрица счетчиков
+    """
+    bucket = Case(
+        *(When(price_bucket_q(key), then=Value(key)) for key in PRICE_BUCKET_KEYS),
+        output_field=CharField(),
+    )
+    rows = (
+        Property.objects.filter(is_active=True)
+        .annotate(price_bucket=bucket)
+        .values('property_type', 'price_bucket')
+        .annotate(count=Count('uuid'))
+        .order_by()
+    )
+    matrix = {value: {key: 0 for key in PRICE_BUCKET_KEYS} for value in PropertyType.values}
+    for row in rows:
+        if row['property_type'] in matrix and row['price_bucket'] in PRICE_BUCKET_KEYS:
+            matrix[row['property_type']][row['price_bucket']] = row['count']
+    cache.set(FACETS_KEY, matrix, timeout=None)
+    return matrix
+
+
+def get_facets(types: Iterable[str] = (), buckets: Iterable[str] = ()) -> Dict[str, List[dict]]:
+    """
+    Значения фасетов со счетчиками с учетом выбора в другом фасете.
+
+    Счетчик типа учитывает выбранные ценовые диапазоны, и наоборот.
+    Фильтр по адресу в счетчиках не учитывается.
+
+    Args:
+        types: Выбранные типы недвижимости
+        buckets: Выбранные ценовые диапазоны
+
+    Returns:
+        dict: {'types': [...], 'prices': [...]} с ключом, подписью, счетчиком и отметкой выбора
+    """
+    matrix = get_facet_matrix()
+    types = set(types)
+    buckets = set(buckets)
+    bucket_scope = buckets or set(PRICE_BUCKET_KEYS)
+    type_scope = types or set(matrix)
+
+    type_facets = [
+        {
+            'value': value,
+            'label': label,
+            'count': sum(matrix.get(value, {}).get(key, 0) for key in bucket_scope),
+            'selected': value in types,
+        }
+        for value, label in PropertyType.choices
+    ]
+    price_facets = [
+        {
+            'value': key,
+            'label': label,
+            'count': sum(matrix.get(value, {}).get(key, 0) for value in type_scope),
+            'selected': key in buckets,
+        }
+        for key, label, _, _ in PRICE_BUCKETS
+    ]
+    return {'types': type_facets, 'prices': price_facets}
+
+
+def clean_choices(values: Iterable[str], allowed: Iterable[str]) -> List[str]:
+    """
+    Отбрасывание неизвестных значений фильтра из query string.
+
+    Args:
+        values: Значения из запроса
+        allowed: Допустимые значения
+
+    Returns:
+        list: Допустимые значения без повторов в исходном порядке
+    """
+    allowed = set(allowed)
+    result: List[str] = []
+    for value in values:
+        if value in allowed and value not in result:
+            result.append(value)
+    return result
+
@@ -0,0 +1,364 @@
+"""
+Массовый импорт объектов недвижимости из CSV или XML-фида.
+
+- файл читается потоково (csv.DictReader / iterparse), в памяти только
+  текущая пачка строк;
+- строки сопоставляются с объектами по external_id и записываются
+  bulk_create / bulk_update пачками, поэтому повторный импорт того же
+  файла обновляет объекты, а не создает дубли;
+- изображения берутся только из папки images_dir (пути вне нее
+  отклоняются), хешируются и сохраняются в пуле потоков; одинаковые
+  файлы хранятся в одном экземпляре;
+- если признак продажи не указан, у существующих объектов is_sold
+  не меняется; новые объекты из CSV получают значение по умолчанию
+  модели (проданный объект портфолио), а из XML-фида портала, где
+  признака нет, - непроданными (объявления фида продаются).
+
+bulk-операции не вызывают сигналы моделей, поэтому после импорта кэши
+сбрасываются явно.
+"""
+import csv
+import hashlib
+import io
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import Property
+from landing.models.property import PropertyType
+from landing.services import feeds, page_cache, property_facets, realty_feed
+
+
+# Поля, которые импорт обновляет у существующих объектов
+UPDATE_FIELDS = [
+    'title', 'description', 'location', 'price', 'property_type', 'is_sold', 'order', 'image', 'updated_at',
+]
+
+CSV_COLUMNS = ('external_id', 'title', 'description', 'location', 'price', 'property_type', 'image', 'is_sold', 'order')
+
+IMAGE_UPLOAD_DIR = 'properties/import'
+
+# Ошибки чтения файла целиком (битый XML, не UTF-8, некорректный CSV)
+READ_ERRORS = (ET.ParseError, UnicodeDecodeError, csv.Error)
+
+# Ограничение поля price (max_digits=12, decimal_places=2)
+MAX_PRICE = Decimal('10000000000')
+
+_TRUE_VALUES = {'1', 'true', 'yes', 'да', 'y', '+'}
+
+# Тип недвижимости по значению, подписи или категории портала
+_PROPERTY_TYPES = {
+    **{value: value for value in PropertyType.values},
+    **{label.lower(): value for value, label in PropertyType.choices},
+    **{category: value for value, category in realty_feed.CATEGORIES.items()},
+}
+
+
+class PropertyImportError(ValueError):
+    """Строка файла импорта содержит некорректные данные."""
+
+
+@dataclass
+class ImportResult:
+    """
+    Итоги импорта.
+    """
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    images: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def skipped(self) -> int:
+        return len(self.errors)
+
+
+class PropertyImporter:
+    """
+    Импорт объектов недвижимости пачками.
+    """
+
+    def __init__(self, images_dir: Optional[Path] = None, batch_size: int = 500, workers: int = 8):
+        """
+        Инициализация импорта.
+
+        Args:
+            images_dir: Папка, относительно которой ищутся изображения
+            batch_size: Количество строк в одной пачке записи
+            workers: Количество потоков обработки изображений
+        """
+        self.images_dir = Path(images_dir) if images_dir else None
+        self.batch_size = batch_size
+        self.workers = workers
+        self._stored_images: Dict[str, Optional[str]] = {}
+        # is_sold новых объектов без признака продажи (None - по умолчанию модели)
+        self._new_is_sold: Optional[bool] = None
+
+    def import_file(self, stream, file_format: str) -> ImportResult:
+        """
+        Импорт файла.
+
+        Args:
+            stream: Бинарный поток файла
+            file_format: 'csv' или 'xml'
+
+        Returns:
+            ImportResult: Количество созданных и обновленных объектов, ошибки
+
+        Raises:
+            ET.ParseError, UnicodeDecodeError, csv.Error: Если файл не удалось
+                дочитать (см. READ_ERRORS); пачки до ошибки уже записаны
+        """
+        rows = parse_csv(stream) if file_format == 'csv' else parse_realty_xml(stream)
+        self._new_is_sold = False if file_format == 'xml' else None
+        result = ImportResult()
+        batch = []
+        try:
+            for line, row in rows:
+                batch.append((line, row))
+                if len(batch) >= self.batch_size:
+                    self._write_batch(batch, result)
+                    batch = []
+            if batch:
+                self._write_batch(batch, result)
+        finally:
+            if result.created or result.updated:
+                self._invalidate_caches()
+        logger.info(
+            f'Импорт объектов: создано {result.created}, обновлено {result.updated}, '
+            f'без изменений {result.unchanged}, изображений {result.images}, пропущено {result.skipped}'
+        )
+        return result
+
+    def _write_batch(self, batch: list, result: ImportResult):
+        """
+        Запись пачки строк: изображения в пуле потоков, затем bulk_create/bulk_update.
+        """
+        valid = []
+        for line, row in batch:
+            try:
+                valid.append((line, self._clean(row)))
+            except PropertyImportError as e:
+                result.errors.append(f'Строка {line}: {e}')
+
+        paths = {row['image'] for _, row in valid if row['image'] and row['image'] not in self._stored_images}
+        if paths:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for path, name in zip(paths, pool.map(self._store_image, paths)):
+                    self._stored_images[path] = name
+            result.images += sum(1 for path in paths if self._stored_images[path])
+
+        # Последнее вхождение external_id в пачке побеждает
+        rows = {row['external_id']: (line, row) for line, row in valid}
+        existing = Property.objects.in_bulk(list(rows), field_name='external_id')
+
+        now = timezone.now()
+        to_create, to_update = [], []
+        for external_id, (line, row) in rows.items():
+            source = row.pop('image')
+            image = self._stored_images.get(source) if source else None
+            obj = existing.get(external_id)
+            if row['is_sold'] is None:
+                if obj is None and self._new_is_sold is not None:
+                    row['is_sold'] = self._new_is_sold
+                else:
+                    del row['is_sold']
+            if obj is None:
+                if not image:
+                    result.errors.append(f'Строка {line}: нет изображения для нового объекта')
+                    continue
+                to_create.append(Property(**row, image=image))
+            else:
+                if image:
+                    row['image'] = image
+                if all(getattr(obj, name) == value for name, value in row.items()):
+                    # Повторный импорт без изменений не трогает строку в БД
+                    result.unchanged += 1
+                    continue
+                for name, value in row.items():
+                    setattr(obj, name, value)
+                # bulk_update не проставляет auto_now
+                obj.updated_at = now
+                to_update.append(obj)
+
+        with transaction.atomic():
+            Property.objects.bulk_create(to_create, batch_size=self.batch_size)
+            Property.objects.bulk_update(to_update, UPDATE_FIELDS, batch_size=self.batch_size)
+        result.created += len(to_create)
+        result.updated += len(to_update)
+
+    def _clean(self, row: dict) -> dict:
+        """
+        Проверка и приведение значений строки к полям модели.
+
+        Raises:
+            PropertyImportError: Если обязательное поле отсутствует или некорректно
+        """
+        external_id = (row.get('external_id') or '').strip()
+        if not external_id:
+            raise PropertyImportError('не указан external_id')
+        if len(external_id) > 100:
+            raise PropertyImportError('external_id длиннее 100 символов')
+
+        try:
+            price = Decimal(str(row.get('price') or '').replace(' ', '').replace(',', '.'))
+        except InvalidOperation:
+            raise PropertyImportError(f'некорректная цена {row.get("price")!r}')
+        if not price.is_finite() or price < 0 or price >= MAX_PRICE:
+            raise PropertyImportError(f'цена вне допустимого диапазона {row.get("price")!r}')
+
+        raw_type = (row.get('property_type') or '').strip().lower()
+        property_type = _PROPERTY_TYPES.get(raw_type, PropertyType.APARTMENT if not raw_type else None)
+        if property_type is None:
+            raise PropertyImportError(f'неизвестный тип недвижимости {row.get("property_type")!r}')
+
+        location = (row.get('location') or '').strip()
+        if not location:
+            raise PropertyImportError('не указано местоположение')
+        title = (row.get('title') or '').strip() or f'{PropertyType(property_type).label}, {location}'
+
+        is_sold = (row.get('is_sold') or '').strip().lower()
+        order = (row.get('order') or '').strip()
+        return {
+            'external_id': external_id,
+            'title': title[:200],
+            'description': (row.get('description') or '').strip() or None,
+            'location': location[:300],
+            'price': price,
+            'property_type': property_type,
+            'is_sold': is_sold in _TRUE_VALUES if is_sold else None,
+            'order': int(order) if order.isdigit() else 0,
+            'image': (row.get('image') or '').strip(),
+        }
+
+    def _store_image(self, source: str) -> Optional[str]:
+        """
+        Сохранение изображения под именем по хешу содержимого.
+
+        Вызывается из пула потоков. Файл, уже загруженный ранее (тот же
+        хеш), повторно не записывается.
+
+        Args:
+            source: Путь к файлу или URL, имя файла из которого ищется в images_dir
+
+        Returns:
+            str | None: Имя файла в хранилище или None, если файл не найден
+        """
+        path = self._resolve_image_path(source)
+        if path is None:
+            logger.warning(f'Изображение {source} не найдено')
+            return None
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            name = f'{IMAGE_UPLOAD_DIR}/{digest.hexdigest()}{path.suffix.lower()}'
+            if not default_storage.exists(name):
+                f.seek(0)
+                name = default_storage.save(name, File(f))
+        return name
+
+    def _resolve_image_path(self, source: str) -> Optional[Path]:
+        """
+        Путь изображения в images_dir: относительно папки или по имени из URL.
+
+        Пути, которые выходят за пределы images_dir (абсолютные, с «..»,
+        через символические ссылки), отклоняются.
+        """
+        if self.images_dir is None:
+            return None
+        if urlparse(source).scheme in ('http', 'https'):
+            source = Path(urlparse(source).path).name
+        root = self.images_dir.resolve()
+        candidate = (root / source).resolve()
+        if not candidate.is_relative_to(root):
+            logger.warning(f'Изображение {source} вне папки {root}, пропущено')
+            return None
+        return candidate if candidate.is_file() else None
+
+    @staticmethod
+    def _invalidate_caches():
+        """
+        Сброс кэшей, которые при обычном сохранении сбрасывают сигналы.
+        """
+        page_cache.bump_content_version()
+        property_facets.refresh_facets()
+        realty_feed.mark_stale()
+        feeds.invalidate()
+
+
+def parse_csv(stream) -> Iterator[tuple]:
+    """
+    Потоковое чтение CSV (разделитель , или ; определяется по заголовку).
+
+    Args:
+        stream: Бинарный поток файла
+
+    Yields:
+        tuple: (номер строки, словарь значений)
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    header = text.readline()
+    delimiter = ';' if header.count(';') > header.count(',') else ','
+    columns = [name.strip().lower() for name in next(csv.reader([header], delimiter=delimiter))]
+    reader = csv.DictReader(text, fieldnames=columns, delimiter=delimiter)
+    for line, row in enumerate(reader, start=2):
+        yield line, row
+
+
+def parse_realty_xml(stream) -> Iterator[tuple]:
+    """
+    Потоковое чтение XML-фида в формате Яндекс.Недвижимости.
+
+    Разобранные <offer> удаляются из дерева, поэтому память не растет
+    вместе с размером файла.
+
+    Args:
+        stream: Бинарный поток файла
+
+    Yields:
+        tuple: (порядковый номер объявления, словарь значений)
+    """
+    number = 0
+    root = None
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        if root is None:
+            root = element
+        if event != 'end' or _local_name(element.tag) != 'offer':
+            continue
+        number += 1
+        yield number, {
+            'external_id': element.get('internal-id'),
+            'title': None,
+            'description': _text(element.find('{*}description')),
+            'location': _text(element.find('{*}location/{*}address'))
+            or _text(element.find('{*}location/{*}locality-name')),
+            'price': _text(element.find('{*}price/{*}value')),
+            'property_type': _text(element.find('{*}category')),
+            'image': _text(element.find('{*}image')),
+            'is_sold': None,
+            'order': None,
+        }
+        root.clear()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element) -> Optional[str]:
+    if element is None or element.text is None:
+        return None
+    return element.text.strip()
@@ -0,0 +1,238 @@
+"""
+Отложенная публикация статей.
+
+Статья с `published_at` в будущем скрыта до наступления этой даты.
+Кэш страниц об этом моменте не знает, поэтому:
+
+- время жизни страниц в кэше ограничивается ближайшей публикацией
+  (см. cap_timeout), и устаревший список статей не переживет ее;
+- PublishScheduler в отдельном процессе просыпается ровно к моменту
+  публикации и увеличивает версию контента, сбрасывая главную, список
+  статей и остальные страницы всех воркеров, и добавляет статью
+  в sitemap и RSS/Atom ленту.
+
+Тот же процесс выполняет регулярные задачи обслуживания (PeriodicTask),
+например перенос старых заявок в архив.
+
+Время последней проверки и следующего запуска задач хранится в общем
+кэше, поэтому запуск из cron (run_once() в новом процессе) не сбрасывает
+кэш страниц каждый раз и не запускает задачи чаще их периода.
+"""
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import Article
+from landing.services.page_cache import bump_content_version
+
+
+NEXT_PUBLISH_KEY = 'landing:next_publish_at'
+CHECKED_AT_KEY = 'landing:publish_checked_at'
+TASK_NEXT_RUN_KEY = 'landing:periodic_task:{name}'
+
+# Значение в кэше, означающее «запланированных публикаций нет»
+_NO_SCHEDULED = 0
+
+
+def get_next_publish_at() -> Optional[datetime]:
+    """
+    Дата ближайшей запланированной публикации.
+
+    Значение кэшируется до наступления этой даты или до изменения статей.
+
+    Returns:
+        datetime | None: Дата публикации или None, если ничего не запланировано
+    """
+    now = timezone.now()
+    cached = cache.get(NEXT_PUBLISH_KEY)
+    if cached is not None and (cached == _NO_SCHEDULED or cached > now.timestamp()):
+        return None if cached == _NO_SCHEDULED else datetime.fromtimestamp(cached, tz=dt_timezone.utc)
+
+    next_publish_at = (
+        Article.objects.filter(is_published=True, published_at__gt=now)
+        .order_by('published_at')
+        .values_list('published_at', flat=True)
+        .first()
+    )
+    value = next_publish_at.timestamp() if next_publish_at else _NO_SCHEDULED
+    cache.set(NEXT_PUBLISH_KEY, value, timeout=None)
+    return next_publish_at
+
+
+def reset_next_publish_at():
+    """
+    Сброс закэшированной даты ближайшей публикации (статьи изменились).
+    """
+    cache.delete(NEXT_PUBLISH_KEY)
+
+
+def cap_timeout(timeout: int) -> int:
+    """
+    Ограничение времени жизни кэша моментом ближайшей публикации.
+
+    Args:
+        timeout: Желаемое время жизни в секундах
+
+    Returns:
+        int: Время жизни, не превышающее время до ближайшей публикации
+    """
+    next_publish_at = get_next_publish_at()
+    if next_publish_at is None:
+        return timeout
+    seconds = math.ceil((next_publish_at - timezone.now()).total_seconds())
+    return max(1, min(timeout, seconds))
+
+
+@dataclass
+class PeriodicTask:
+    """
+    Регулярная задача фонового процесса.
+
+    Attributes:
+        name: Название для логов
+        func: Функция без аргументов
+        interval: Период запуска (секунды)
+        next_run: Время следующего запуска, timestamp (0 - по значению в кэше или сразу)
+    """
+    name: str
+    func: Callable[[], object]
+    interval: float
+    next_run: float = 0.0
+
+
+class PublishScheduler:
+    """
+    Планировщик инвалидации кэша страниц к моменту публикации статей.
+
+    Запускается командой `python manage.py run_publish_scheduler` отдельным
+    процессом. Спит до ближайшей публикации, но не дольше interval секунд,
+    чтобы подхватывать статьи, запланированные уже после запуска.
+    Между проверками выполняет регулярные задачи tasks.
+    """
+
+    def __init__(self, interval: int = 60, tasks: Iterable[PeriodicTask] = ()):
+        """
+        Инициализация планировщика.
+
+        Args:
+            interval: Максимальный интервал между проверками (секунды)
+            tasks: Регулярные задачи обслуживания
+        """
+        self.interval = interval
+        self.tasks = list(tasks)
+        self.checked_at = None
+        self._stop = threading.Event()
+
+    def run(self):
+        """
+        Основной цикл (до вызова stop()).
+        """
+        logger.info('Планировщик публикаций запущен')
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.seconds_until_next())
+        logger.info('Планировщик публикаций остановлен')
+
+    def stop(self):
+        """
+        Остановка цикла.
+        """
+        self._stop.set()
+
+    def run_once(self) -> List[str]:
+        """
+        Одна проверка публикаций и запуск наступивших регулярных задач
+        (шаг основного цикла и запуск из cron).
+
+        Returns:
+            list: Slug статей, опубликованных с прошлой проверки
+        """
+        slugs = []
+        try:
+            slugs = self.run_pending()
+        except Exception as e:
+            logger.error(f'Ошибка в планировщике публикаций: {e}')
+        self.run_periodic()
+        return slugs
+
+    def run_pending(self) -> List[str]:
+        """
+        Инвалидация кэша, если с прошлой проверки наступили публикации.
+
+        Время прошлой проверки берется из общего кэша. Если его нет (первый
+        запуск или кэш очищен), кэш страниц сбрасывается безусловно:
+        публикации могли наступить, пока планировщик не работал.
+
+        Returns:
+            list: Slug статей, опубликованных с прошлой проверки
+        """
+        from landing.services import feeds
+
+        now = timezone.now()
+        if self.checked_at is None:
+            checked_at = cache.get(CHECKED_AT_KEY)
+            if checked_at is not None:
+                self.checked_at = datetime.fromtimestamp(checked_at, tz=dt_timezone.utc)
+        articles = []
+        if self.checked_at is not None:
+            articles = list(Article.objects.published(now).filter(published_at__gt=self.checked_at))
+
+        if self.checked_at is None:
+            reset_next_publish_at()
+            bump_content_version()
+            feeds.invalidate()
+        elif articles:
+            reset_next_publish_at()
+            version = bump_content_version()
+            feeds.invalidate()
+            slugs = ', '.join(article.slug for article in articles)
+            logger.info(f'Опубликованы статьи {slugs}, версия кэша страниц: {version}')
+        self.checked_at = now
+        cache.set(CHECKED_AT_KEY, now.timestamp(), timeout=None)
+        return [article.slug for article in articles]
+
+    def run_periodic(self) -> List[str]:
+        """
+        Запуск регулярных задач, время которых наступило.
+
+        Returns:
+            list: Названия запущенных задач
+        """
+        started = []
+        for task in self.tasks:
+            key = TASK_NEXT_RUN_KEY.format(name=task.name)
+            if not task.next_run:
+                task.next_run = cache.get(key) or 0.0
+            now = time.time()
+            if task.next_run > now:
+                continue
+            try:
+                task.func()
+            except Exception as e:
+                logger.error(f'Ошибка в регулярной задаче {task.name}: {e}')
+            task.next_run = now + task.interval
+            cache.set(key, task.next_run, timeout=None)
+            started.append(task.name)
+        return started
+
+    def seconds_until_next(self) -> float:
+        """
+        Время сна до следующей проверки.
+
+        Returns:
+            float: Секунды до ближайшей публикации или регулярной задачи, не больше interval
+        """
+        delay = self.interval
+        next_publish_at = get_next_publish_at()
+        if next_publish_at is not None:
+            delay = min(delay, (next_publish_at - timezone.now()) / timedelta(seconds=1))
+        if self.tasks:
+            delay = min(delay, min(task.next_run for task in self.tasks) - time.time())
+        return max(delay, 0)
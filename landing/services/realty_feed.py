@@ -0,0 +1,237 @@
+"""
+XML-фид объектов недвижимости для порталов (формат Яндекс.Недвижимости).
+
+Фид пишется потоково: XMLGenerator выводит объекты по одному из
+QuerySet.iterator(), поэтому память не растет вместе с каталогом.
+Готовый файл лежит в MEDIA_ROOT/feeds и пересобирается только после
+изменения объектов (см. landing.signals).
+
+Настройки:
+- SITE_URL - домен для ссылок на каталог и изображения (порталы
+  принимают только абсолютные URL);
+- REALTY_FEED_INCLUDE_SOLD - выгружать и проданные объекты (по
+  умолчанию False: в фид попадают активные объекты с is_sold=False,
+  и при каталоге из одних проданных объектов фид пуст).
+
+Отдельных страниц объектов на сайте нет, поэтому <url> объявления -
+каталог, отфильтрованный по адресу объекта, с якорем на его карточку.
+"""
+import os
+from pathlib import Path
+from typing import IO, Optional
+from urllib.parse import urlencode
+from xml.sax.saxutils import XMLGenerator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from loguru import logger
+
+from landing.models import Property
+from landing.models.property import PropertyType
+from landing.services.feeds import absolute_url
+
+
+REALTY_FEED_NAMESPACE = 'http://webmaster.yandex.ru/schemas/feed/realty/2010-06'
+REALTY_FEED_FILENAME = 'yandex_realty.xml'
+
+# Отметка «файл фида соответствует текущим объектам»
+FRESH_KEY = 'landing:realty_feed:fresh'
+LOCK_KEY = 'landing:realty_feed:lock'
+LOCK_TIMEOUT = 300
+
+# Контакты агентства в каждом объявлении
+AGENCY_NAME = 'Бюро Квартир'
+AGENCY_PHONE = '+78142670606'
+AGENCY_EMAIL = 'burokvartir@mail.ru'
+COUNTRY = 'Россия'
+LOCALITY = 'Петрозаводск'
+
+# Категории портала по типу недвижимости
+CATEGORIES = {
+    PropertyType.APARTMENT: 'квартира',
+    PropertyType.HOUSE: 'дом',
+    PropertyType.COTTAGE: 'коттедж',
+    PropertyType.COMMERCIAL: 'коммерческая',
+    PropertyType.LAND: 'участок',
+}
+
+# Размер пачки строк, читаемых из БД за раз
+ITERATOR_CHUNK_SIZE = 500
+
+
+def get_feed_path() -> Path:
+    """
+    Путь к файлу фида.
+
+    Returns:
+        Path: MEDIA_ROOT/feeds/yandex_realty.xml
+    """
+    return Path(settings.MEDIA_ROOT) / 'feeds' / REALTY_FEED_FILENAME
+
+
+def get_include_sold() -> bool:
+    """
+    Выгружать ли проданные объекты в опубликованный фид (настройка REALTY_FEED_INCLUDE_SOLD).
+    """
+    return getattr(settings, 'REALTY_FEED_INCLUDE_SOLD', False)
+
+
+def get_offer_url(obj: Property) -> str:
+    """
+    Ссылка объявления: каталог с фильтром по адресу и якорем на карточку объекта.
+    """
+    query = urlencode({'location': obj.location})
+    return absolute_url(f'{reverse("landing:properties_list")}?{query}#property-{obj.pk}')
+
+
+def write_realty_feed(stream: IO[bytes], include_sold: Optional[bool] = None) -> int:
+    """
+    Потоковая запись фида в бинарный поток.
+
+    Args:
+        stream: Поток для записи (файл, ответ)
+        include_sold: Выгружать и проданные объекты (по умолчанию - REALTY_FEED_INCLUDE_SOLD)
+
+    Returns:
+        int: Количество выгруженных объектов
+    """
+    if include_sold is None:
+        include_sold = get_include_sold()
+    queryset = Property.objects.filter(is_active=True).order_by('order', '-created_at', 'uuid')
+    if not include_sold:
+        queryset = queryset.filter(is_sold=False)
+
+    xml = XMLGenerator(stream, encoding='utf-8', short_empty_elements=True)
+    xml.startDocument()
+    xml.startElement('realty-feed', {'xmlns': REALTY_FEED_NAMESPACE})
+    _element(xml, 'generation-date', _iso(timezone.now()))
+
+    count = 0
+    for obj in queryset.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        _write_offer(xml, obj)
+        count += 1
+
+    xml.endElement('realty-feed')
+    xml.endDocument()
+    return count
+
+
+def build_realty_feed(path: Optional[Path] = None, include_sold: Optional[bool] = None) -> int:
+    """
+    Сборка файла фида (атомарная замена готового файла).
+
+    Args:
+        path: Куда записать фид (по умолчанию get_feed_path())
+        include_sold: Выгружать и проданные объекты (по умолчанию - REALTY_FEED_INCLUDE_SOLD)
+
+    Returns:
+        int: Количество выгруженных объектов
+    """
+    if include_sold is None:
+        include_sold = get_include_sold()
+    target = Path(path) if path else get_feed_path()
+    is_published_feed = path is None and include_sold == get_include_sold()
+    if is_published_feed:
+        # Отметка ставится до чтения объектов: изменение во время сборки ее снимет
+        cache.set(FRESH_KEY, True, timeout=None)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f'.{target.name}.{os.getpid()}.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            count = write_realty_feed(f, include_sold=include_sold)
+        os.replace(temp_path, target)
+    except Exception:
+        if is_published_feed:
+            cache.delete(FRESH_KEY)
+        raise
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+    logger.info(f'XML-фид объектов собран: {target} ({count} объектов)')
+    if not count and not include_sold:
+        logger.warning(
+            'XML-фид объектов пуст: нет активных непроданных объектов '
+            '(проданные выгружаются при REALTY_FEED_INCLUDE_SOLD=True)'
+        )
+    return count
+
+
+def get_realty_feed() -> Path:
+    """
+    Актуальный файл фида (со сборкой, если объекты изменились).
+
+    Returns:
+        Path: Путь к файлу фида
+    """
+    path = get_feed_path()
+    if cache.get(FRESH_KEY) and path.exists():
+        return path
+
+    # Один процесс собирает фид, остальные отдают предыдущую версию файла
+    if cache.add(LOCK_KEY, True, timeout=LOCK_TIMEOUT) or not path.exists():
+        try:
+            build_realty_feed()
+        finally:
+            cache.delete(LOCK_KEY)
+    return path
+
+
+def mark_stale():
+    """
+    Отметка, что фид нужно пересобрать.
+    """
+    cache.delete(FRESH_KEY)
+
+
+def _write_offer(xml: XMLGenerator, obj: Property):
+    """
+    Запись одного объявления <offer>.
+    """
+    # external_id - ключ импорта (landing.services.property_import): повторный
+    # импорт фида обновляет объекты, а ID совпадает с известным порталу
+    xml.startElement('offer', {'internal-id': obj.external_id or str(obj.pk)})
+    _element(xml, 'type', 'продажа')
+    if obj.property_type != PropertyType.COMMERCIAL:
+        _element(xml, 'property-type', 'жилая')
+    _element(xml, 'category', CATEGORIES.get(obj.property_type, 'квартира'))
+    _element(xml, 'url', get_offer_url(obj))
+    _element(xml, 'creation-date', _iso(obj.created_at))
+    _element(xml, 'last-update-date', _iso(obj.updated_at))
+
+    xml.startElement('location', {})
+    _element(xml, 'country', COUNTRY)
+    _element(xml, 'locality-name', LOCALITY)
+    _element(xml, 'address', obj.location)
+    xml.endElement('location')
+
+    xml.startElement('sales-agent', {})
+    _element(xml, 'organization', AGENCY_NAME)
+    _element(xml, 'phone', AGENCY_PHONE)
+    _element(xml, 'email', AGENCY_EMAIL)
+    _element(xml, 'category', 'agency')
+    xml.endElement('sales-agent')
+
+    xml.startElement('price', {})
+    _element(xml, 'value', f'{obj.price:.0f}')
+    _element(xml, 'currency', 'RUR')
+    xml.endElement('price')
+
+    if obj.image:
+        _element(xml, 'image', absolute_url(obj.image.url))
+    if obj.description:
+        _element(xml, 'description', obj.description)
+    xml.endElement('offer')
+
+
+def _element(xml: XMLGenerator, name: str, text: str):
+    xml.startElement(name, {})
+    xml.characters(text)
+    xml.endElement(name)
+
+
+def _iso(value) -> str:
+    return timezone.localtime(value).isoformat(timespec='seconds')
@@ -0,0 +1,187 @@
+"""
+Отсев спама и флуда формой заявки до записи в БД и отправки в Telegram.
+
+Проверки идут от самых дешевых к более дорогим и останавливаются
+на первой сработавшей:
+
+1. honeypot - скрытое поле, которое заполняют только боты;
+2. токен формы - подписанное время выдачи формы: без него, с чужой
+   подписью или быстрее FORM_MIN_FILL_SECONDS заявка не принимается.
+   В HTML (общий кэш страниц) лежит токен времени рендера, а скрипт
+   страницы при первом фокусе на форме получает свежий токен
+   с /form-token/, поэтому время заполнения измеряется от начала ввода.
+   Слишком быструю отправку (например, после автозаполнения) посетитель
+   видит и может повторить с тем же токеном через несколько секунд;
+3. формат телефона;
+4. token bucket по IP и общий token bucket в общем кэше. IP берется
+   из X-Real-IP только для запросов от доверенных прокси
+   (settings.TRUSTED_PROXIES).
+
+Каждый отказ учитывается в счетчике FORM_REJECTED с причиной
+(см. landing.services.counters).
+"""
+import math
+import secrets
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+from landing.services import counters
+from landing.services.phones import normalize_phone
+
+
+HONEYPOT_FIELD = 'website'
+TOKEN_FIELD = 'form_token'
+TOKEN_SALT = 'landing.application-form'
+
+# Заявку быстрее этого времени после выдачи формы, скорее всего, отправляет скрипт (секунды)
+FORM_MIN_FILL_SECONDS = 3
+# Срок действия токена: страница в кэше живет не дольше PAGE_CACHE_TIMEOUT
+FORM_TOKEN_MAX_AGE = 24 * 3600
+
+# Token bucket: емкость и время восстановления одного токена (секунды)
+IP_BUCKET = (5, 120)
+GLOBAL_BUCKET = (60, 10)
+BUCKET_KEY = 'landing:form_bucket:{scope}'
+
+# Причины отказа
+HONEYPOT = 'honeypot'
+BAD_TOKEN = 'bad_token'
+EXPIRED_TOKEN = 'expired_token'
+TOO_FAST = 'too_fast'
+BAD_PHONE = 'bad_phone'
+IP_LIMIT = 'ip_limit'
+GLOBAL_LIMIT = 'global_limit'
+
+# Отказы, о которых отправителю не сообщается: бот видит обычный успех
+SILENT_REJECTIONS = {HONEYPOT, BAD_TOKEN}
+
+# REMOTE_ADDR соединений через unix-сокет (в TRUSTED_PROXIES - 'unix')
+_UNIX_SOCKET_ADDRS = {'', 'unix'}
+
+
+def issue_form_token() -> str:
+    """
+    Новый токен формы заявки.
+
+    Returns:
+        str: Подписанные случайное значение и время выдачи
+    """
+    return signing.dumps({'n': secrets.token_urlsafe(16), 't': time.time()}, salt=TOKEN_SALT)
+
+
+def read_form_token(token: str) -> Optional[dict]:
+    """
+    Проверка подписи токена формы.
+
+    Args:
+        token: Значение поля формы
+
+    Returns:
+        dict | None: {'n': случайное значение, 't': время выдачи} или None при неверной подписи
+    """
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT)
+    except signing.BadSignature:
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get('t'), (int, float)):
+        return None
+    return payload
+
+
+def check_submission(request) -> Optional[str]:
+    """
+    Проверка заявки перед обработкой.
+
+    Args:
+        request: POST-запрос формы заявки
+
+    Returns:
+        str | None: Причина отказа или None, если заявку можно принять
+    """
+    reason = _check(request)
+    if reason is not None:
+        counters.increment(counters.FORM_REJECTED, reason)
+    return reason
+
+
+def is_valid_phone(phone: str) -> bool:
+    """
+    Проверка формата телефона: номер приводится к E.164 (см. landing.services.phones).
+    """
+    return normalize_phone(phone) is not None
+
+
+def take_token(scope: str, capacity: int, refill_seconds: float) -> bool:
+    """
+    Списание токена из token bucket в общем кэше.
+
+    Чтение и запись не атомарны: при одновременных запросах из разных
+    воркеров лимит может быть превышен на несколько заявок, что для
+    защиты от флуда допустимо.
+
+    Args:
+        scope: Ключ bucket (IP или 'global')
+        capacity: Емкость bucket
+        refill_seconds: Время восстановления одного токена
+
+    Returns:
+        bool: True, если токен списан (запрос разрешен)
+    """
+    key = BUCKET_KEY.format(scope=scope)
+    now = time.time()
+    tokens, updated_at = cache.get(key) or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated_at) / refill_seconds)
+    if tokens < 1:
+        return False
+    cache.set(key, (tokens - 1, now), timeout=math.ceil(capacity * refill_seconds))
+    return True
+
+
+def get_client_ip(request) -> str:
+    """
+    IP посетителя.
+
+    Заголовок X-Real-IP (nginx, см. proxy_params) учитывается только для
+    запросов от адресов из settings.TRUSTED_PROXIES: иначе посетитель
+    подставил бы в него любой IP и обошел лимит заявок.
+    """
+    remote_addr = request.META.get('REMOTE_ADDR') or ''
+    real_ip = request.META.get('HTTP_X_REAL_IP', '').strip()
+    if real_ip and _is_trusted_proxy(remote_addr):
+        return real_ip[:64]
+    return (remote_addr or 'unknown')[:64]
+
+
+def _is_trusted_proxy(remote_addr: str) -> bool:
+    trusted = getattr(settings, 'TRUSTED_PROXIES', [])
+    if remote_addr in _UNIX_SOCKET_ADDRS:
+        return 'unix' in trusted
+    return remote_addr in trusted
+
+
+def _check(request) -> Optional[str]:
+    if request.POST.get(HONEYPOT_FIELD):
+        return HONEYPOT
+
+    payload = read_form_token(request.POST.get(TOKEN_FIELD, ''))
+    if payload is None:
+        return BAD_TOKEN
+    age = time.time() - payload['t']
+    if age > FORM_TOKEN_MAX_AGE:
+        return EXPIRED_TOKEN
+    if age < FORM_MIN_FILL_SECONDS:
+        return TOO_FAST
+
+    phone = request.POST.get('phone', '').strip()
+    if phone and not is_valid_phone(phone):
+        return BAD_PHONE
+
+    if not take_token(f'ip:{get_client_ip(request)}', *IP_BUCKET):
+        return IP_LIMIT
+    if not take_token('global', *GLOBAL_BUCKET):
+        return GLOBAL_LIMIT
+    return None
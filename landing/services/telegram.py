@@ -138,7 +138,7 @@ class TelegramService:
             }
     
     
-    def send_application(self, name: str, phone: str, message: str = '') -> dict:
+    def send_application(self, name: str, phone: str, message: str = '', history: str = '') -> dict:
         """
         Отправка заявки от клиента в Telegram.
         
@@ -148,6 +148,7 @@ class TelegramService:
             name: Имя клиента
             phone: Телефон клиента
             message: Сообщение от клиента (опционально)
+            history: Сведения о прошлых заявках клиента (опционально)
         
         Returns:
             dict: Результат отправки
@@ -159,6 +160,9 @@ class TelegramService:
 <b>Телефон:</b> {phone}
 """
         
+        if history:
+            text += f"<b>Повторное обращение:</b> {history}\n"
+        
         if message:
             text += f"\n<b>Сообщение:</b>\n{message}"
         
@@ -0,0 +1,142 @@
+"""
+Обработчики сигналов landing приложения.
+"""
+from django.db import connections
+from django.db.models.signals import post_delete, post_init, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+from loguru import logger
+
+from landing.models import Application, Article, Property, Service, TeamMember
+from landing.services.page_cache import (
+    bump_content_version,
+    delete_article_version,
+    set_article_version,
+)
+from landing.services import application_stats, counters, feeds, full_text_search, property_facets, realty_feed
+from landing.services.publishing import reset_next_publish_at
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=Property)
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=Service)
+@receiver(post_delete, sender=Property)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_page_cache(sender, **kwargs):
+    """
+    Инвалидация кэша HTML-страниц при изменении публичного контента.
+    """
+    version = bump_content_version()
+    logger.debug(f'Контент {sender.__name__} изменен, версия кэша страниц: {version}')
+
+
+@receiver(pre_save, sender=Article)
+def forget_old_article_slug(sender, instance, **kwargs):
+    """
+    Сброс версии страницы статьи по старому адресу при смене slug
+    и перенос счетчика просмотров на новый slug.
+    """
+    if instance._state.adding:
+        return
+    old_slug = Article.objects.filter(pk=instance.pk).values_list('slug', flat=True).first()
+    if old_slug and old_slug != instance.slug:
+        delete_article_version(old_slug)
+        counters.rename_key(counters.ARTICLE_VIEW, old_slug, instance.slug)
+
+
+@receiver(post_save, sender=Article)
+def update_article_version(sender, instance, **kwargs):
+    """
+    Новая версия страницы статьи (в т.ч. при снятии с публикации).
+    """
+    set_article_version(instance)
+
+
+@receiver(post_delete, sender=Article)
+def drop_article_version(sender, instance, **kwargs):
+    """
+    Сброс версии страницы удаленной статьи.
+    """
+    delete_article_version(instance.slug)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def reset_publish_schedule(sender, **kwargs):
+    """
+    Сброс даты ближайшей публикации (могла измениться дата или статус статьи).
+    """
+    reset_next_publish_at()
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def invalidate_feeds(sender, **kwargs):
+    """
+    Пересборка sitemap и ленты при следующем запросе.
+    """
+    feeds.invalidate()
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def refresh_property_facets(sender, **kwargs):
+    """
+    Пересчет счетчиков фасетов каталога объектов.
+    """
+    property_facets.refresh_facets()
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def mark_realty_feed_stale(sender, **kwargs):
+    """
+    XML-фид для порталов будет пересобран при следующем запросе.
+    """
+    realty_feed.mark_stale()
+
+
+@receiver(post_init, sender=Application)
+def remember_application_stats_state(sender, instance, **kwargs):
+    """
+    Вклад загруженной заявки в статистику (для сравнения при сохранении).
+    """
+    instance._stats_state = application_stats.get_state(instance)
+
+
+@receiver(pre_save, sender=Application)
+def load_application_stats_state(sender, instance, **kwargs):
+    """
+    Вклад заявки из БД, если она загружена без нужных полей.
+    """
+    if not instance._state.adding and getattr(instance, '_stats_state', None) is None:
+        instance._stats_state = application_stats.load_state(instance.pk)
+
+
+@receiver(post_save, sender=Application)
+def update_application_stats(sender, instance, created, **kwargs):
+    """
+    Инкрементальное обновление дневной статистики заявок.
+    """
+    old = None if created else getattr(instance, '_stats_state', None)
+    new = application_stats.get_state(instance) or application_stats.load_state(instance.pk)
+    if old != new:
+        application_stats.record_change(old, new)
+    instance._stats_state = new
+
+
+@receiver(post_migrate)
+def repair_search_indexes(sender, using, **kwargs):
+    """
+    Восстановление триггеров полнотекстового поиска после миграций
+    (SQLite удаляет их при пересоздании таблицы в AlterField).
+    """
+    if sender.name != 'landing':
+        return
+    repaired = full_text_search.repair_indexes(connections[using])
+    if repaired:
+        logger.warning(f'Восстановлены триггеры полнотекстового поиска: {", ".join(repaired)}')
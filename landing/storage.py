@@ -0,0 +1,58 @@
+"""
+Хранилище статических файлов с пересборкой критического CSS.
+"""
+from django.core.files.base import ContentFile
+from loguru import logger
+
+try:
+    from whitenoise.storage import CompressedManifestStaticFilesStorage as BaseManifestStorage
+except ImportError:
+    # WhiteNoise не установлен - используем стандартный манифест Django
+    from django.contrib.staticfiles.storage import ManifestStaticFilesStorage as BaseManifestStorage
+
+from landing.services.critical_css import CRITICAL_CSS_DIR, SOURCE_CSS, build_critical_css
+
+
+class CriticalCSSManifestStaticFilesStorage(BaseManifestStorage):
+    """
+    Манифест-хранилище, которое после collectstatic собирает критический CSS.
+
+    CSS извлекается из уже захешированной копии style.css, поэтому
+    инлайн-стили всегда соответствуют файлу, указанному в манифесте.
+    """
+
+    def post_process(self, *args, **kwargs):
+        """
+        Пост-обработка статики с последующей сборкой критического CSS.
+        """
+        yield from super().post_process(*args, **kwargs)
+
+        if kwargs.get('dry_run'):
+            return
+
+        try:
+            self.build_critical_css()
+        except Exception as e:
+            logger.error(f'Не удалось собрать критический CSS: {e}')
+
+    def build_critical_css(self) -> dict:
+        """
+        Сборка и сохранение критического CSS для всех страниц.
+
+        Returns:
+            dict: Размер собранного CSS в байтах по имени страницы
+        """
+        source_name = self.stored_name(SOURCE_CSS)
+        with self.open(source_name) as f:
+            css = f.read().decode('utf-8')
+
+        sizes = {}
+        for page, critical_css in build_critical_css(css, source_name).items():
+            name = f'{CRITICAL_CSS_DIR}/{page}.css'
+            if self.exists(name):
+                self.delete(name)
+            content = critical_css.encode('utf-8')
+            self._save(name, ContentFile(content))
+            sizes[page] = len(content)
+            logger.info(f'Критический CSS для {page}: {len(content)} байт')
+        return sizes
@@ -0,0 +1,102 @@
+"""
+Загрузчик шаблонов с минификацией HTML на этапе компиляции.
+"""
+import re
+from pathlib import Path
+
+from django.template.loaders.cached import Loader as CachedLoader
+
+
+# Фрагменты, которые переносятся в результат без изменений:
+# содержимое <pre>/<textarea>/<script>/<style> и теги шаблонизатора Django.
+# HTML-комментарии обрабатываются отдельно (см. _minify_protected).
+_PROTECTED_RE = re.compile(
+    r'<(pre|textarea|script|style)\b.*?</\1\s*>'
+    r'|{%\s*verbatim\s*%}.*?{%\s*endverbatim\s*%}'
+    r'|{%.*?%}|{{.*?}}|{#.*?#}'
+    r'|<!--.*?-->',
+    re.S | re.I,
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def minify_html(source: str) -> str:
+    """
+    Безопасная минификация исходника HTML-шаблона.
+
+    Схлопывает последовательности пробельных символов в один символ
+    и удаляет HTML-комментарии. Содержимое <pre>, <textarea>, <script>,
+    <style> и теги Django ({% %}, {{ }}, {# #}) не изменяются.
+
+    Args:
+        source: Исходный текст шаблона
+
+    Returns:
+        str: Минифицированный текст шаблона
+    """
+    parts = []
+    position = 0
+    for match in _PROTECTED_RE.finditer(source):
+        parts.append(_collapse(source[position:match.start()]))
+        parts.append(_minify_protected(match.group(0)))
+        position = match.end()
+    parts.append(_collapse(source[position:]))
+    return ''.join(parts).strip()
+
+
+def _collapse(text: str) -> str:
+    """
+    Схлопывание пробельных символов: перевод строки сохраняется как один символ.
+    """
+    return _WHITESPACE_RE.sub(lambda m: '\n' if '\n' in m.group(0) else ' ', text)
+
+
+def _minify_protected(fragment: str) -> str:
+    """
+    Обработка защищенного фрагмента.
+
+    HTML-комментарии удаляются, кроме условных (<!--[if IE]>) и тех,
+    внутри которых есть теги Django - их удаление могло бы нарушить
+    структуру блоков шаблона.
+    """
+    if not fragment.startswith('<!--'):
+        return fragment
+    if fragment.startswith('<!--[if') or '{%' in fragment:
+        return fragment
+    return ''
+
+
+class MinifyingCachedLoader(CachedLoader):
+    """
+    Кэширующий загрузчик Django, минифицирующий исходник шаблона.
+
+    Минификация выполняется только при компиляции шаблона (промах кэша),
+    поэтому на каждый запрос дополнительных затрат нет. Обрабатываются
+    только .html-шаблоны проекта из TEMPLATES['DIRS'], шаблоны админки
+    и сторонних приложений отдаются как есть.
+    """
+
+    def get_contents(self, origin):
+        """
+        Получение исходника шаблона с минификацией.
+
+        Args:
+            origin: Источник шаблона
+
+        Returns:
+            str: Исходник шаблона
+        """
+        contents = super().get_contents(origin)
+        if self._should_minify(origin):
+            return minify_html(contents)
+        return contents
+
+    def _should_minify(self, origin) -> bool:
+        """
+        Проверка, что шаблон принадлежит проекту и является HTML.
+        """
+        name = str(origin.name)
+        if not name.endswith('.html'):
+            return False
+        path = Path(name).resolve()
+        return any(path.is_relative_to(Path(directory).resolve()) for directory in self.engine.dirs)
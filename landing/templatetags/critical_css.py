@@ -0,0 +1,40 @@
+"""
+Шаблонные теги для инлайна критического CSS.
+"""
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from landing.services.critical_css import SOURCE_CSS, get_critical_css
+
+register = template.Library()
+
+
+@register.simple_tag
+def critical_css(page: str):
+    """
+    Вывод критического CSS страницы и асинхронной загрузки полного style.css.
+
+    Если критический CSS недоступен, подключает style.css обычным
+    блокирующим <link>, как раньше.
+
+    Args:
+        page: Имя страницы из CRITICAL_CSS_PAGES
+
+    Returns:
+        SafeString: HTML для вставки в <head>
+    """
+    href = static(SOURCE_CSS)
+    css = get_critical_css(page)
+    if not css:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+
+    return format_html(
+        '<style>{}</style>'
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(css.replace('</', '<\\/')),
+        href,
+        href,
+    )
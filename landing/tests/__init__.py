@@ -0,0 +1,3 @@
+"""
+Тесты приложения landing (python manage.py test landing).
+"""
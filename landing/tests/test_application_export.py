@@ -0,0 +1,67 @@
+"""
+Тесты выгрузки заявок в CSV и XLSX.
+"""
+import csv
+import io
+import xml.etree.ElementTree as ET
+import zipfile
+
+from django.test import TestCase
+
+from landing.models import Application
+from landing.services.application_export import COLUMNS, stream_csv, stream_xlsx
+
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+class ApplicationExportTests(TestCase):
+    """
+    Экранирование значений в выгрузке.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Application.objects.create(
+            name='=HYPERLINK("http://example.com","Открыть")',
+            phone='+7 (999) 123-45-67',
+            message='@SUM(A1:A2)',
+        )
+        Application.objects.create(name='-2+3', phone='+79991234568', message='\tтекст\x07 <b>&</b>')
+
+    def read_csv(self):
+        content = b''.join(stream_csv(Application.objects.all())).decode('utf-8')
+        self.assertTrue(content.startswith('\ufeff'))
+        rows = list(csv.reader(io.StringIO(content[1:]), delimiter=';'))
+        self.assertEqual(rows[0], [header for header, _ in COLUMNS])
+        return {row[1]: row for row in rows[1:]}
+
+    def test_csv_escapes_formulas(self):
+        rows = self.read_csv()
+        formula = rows['\'=HYPERLINK("http://example.com","Открыть")']
+        self.assertEqual(formula[5], "'@SUM(A1:A2)")
+        arithmetic = rows["'-2+3"]
+        self.assertEqual(arithmetic[5], "'\tтекст\x07 <b>&</b>")
+
+    def test_csv_keeps_phones(self):
+        rows = self.read_csv()
+        formula = rows['\'=HYPERLINK("http://example.com","Открыть")']
+        self.assertEqual(formula[2:4], ['+7 (999) 123-45-67', '+79991234567'])
+        self.assertEqual(rows["'-2+3"][3], '+79991234568')
+
+    def test_xlsx_inline_strings(self):
+        content = b''.join(stream_xlsx(Application.objects.all()))
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            self.assertIsNone(archive.testzip())
+            sheet = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        rows = [
+            [cell.findtext(f'{SHEET_NS}is/{SHEET_NS}t') for cell in row]
+            for row in sheet.iter(f'{SHEET_NS}row')
+        ]
+        self.assertEqual(rows[0], [header for header, _ in COLUMNS])
+        cells = {value for row in rows[1:] for value in row}
+        # Значения пишутся как есть (inline-строки не вычисляются), недопустимые в XML символы удаляются
+        self.assertIn('=HYPERLINK("http://example.com","Открыть")', cells)
+        self.assertIn('\tтекст <b>&</b>', cells)
+        self.assertTrue(all(cell.get('t') == 'inlineStr' for cell in sheet.iter(f'{SHEET_NS}c')))
@@ -0,0 +1,67 @@
+"""
+Тесты keyset пагинации.
+"""
+from decimal import Decimal
+
+from django.test import TestCase
+
+from landing.models import Property
+from landing.services.keyset_pagination import InvalidCursor, KeysetPaginator
+
+
+class KeysetPaginatorTests(TestCase):
+    """
+    Обход страниц вперед и назад по курсорам.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # Одинаковые цены проверяют сравнение по второму полю сортировки
+        for index, price in enumerate((10, 20, 20, 20, 30, 40, 50)):
+            Property.objects.create(
+                title=f'Объект {index}',
+                location='Петрозаводск',
+                price=Decimal(price),
+                image='properties/test.jpg',
+            )
+
+    def setUp(self):
+        self.ordering = ('price', '-uuid')
+        self.expected = list(Property.objects.order_by(*self.ordering))
+        self.paginator = KeysetPaginator(Property.objects.all(), self.ordering, per_page=3)
+
+    def test_forward_walk_returns_every_row_once(self):
+        pages = [self.paginator.page()]
+        while pages[-1].has_next:
+            pages.append(self.paginator.page(after=pages[-1].next_cursor))
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([obj for page in pages for obj in page], self.expected)
+        self.assertFalse(pages[0].has_previous)
+        self.assertIsNone(pages[0].previous_cursor)
+        self.assertIsNone(pages[-1].next_cursor)
+
+    def test_backward_walk_mirrors_forward_walk(self):
+        second = self.paginator.page(after=self.paginator.page().next_cursor)
+        last = self.paginator.page(after=second.next_cursor)
+
+        back = self.paginator.page(before=last.previous_cursor)
+        self.assertEqual(back.object_list, second.object_list)
+        self.assertTrue(back.has_next)
+        self.assertTrue(back.has_previous)
+
+        first = self.paginator.page(before=back.previous_cursor)
+        self.assertEqual(first.object_list, self.expected[:3])
+        self.assertFalse(first.has_previous)
+
+    def test_cursor_round_trip(self):
+        obj = self.expected[2]
+        values = self.paginator.decode_cursor(self.paginator.cursor_for(obj))
+        self.assertEqual(values, [obj.price, obj.uuid])
+
+    def test_invalid_cursors(self):
+        other_fields = KeysetPaginator(Property.objects.all(), ('price',), per_page=3)
+        for cursor in ('not base64!', 'e30', other_fields.cursor_for(self.expected[0])):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    self.paginator.page(after=cursor)
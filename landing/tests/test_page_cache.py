@@ -0,0 +1,70 @@
+"""
+Тесты кэша страниц со сжатыми вариантами.
+"""
+import gzip
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from landing.services import page_cache
+
+
+class NegotiateEncodingTests(SimpleTestCase):
+    """
+    Выбор кодировки по Accept-Encoding.
+    """
+
+    def setUp(self):
+        # Без brotli отдается gzip
+        self.best = 'br' if page_cache.brotli else 'gzip'
+
+    def test_preferred_encoding(self):
+        self.assertEqual(page_cache.negotiate_encoding('gzip, deflate, br'), self.best)
+        self.assertEqual(page_cache.negotiate_encoding('GZIP'), 'gzip')
+        self.assertEqual(page_cache.negotiate_encoding('*'), self.best)
+
+    def test_quality_values(self):
+        self.assertEqual(page_cache.negotiate_encoding('br;q=0.5, gzip;q=0.8'), 'gzip')
+        self.assertEqual(page_cache.negotiate_encoding('br;q=0, gzip'), 'gzip')
+        self.assertEqual(page_cache.negotiate_encoding('gzip;q=0, *;q=0.1'), 'br' if page_cache.brotli else 'identity')
+
+    def test_identity_fallback(self):
+        for header in ('', 'identity', 'deflate', 'gzip;q=0', 'gzip;q=abc', '*;q=0'):
+            with self.subTest(header=header):
+                self.assertEqual(page_cache.negotiate_encoding(header), 'identity')
+
+    def test_compress_round_trip(self):
+        content = 'Бюро Квартир'.encode('utf-8') * 100
+        encoded = page_cache.compress(content)
+        self.assertEqual(encoded['identity'], content)
+        self.assertEqual(gzip.decompress(encoded['gzip']), content)
+        if page_cache.brotli:
+            self.assertEqual(page_cache.brotli.decompress(encoded['br']), content)
+
+
+class PageCacheMiddlewareTests(TestCase):
+    """
+    Ключ кэша: путь и только параметры, которые читает страница.
+    """
+
+    def setUp(self):
+        cache.clear()
+        page_cache._local_cache.clear()
+
+    def test_unknown_query_parameters_share_the_entry(self):
+        self.assertEqual(self.client.get('/').headers['X-Page-Cache'], 'MISS')
+        for url in ('/?utm_source=test', '/?fbclid=1&utm_medium=cpc'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).headers['X-Page-Cache'], 'HIT')
+
+    def test_view_parameters_are_part_of_the_key(self):
+        self.assertEqual(self.client.get('/properties/?type=flat&utm_source=a').headers['X-Page-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/properties/?utm_source=b&type=flat').headers['X-Page-Cache'], 'HIT')
+        self.assertEqual(self.client.get('/properties/').headers['X-Page-Cache'], 'MISS')
+
+    def test_encoded_variant_is_served(self):
+        response = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        html = gzip.decompress(response.content)
+        self.assertEqual(html, self.client.get('/', HTTP_ACCEPT_ENCODING='identity').content)
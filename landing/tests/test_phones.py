@@ -0,0 +1,44 @@
+"""
+Тесты нормализации телефонов.
+"""
+from django.test import SimpleTestCase
+
+from landing.services.phones import normalize_phone
+
+
+class NormalizePhoneTests(SimpleTestCase):
+    """
+    Приведение телефонов к E.164.
+    """
+
+    def test_russian_formats(self):
+        for phone in (
+            '+7 999 123-45-67',
+            '+7 (999) 123-45-67',
+            '8 (999) 123-45-67',
+            '89991234567',
+            '9991234567',
+            '999.123.45.67',
+            '  +79991234567  ',
+        ):
+            with self.subTest(phone=phone):
+                self.assertEqual(normalize_phone(phone), '+79991234567')
+
+    def test_international_numbers_keep_country_code(self):
+        self.assertEqual(normalize_phone('+44 20 7946 0958'), '+442079460958')
+        self.assertEqual(normalize_phone('+375 29 123-45-67'), '+375291234567')
+
+    def test_invalid_numbers(self):
+        for phone in (
+            '',
+            None,
+            '12345',
+            'позвоните мне',
+            '+7 999 123 45 67 доб. 1',
+            '0123456789',
+            '8 012 345-67-89',
+            '+0123456789',
+            '+1234567890123456',
+        ):
+            with self.subTest(phone=phone):
+                self.assertIsNone(normalize_phone(phone))
@@ -0,0 +1,153 @@
+"""
+Тесты импорта объектов недвижимости.
+"""
+import csv
+import io
+import shutil
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+
+from landing.models import Property
+from landing.models.property import PropertyType
+from landing.services.property_import import PropertyImporter, parse_csv, parse_realty_xml
+
+
+# Минимальный GIF 1x1
+GIF = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+    b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+FEED = '''<?xml version="1.0" encoding="UTF-8"?>
+<realty-feed xmlns="http://webmaster.yandex.ru/schemas/feed/realty/2010-06">
+    <offer internal-id="feed-1">
+        <category>квартира</category>
+        <location><locality-name>Петрозаводск</locality-name><address>ул. Ленина, 1</address></location>
+        <price><value>5000000</value><currency>RUR</currency></price>
+        <image>https://example.com/photos/a.gif</image>
+        <description>Светлая квартира</description>
+    </offer>
+    <offer internal-id="feed-2">
+        <category>дом</category>
+        <location><locality-name>Петрозаводск</locality-name></location>
+        <price><value>7000000</value></price>
+    </offer>
+</realty-feed>'''.encode('utf-8')
+
+
+class ParserTests(TestCase):
+    """
+    Потоковое чтение CSV и XML-фида.
+    """
+
+    def test_csv_semicolon_with_bom(self):
+        content = '\ufeffExternal_ID;Title;Price\n1;Квартира;1 000 000\n2;Дом;2000000\n'.encode('utf-8')
+        rows = list(parse_csv(io.BytesIO(content)))
+        self.assertEqual(rows, [
+            (2, {'external_id': '1', 'title': 'Квартира', 'price': '1 000 000'}),
+            (3, {'external_id': '2', 'title': 'Дом', 'price': '2000000'}),
+        ])
+
+    def test_csv_comma(self):
+        rows = list(parse_csv(io.BytesIO(b'external_id,price\n1,"1,5"\n')))
+        self.assertEqual(rows, [(2, {'external_id': '1', 'price': '1,5'})])
+
+    def test_csv_errors_propagate(self):
+        with self.assertRaises(UnicodeDecodeError):
+            list(parse_csv(io.BytesIO(b'external_id\n\xff\xfe\n')))
+        # Поле длиннее csv.field_size_limit()
+        oversized = b'external_id,title\n1,"' + b'a' * (csv.field_size_limit() + 1) + b'"\n'
+        with self.assertRaises(csv.Error):
+            list(parse_csv(io.BytesIO(oversized)))
+
+    def test_realty_feed(self):
+        rows = list(parse_realty_xml(io.BytesIO(FEED)))
+        self.assertEqual([number for number, _ in rows], [1, 2])
+        first, second = rows[0][1], rows[1][1]
+        self.assertEqual(first['external_id'], 'feed-1')
+        self.assertEqual(first['location'], 'ул. Ленина, 1')
+        self.assertEqual(first['price'], '5000000')
+        self.assertEqual(first['property_type'], 'квартира')
+        self.assertEqual(first['image'], 'https://example.com/photos/a.gif')
+        self.assertEqual(first['description'], 'Светлая квартира')
+        self.assertIsNone(first['is_sold'])
+        # Без адреса - название населенного пункта
+        self.assertEqual(second['location'], 'Петрозаводск')
+        self.assertIsNone(second['image'])
+
+
+class PropertyImporterTests(TestCase):
+    """
+    Запись объектов, проверка строк и поиск изображений.
+    """
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.images_dir = self.tmp / 'images'
+        self.images_dir.mkdir()
+        (self.images_dir / 'a.gif').write_bytes(GIF)
+        (self.tmp / 'outside.gif').write_bytes(GIF)
+        media = override_settings(MEDIA_ROOT=str(self.tmp / 'media'))
+        media.enable()
+        self.addCleanup(media.disable)
+        self.importer = PropertyImporter(images_dir=self.images_dir, workers=1)
+
+    def import_csv(self, text: str):
+        return self.importer.import_file(io.BytesIO(text.encode('utf-8')), 'csv')
+
+    def test_create_then_update_by_external_id(self):
+        result = self.import_csv('external_id,location,price,image,property_type\n1,ул. Ленина,100,a.gif,Дом\n')
+        self.assertEqual((result.created, result.updated, result.skipped), (1, 0, 0))
+        obj = Property.objects.get(external_id='1')
+        self.assertEqual(obj.property_type, PropertyType.HOUSE)
+        self.assertEqual(obj.title, f'{PropertyType.HOUSE.label}, ул. Ленина')
+
+        result = self.import_csv('external_id,location,price\n1,ул. Ленина,200\n')
+        self.assertEqual((result.created, result.updated), (0, 1))
+        self.assertEqual(Property.objects.get(external_id='1').price, Decimal('200'))
+
+        result = self.import_csv('external_id,location,price\n1,ул. Ленина,200\n')
+        self.assertEqual((result.updated, result.unchanged), (0, 1))
+
+    def test_invalid_rows_are_reported(self):
+        result = self.import_csv(
+            'external_id,location,price,image,property_type\n'
+            ',ул. Ленина,100,a.gif,\n'
+            '2,ул. Ленина,много,a.gif,\n'
+            '3,ул. Ленина,100,a.gif,замок\n'
+            '4,,100,a.gif,\n'
+            '5,ул. Ленина,100,missing.gif,\n'
+        )
+        self.assertEqual(result.created, 0)
+        self.assertEqual([error.split(':')[0] for error in result.errors], [
+            'Строка 2', 'Строка 3', 'Строка 4', 'Строка 5', 'Строка 6',
+        ])
+
+    def test_is_sold_defaults(self):
+        self.import_csv('external_id,location,price,image,is_sold\n1,А,100,a.gif,\n2,Б,100,a.gif,нет\n')
+        self.assertTrue(Property.objects.get(external_id='1').is_sold)
+        self.assertFalse(Property.objects.get(external_id='2').is_sold)
+
+        # Существующий объект сохраняет признак, новый из фида портала - непроданный
+        self.importer.import_file(io.BytesIO(FEED.replace(b'feed-1', b'1')), 'xml')
+        self.assertTrue(Property.objects.get(external_id='1').is_sold)
+        self.importer.import_file(io.BytesIO(FEED), 'xml')
+        self.assertFalse(Property.objects.get(external_id='feed-1').is_sold)
+
+    def test_images_outside_images_dir_are_rejected(self):
+        for source in ('a.gif', 'https://example.com/photos/a.gif', str(self.images_dir / 'a.gif')):
+            with self.subTest(source=source):
+                self.assertEqual(self.importer._resolve_image_path(source), (self.images_dir / 'a.gif').resolve())
+        for source in ('../outside.gif', str(self.tmp / 'outside.gif'), 'https://example.com/../../outside.gif'):
+            with self.subTest(source=source):
+                self.assertIsNone(self.importer._resolve_image_path(source))
+
+    def test_identical_images_are_stored_once(self):
+        (self.images_dir / 'b.gif').write_bytes(GIF)
+        self.import_csv('external_id,location,price,image\n1,А,100,a.gif\n2,Б,100,b.gif\n')
+        names = set(Property.objects.values_list('image', flat=True))
+        self.assertEqual(len(names), 1)
@@ -0,0 +1,115 @@
+"""
+Тесты отсева спама формой заявки.
+"""
+import time
+from unittest import mock
+
+from django.core import signing
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from landing.services import spam_guard
+
+
+def make_token(age: float) -> str:
+    """
+    Токен формы, выданный age секунд назад.
+    """
+    return signing.dumps({'n': 'test', 't': time.time() - age}, salt=spam_guard.TOKEN_SALT)
+
+
+@mock.patch('landing.services.spam_guard.counters.increment')
+class CheckSubmissionTests(SimpleTestCase):
+    """
+    Причины отказа check_submission в порядке проверок.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def submit(self, remote_addr='10.0.0.1', **data):
+        fields = {
+            spam_guard.TOKEN_FIELD: make_token(spam_guard.FORM_MIN_FILL_SECONDS + 1),
+            'name': 'Иван',
+            'phone': '+7 999 123-45-67',
+            **data,
+        }
+        return spam_guard.check_submission(self.factory.post('/', fields, REMOTE_ADDR=remote_addr))
+
+    def test_valid_submission(self, increment):
+        self.assertIsNone(self.submit())
+        increment.assert_not_called()
+
+    def test_honeypot(self, increment):
+        self.assertEqual(self.submit(**{spam_guard.HONEYPOT_FIELD: 'http://spam'}), spam_guard.HONEYPOT)
+        increment.assert_called_once_with(spam_guard.counters.FORM_REJECTED, spam_guard.HONEYPOT)
+
+    def test_missing_or_forged_token(self, increment):
+        forged = signing.dumps({'n': 'test', 't': time.time() - 60}, salt='other')
+        for token in ('', 'garbage', forged):
+            with self.subTest(token=token):
+                self.assertEqual(self.submit(**{spam_guard.TOKEN_FIELD: token}), spam_guard.BAD_TOKEN)
+
+    def test_token_age(self, increment):
+        self.assertEqual(self.submit(**{spam_guard.TOKEN_FIELD: make_token(0)}), spam_guard.TOO_FAST)
+        expired = make_token(spam_guard.FORM_TOKEN_MAX_AGE + 1)
+        self.assertEqual(self.submit(**{spam_guard.TOKEN_FIELD: expired}), spam_guard.EXPIRED_TOKEN)
+
+    def test_bad_phone(self, increment):
+        for phone in ('12345', 'позвоните', '0123456789'):
+            with self.subTest(phone=phone):
+                self.assertEqual(self.submit(phone=phone), spam_guard.BAD_PHONE)
+
+    def test_ip_limit(self, increment):
+        capacity, _ = spam_guard.IP_BUCKET
+        for _ in range(capacity):
+            self.assertIsNone(self.submit())
+        self.assertEqual(self.submit(), spam_guard.IP_LIMIT)
+        # Другой IP ограничение не затрагивает
+        self.assertIsNone(self.submit(remote_addr='10.0.0.2'))
+
+
+class TakeTokenTests(SimpleTestCase):
+    """
+    Token bucket в общем кэше.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bucket_empties_and_refills(self):
+        with mock.patch('landing.services.spam_guard.time.time', return_value=1000.0):
+            self.assertTrue(spam_guard.take_token('test', 2, 10))
+            self.assertTrue(spam_guard.take_token('test', 2, 10))
+            self.assertFalse(spam_guard.take_token('test', 2, 10))
+        with mock.patch('landing.services.spam_guard.time.time', return_value=1010.0):
+            self.assertTrue(spam_guard.take_token('test', 2, 10))
+            self.assertFalse(spam_guard.take_token('test', 2, 10))
+
+
+@override_settings(TRUSTED_PROXIES=['unix', '127.0.0.1'])
+class GetClientIpTests(SimpleTestCase):
+    """
+    X-Real-IP учитывается только от доверенных прокси.
+    """
+
+    def get_ip(self, remote_addr, real_ip=''):
+        request = RequestFactory().get('/', REMOTE_ADDR=remote_addr, HTTP_X_REAL_IP=real_ip)
+        return spam_guard.get_client_ip(request)
+
+    def test_trusted_proxy(self):
+        self.assertEqual(self.get_ip('127.0.0.1', '203.0.113.5'), '203.0.113.5')
+        # Unix-сокет gunicorn: REMOTE_ADDR пустой
+        self.assertEqual(self.get_ip('', '203.0.113.5'), '203.0.113.5')
+
+    def test_untrusted_client_cannot_spoof_header(self):
+        self.assertEqual(self.get_ip('198.51.100.7', '203.0.113.5'), '198.51.100.7')
+
+    def test_without_header(self):
+        self.assertEqual(self.get_ip('198.51.100.7'), '198.51.100.7')
+        self.assertEqual(self.get_ip(''), 'unknown')
+
+    @override_settings(TRUSTED_PROXIES=[])
+    def test_no_trusted_proxies(self):
+        self.assertEqual(self.get_ip('127.0.0.1', '203.0.113.5'), '127.0.0.1')
@@ -2,13 +2,33 @@
 URL конфигурация для landing приложения.
 """
 from django.urls import path
-from landing.views import LandingView, ArticlesListView, ArticleDetailView
+from landing.views import (
+    LandingView,
+    ArticlesListView,
+    ArticleSearchView,
+    ArticleDetailView,
+    ServiceWorkerView,
+    FeedDocumentView,
+    PropertyCatalogView,
+    RealtyFeedView,
+    FormTokenView,
+    ApplicationSubmitView,
+)
 
 app_name = 'landing'
 
 urlpatterns = [
     path('', LandingView.as_view(), name='index'),
     path('articles/', ArticlesListView.as_view(), name='articles_list'),
+    path('articles/search/', ArticleSearchView.as_view(), name='article_search'),
+    path('articles/feed/rss/', FeedDocumentView.as_view(document='rss'), name='articles_rss'),
+    path('articles/feed/atom/', FeedDocumentView.as_view(document='atom'), name='articles_atom'),
     path('articles/<slug:slug>/', ArticleDetailView.as_view(), name='article_detail'),
+    path('properties/', PropertyCatalogView.as_view(), name='properties_list'),
+    path('applications/', ApplicationSubmitView.as_view(), name='application_submit'),
+    path('form-token/', FormTokenView.as_view(), name='form_token'),
+    path('sw.js', ServiceWorkerView.as_view(), name='service_worker'),
+    path('feeds/yandex-realty.xml', RealtyFeedView.as_view(), name='realty_feed'),
+    path('sitemap.xml', FeedDocumentView.as_view(document='sitemap'), name='sitemap'),
 ]
 
@@ -2,7 +2,24 @@
 Импорт всех views из landing приложения.
 """
 from .landing_view import LandingView
-from .articles_view import ArticlesListView, ArticleDetailView
+from .articles_view import ArticlesListView, ArticleSearchView, ArticleDetailView
+from .service_worker_view import ServiceWorkerView
+from .feeds_view import FeedDocumentView
+from .properties_view import PropertyCatalogView
+from .realty_feed_view import RealtyFeedView
+from .form_token_view import FormTokenView
+from .application_submit_view import ApplicationSubmitView
 
-__all__ = ['LandingView', 'ArticlesListView', 'ArticleDetailView']
+__all__ = [
+    'LandingView',
+    'ArticlesListView',
+    'ArticleSearchView',
+    'ArticleDetailView',
+    'ServiceWorkerView',
+    'FeedDocumentView',
+    'PropertyCatalogView',
+    'RealtyFeedView',
+    'FormTokenView',
+    'ApplicationSubmitView',
+]
 
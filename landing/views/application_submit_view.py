@@ -0,0 +1,39 @@
+"""
+JSON-эндпоинт отправки формы заявки.
+"""
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from landing.services import applications
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class ApplicationSubmitView(View):
+    """
+    Прием заявки без перезагрузки страницы.
+
+    Заявка проверяется и записывается так же, как при обычной отправке
+    формы (см. landing.services.applications), уведомление в Telegram
+    ставится в очередь, и ответ 202 возвращается сразу. Страница
+    показывает сообщение сама, поэтому второй рендер главной после
+    редиректа не нужен.
+    """
+    http_method_names = ['post']
+
+    def post(self, request, *args, **kwargs):
+        """
+        Прием заявки.
+
+        Returns:
+            JsonResponse: {"ok": bool, "message": str}, 202 если заявка принята
+        """
+        try:
+            submission = applications.accept(request)
+        except applications.SubmissionRejected as e:
+            return JsonResponse({'ok': e.status == 202, 'message': e.message}, status=e.status)
+
+        if submission.application is not None:
+            applications.notify_async(submission.application, submission.key)
+        return JsonResponse({'ok': True, 'message': applications.SUCCESS_MESSAGE}, status=202)
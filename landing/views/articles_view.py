@@ -1,18 +1,36 @@
 """
 Views для страниц статей.
 """
+from django.http import Http404
+from django.shortcuts import redirect
 from django.views.generic import ListView, DetailView
 from landing.models import Article
+from landing.services import page_cache
+from landing.services.full_text_search import ARTICLE_SEARCH_INDEX
+from landing.services.keyset_pagination import InvalidCursor, KeysetPaginator
 
 
 class ArticlesListView(ListView):
     """
     Страница со списком всех статей.
+    
+    Использует keyset пагинацию по (published_at, uuid): ссылки вида
+    ?after=<курсор> / ?before=<курсор>, без COUNT(*) и OFFSET.
+    Старые ссылки ?page=N перенаправляются на эквивалентный курсор.
     """
     model = Article
     template_name = 'landing/articles_list.html'
     context_object_name = 'articles'
-    paginate_by = 10
+    page_size = 10
+    ordering = ('-published_at', '-uuid')
+    
+    def get(self, request, *args, **kwargs):
+        """
+        Перенаправление старых ссылок ?page=N на курсорные.
+        """
+        if 'page' in request.GET:
+            return redirect(self._legacy_page_url(request.GET['page']), permanent=True)
+        return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
         """
@@ -21,7 +39,92 @@ class ArticlesListView(ListView):
         Returns:
             QuerySet: Опубликованные статьи
         """
-        return Article.objects.filter(is_published=True).order_by('-published_at')
+        return Article.objects.published().order_by(*self.ordering)
+    
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """
+        Keyset пагинатор для списка статей.
+        """
+        return KeysetPaginator(queryset, self.ordering, per_page)
+    
+    def get_context_data(self, **kwargs):
+        """
+        Получение страницы статей по курсору из query string.
+        
+        Returns:
+            dict: Контекст со страницей статей
+        
+        Raises:
+            Http404: Если курсор поврежден
+        """
+        paginator = self.get_paginator(self.object_list, self.page_size)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get('after'),
+                before=self.request.GET.get('before'),
+            )
+        except InvalidCursor:
+            raise Http404('Некорректная ссылка на страницу')
+        
+        self.object_list = page.object_list
+        context = super().get_context_data(**kwargs)
+        context['page'] = page
+        return context
+    
+    def _legacy_page_url(self, page_number: str) -> str:
+        """
+        URL курсорной страницы, эквивалентной старой странице ?page=N.
+        
+        Однократный OFFSET-запрос нужен только для редиректа.
+        """
+        try:
+            page_number = int(page_number)
+        except (TypeError, ValueError):
+            page_number = 1
+        
+        if page_number > 1:
+            offset = (page_number - 1) * self.page_size - 1
+            last_of_previous = self.get_queryset()[offset:offset + 1].first()
+            if last_of_previous is not None:
+                cursor = self.get_paginator(self.get_queryset(), self.page_size).cursor_for(last_of_previous)
+                return f'{self.request.path}?after={cursor}'
+        return self.request.path
+
+
+class ArticleSearchView(ListView):
+    """
+    Поиск по статьям с ранжированием по релевантности.
+    
+    Использует полнотекстовый индекс (FTS5 в SQLite, tsvector в PostgreSQL).
+    """
+    model = Article
+    template_name = 'landing/articles_search.html'
+    context_object_name = 'articles'
+    results_limit = 50
+    
+    def get_queryset(self):
+        """
+        Поиск опубликованных статей по строке ?q=.
+        
+        Returns:
+            list: Найденные статьи, отсортированные по релевантности
+        """
+        query = self.request.GET.get('q', '').strip()
+        if not query:
+            return []
+        return ARTICLE_SEARCH_INDEX.search(
+            Article.objects.published(),
+            query,
+            limit=self.results_limit,
+        )
+    
+    def get_context_data(self, **kwargs):
+        """
+        Добавление поисковой строки в контекст.
+        """
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.request.GET.get('q', '').strip()
+        return context
 
 
 class ArticleDetailView(DetailView):
@@ -36,10 +139,22 @@ class ArticleDetailView(DetailView):
     
     def get_queryset(self):
         """
-        Получение только опубликованных статей.
+        Получение только опубликованных статей (дата публикации наступила).
         
         Returns:
             QuerySet: Опубликованные статьи
         """
-        return Article.objects.filter(is_published=True)
+        return Article.objects.published()
+    
+    def get_object(self, queryset=None):
+        """
+        Получение статьи с запоминанием ее версии для кэша страниц.
+        
+        Returns:
+            Article: Опубликованная статья
+        """
+        article = super().get_object(queryset)
+        if page_cache.get_article_version(article.slug) is None:
+            page_cache.set_article_version(article)
+        return article
 
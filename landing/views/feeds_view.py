@@ -0,0 +1,27 @@
+"""
+Views для sitemap.xml и RSS/Atom ленты статей.
+"""
+from django.views import View
+
+from landing.services import feeds, page_cache
+
+
+class FeedDocumentView(View):
+    """
+    Отдает готовый документ из кэша в кодировке по Accept-Encoding.
+
+    Документы пересобираются после изменения статей и объектов (см. landing.services.feeds),
+    запрос только выбирает сжатый вариант.
+    """
+    document = 'sitemap'
+
+    def get(self, request, *args, **kwargs):
+        """
+        Отдача документа.
+
+        Returns:
+            HttpResponse: XML документ
+        """
+        content_type, encoded = feeds.get_document(self.document)
+        encoding = page_cache.negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        return page_cache.build_response(request, encoded[encoding], content_type, encoding)
@@ -0,0 +1,30 @@
+"""
+View выдачи токена формы заявки.
+"""
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.cache import never_cache
+
+from landing.services import spam_guard
+
+
+@method_decorator(never_cache, name='dispatch')
+class FormTokenView(View):
+    """
+    Свежий токен формы заявки.
+
+    Главная страница отдается из общего кэша, поэтому токен в ее HTML
+    выдан в момент рендера. Скрипт страницы запрашивает новый токен при
+    начале заполнения формы, и минимальное время заполнения отсчитывается
+    от него (см. landing.services.spam_guard).
+    """
+
+    def get(self, request, *args, **kwargs):
+        """
+        Выдача токена.
+
+        Returns:
+            JsonResponse: {"token": "..."}
+        """
+        return JsonResponse({'token': spam_guard.issue_form_token()})
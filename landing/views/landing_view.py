@@ -2,16 +2,19 @@
 Views для лендинга компании Бюро Квартир.
 """
 from django.views.generic import TemplateView
+from django.views.decorators.csrf import csrf_exempt
+from django.utils.decorators import method_decorator
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.db.utils import OperationalError, ProgrammingError
 from loguru import logger
 
-from landing.models import Service, Property, Article, TeamMember, Application
-from landing.services import TelegramService
+from landing.models import Service, Property, Article, TeamMember
+from landing.services import applications, idempotency, spam_guard
 
 
+@method_decorator(csrf_exempt, name='dispatch')
 class LandingView(TemplateView):
     """
     Главная страница лендинга.
@@ -22,6 +25,13 @@ class LandingView(TemplateView):
     - Последние статьи
     
     Обрабатывает POST запросы от формы заявки и отправляет их в Telegram.
+    
+    Страница одинакова для всех посетителей и отдается из общего кэша
+    (PrecompressedCacheMiddleware), поэтому персонального CSRF-токена
+    и CSRF-cookie в ней быть не может. Форма заявки анонимная и не
+    действует от имени пользователя, поэтому CSRF-проверка для нее
+    отключена: отправку защищают подписанный токен формы, honeypot
+    и лимиты заявок (см. landing.services.spam_guard).
     """
     template_name = 'landing/index.html'
 
@@ -47,7 +57,10 @@ class LandingView(TemplateView):
             context['properties'] = Property.objects.filter(is_active=True).order_by('order', '-created_at')[:3]
 
             # Получаем опубликованные статьи, отсортированные по дате публикации
-            context['articles'] = Article.objects.filter(is_published=True).order_by('-published_at')[:3]
+            context['articles'] = Article.objects.published().order_by('-published_at')[:3]
+
+            # Токен формы заявки (см. landing.services.spam_guard)
+            context['form_token'] = spam_guard.issue_form_token()
         except (OperationalError, ProgrammingError) as e:
             logger.warning(
                 "База данных не инициализирована или миграции не применены. "
@@ -67,62 +80,25 @@ class LandingView(TemplateView):
         Обработка POST запроса от формы заявки.
         
         Получает данные формы, сохраняет заявку в БД и отправляет в Telegram.
+        Спам и флуд отсекаются до обращения к БД (см. spam_guard): боту
+        показывается обычное сообщение об успехе. Повтор той же отправки
+        возвращает исходное сообщение без новой заявки.
+
+        Скрипт страницы отправляет форму через ApplicationSubmitView
+        без перезагрузки, этот обработчик - для браузеров без JavaScript.
         
         Returns:
             HttpResponseRedirect: Редирект на главную страницу с сообщением
         """
-        name = request.POST.get('name', '').strip()
-        phone = request.POST.get('phone', '').strip()
-        message = request.POST.get('message', '').strip()
-        
-        # Валидация обязательных полей
-        if not name or not phone:
-            messages.error(request, 'Пожалуйста, заполните все обязательные поля.')
-            return redirect(reverse('landing:index') + '#contact-form')
-        
-        # Создаем заявку в БД
         try:
-            application = Application.objects.create(
-                name=name,
-                phone=phone,
-                message=message if message else None
-            )
-            logger.info(f'Создана новая заявка: {application}')
-        except (OperationalError, ProgrammingError) as e:
-            logger.error(
-                "Заявка не сохранена: база данных не инициализирована (нет таблиц). "
-                "Выполните миграции: python manage.py migrate. Причина: {error}",
-                error=str(e),
-            )
-            messages.error(request, 'Сервер не готов: база данных не инициализирована. Обратитесь к администратору.')
+            submission = applications.accept(request)
+        except applications.SubmissionRejected as e:
+            messages.add_message(request, e.level, e.message)
             return redirect(reverse('landing:index') + '#contact-form')
-        except Exception as e:
-            logger.error(f'Ошибка создания заявки: {e}')
-            messages.error(request, 'Произошла ошибка при отправке заявки. Попробуйте позже.')
-            return redirect(reverse('landing:index') + '#contact-form')
-        
-        # Отправляем в Telegram
-        try:
-            telegram_service = TelegramService()
-            result = telegram_service.send_application(name, phone, message)
-            
-            if result.get('ok') or result.get('sent_count', 0) > 0:
-                application.is_sent_to_telegram = True
-                application.save(update_fields=['is_sent_to_telegram'])
-                messages.success(request, 'Спасибо! Ваша заявка успешно отправлена. Мы свяжемся с вами в ближайшее время.')
-                logger.info(f'Заявка {application} успешно отправлена в Telegram. Отправлено: {result.get("sent_count", 0)}')
-            else:
-                error_msg = result.get('error', 'Неизвестная ошибка')
-                application.telegram_error = error_msg
-                application.save(update_fields=['telegram_error'])
-                messages.warning(request, 'Заявка сохранена, но произошла ошибка при отправке уведомления. Мы обработаем вашу заявку вручную.')
-                logger.warning(f'Ошибка отправки заявки {application} в Telegram: {error_msg}')
-        except Exception as e:
-            error_msg = str(e)
-            application.telegram_error = error_msg
-            application.save(update_fields=['telegram_error'])
-            messages.warning(request, 'Заявка сохранена, но произошла ошибка при отправке уведомления. Мы обработаем вашу заявку вручную.')
-            logger.error(f'Критическая ошибка отправки заявки {application} в Telegram: {error_msg}')
-        
-        return redirect(reverse('landing:index') + '#contact-form')
 
+        result = submission.replayed or applications.notify(submission.application, submission.key)
+        if result == idempotency.SENT:
+            messages.success(request, applications.SUCCESS_MESSAGE)
+        else:
+            messages.warning(request, applications.SAVED_MESSAGE)
+        return redirect(reverse('landing:index') + '#contact-form')
@@ -0,0 +1,86 @@
+"""
+Views для каталога объектов недвижимости.
+"""
+from urllib.parse import urlencode
+
+from django.http import Http404
+from django.views.generic import ListView
+from landing.models import Property
+from landing.models.property import PropertyType
+from landing.services import property_facets
+from landing.services.keyset_pagination import InvalidCursor, KeysetPaginator
+
+
+class PropertyCatalogView(ListView):
+    """
+    Каталог объектов недвижимости с фильтрами.
+    
+    Фильтры по типу (?type=) и ценовому диапазону (?price=) можно выбирать
+    по нескольку значений, плюс поиск по адресу (?location=). Счетчики
+    фасетов берутся из заранее посчитанной матрицы (см. property_facets).
+    Пагинация keyset по (order, created_at, uuid).
+    """
+    model = Property
+    template_name = 'landing/properties_list.html'
+    context_object_name = 'properties'
+    page_size = 12
+    ordering = ('order', '-created_at', 'uuid')
+    
+    def get_filters(self) -> dict:
+        """
+        Разбор фильтров из query string.
+        
+        Returns:
+            dict: Выбранные типы, ценовые диапазоны и строка адреса
+        """
+        return {
+            'types': property_facets.clean_choices(self.request.GET.getlist('type'), PropertyType.values),
+            'buckets': property_facets.clean_choices(
+                self.request.GET.getlist('price'), property_facets.PRICE_BUCKET_KEYS
+            ),
+            'location': self.request.GET.get('location', '').strip(),
+        }
+    
+    def get_queryset(self):
+        """
+        Получение активных объектов с примененными фильтрами.
+        
+        Returns:
+            QuerySet: Отфильтрованные объекты
+        """
+        return property_facets.filter_properties(
+            Property.objects.filter(is_active=True),
+            **self.get_filters(),
+        ).order_by(*self.ordering)
+    
+    def get_context_data(self, **kwargs):
+        """
+        Страница объектов по курсору, фасеты и строка фильтров для ссылок.
+        
+        Returns:
+            dict: Контекст каталога
+        
+        Raises:
+            Http404: Если курсор поврежден
+        """
+        paginator = KeysetPaginator(self.object_list, self.ordering, self.page_size)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get('after'),
+                before=self.request.GET.get('before'),
+            )
+        except InvalidCursor:
+            raise Http404('Некорректная ссылка на страницу')
+        
+        filters = self.get_filters()
+        self.object_list = page.object_list
+        context = super().get_context_data(**kwargs)
+        context['page'] = page
+        context['facets'] = property_facets.get_facets(filters['types'], filters['buckets'])
+        context['location'] = filters['location']
+        context['filter_query'] = urlencode(
+            [('type', value) for value in filters['types']]
+            + [('price', value) for value in filters['buckets']]
+            + ([('location', filters['location'])] if filters['location'] else [])
+        )
+        return context
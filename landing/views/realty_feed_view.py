@@ -0,0 +1,26 @@
+"""
+View для XML-фида объектов недвижимости.
+"""
+from django.http import FileResponse
+from django.views import View
+
+from landing.services import realty_feed
+
+
+class RealtyFeedView(View):
+    """
+    Отдает XML-фид объектов для порталов недвижимости.
+
+    Файл собирается заранее и пересобирается только после изменения
+    объектов, ответ читается с диска потоком.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """
+        Отдача файла фида.
+
+        Returns:
+            FileResponse: XML фид
+        """
+        path = realty_feed.get_realty_feed()
+        return FileResponse(open(path, 'rb'), content_type='application/xml; charset=utf-8')
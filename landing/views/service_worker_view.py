@@ -0,0 +1,82 @@
+"""
+View для service worker лендинга.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.templatetags.static import static
+from django.urls import reverse
+from django.views import View
+from loguru import logger
+
+
+_STATIC_TAG_RE = re.compile(r"""{%\s*static\s+['"]([^'"]+)['"]\s*%}""")
+
+
+def get_precache_urls() -> list:
+    """
+    Список URL статики для предварительного кэширования.
+
+    Берутся ресурсы, на которые ссылаются шаблоны проекта через {% static %},
+    и разрешаются через манифест collectstatic (URL с хешем содержимого).
+
+    Returns:
+        list: Отсортированный список URL
+    """
+    paths = set()
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        for template_path in Path(directory).rglob('*.html'):
+            paths.update(_STATIC_TAG_RE.findall(template_path.read_text(encoding='utf-8')))
+
+    urls = set()
+    for path in paths:
+        try:
+            urls.add(static(path))
+        except ValueError as e:
+            logger.warning(f'Ресурс {path} не найден в манифесте статики: {e}')
+    return sorted(urls)
+
+
+class ServiceWorkerView(View):
+    """
+    Отдает service worker с корня сайта (область действия - весь сайт).
+
+    Скрипт генерируется один раз на процесс: список ресурсов меняется
+    только при деплое вместе с манифестом статики.
+    """
+    _content = None
+
+    def get(self, request, *args, **kwargs):
+        """
+        Отдача сгенерированного service worker.
+
+        Returns:
+            HttpResponse: JavaScript service worker
+        """
+        if self._content is None or settings.DEBUG:
+            type(self)._content = self._render()
+
+        response = HttpResponse(self._content, content_type='application/javascript; charset=utf-8')
+        # Браузер должен проверять обновления service worker при каждой загрузке
+        response['Cache-Control'] = 'no-cache'
+        response['Service-Worker-Allowed'] = '/'
+        return response
+
+    @staticmethod
+    def _render() -> str:
+        """
+        Рендер скрипта service worker с актуальным списком ресурсов.
+        """
+        precache_urls = get_precache_urls()
+        cache_version = hashlib.md5('\n'.join(precache_urls).encode('utf-8')).hexdigest()[:12]
+        return render_to_string('landing/sw.js', {
+            'cache_version': cache_version,
+            'precache_urls': json.dumps(precache_urls),
+            'form_path': reverse('landing:index'),
+            'submit_path': reverse('landing:application_submit'),
+        })
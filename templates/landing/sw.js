@@ -0,0 +1,250 @@
+/* Service worker Бюро Квартир. Генерируется landing.views.ServiceWorkerView. */
+const CACHE_VERSION = '{{ cache_version }}';
+const STATIC_CACHE = 'static-' + CACHE_VERSION;
+const PAGES_CACHE = 'pages-v1';
+const PRECACHE_URLS = {{ precache_urls|safe }};
+const SWR_PATHS = /^\/(articles\/.*)?$/;
+const FORM_PATH = '{{ form_path|escapejs }}';
+const SUBMIT_PATH = '{{ submit_path|escapejs }}';
+const SYNC_TAG = 'submit-application';
+const QUEUE_DB = 'burokv-forms';
+const QUEUE_STORE = 'applications';
+
+// После отправки формы следующую загрузку главной берем из сети,
+// чтобы показать flash-сообщение о результате.
+let bypassNextNavigation = false;
+// Текущая отправка очереди (защита от параллельной повторной отправки)
+let flushing = null;
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(STATIC_CACHE)
+            .then((cache) => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then((keys) => Promise.all(
+                keys.filter((key) => key.startsWith('static-') && key !== STATIC_CACHE)
+                    .map((key) => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+            .then(() => flushQueue())
+    );
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (request.method === 'POST' && (url.pathname === FORM_PATH || url.pathname === SUBMIT_PATH)) {
+        event.respondWith(submitOrQueue(request, url.pathname === SUBMIT_PATH));
+        return;
+    }
+    if (request.method !== 'GET') {
+        return;
+    }
+    if (PRECACHE_URLS.includes(url.pathname)) {
+        event.respondWith(
+            caches.match(request).then((cached) => cached || fetch(request))
+        );
+        return;
+    }
+    if (request.mode === 'navigate' && SWR_PATHS.test(url.pathname)) {
+        if (bypassNextNavigation) {
+            bypassNextNavigation = false;
+            return;
+        }
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+
+self.addEventListener('sync', (event) => {
+    if (event.tag === SYNC_TAG) {
+        // Отказ промиса - браузер повторит синхронизацию позже
+        event.waitUntil(flushQueue().then((done) => done ? undefined : Promise.reject(new Error('queue not sent'))));
+    }
+});
+
+function staleWhileRevalidate(event, request) {
+    return caches.open(PAGES_CACHE).then((cache) => cache.match(request).then((cached) => {
+        const network = fetch(request).then((response) => {
+            if (response.ok && response.type === 'basic' && !response.redirected) {
+                cache.put(request, response.clone());
+            }
+            flushQueue();
+            return response;
+        });
+        if (cached) {
+            event.waitUntil(network.catch(() => undefined));
+            return cached;
+        }
+        return network;
+    }));
+}
+
+// Заявка без связи сохраняется в IndexedDB и позже отправляется
+// в JSON-эндпоинт (SUBMIT_PATH) независимо от того, куда ее отправила форма
+function submitOrQueue(request, isJson) {
+    const body = request.clone().text();
+    return fetch(request)
+        .then((response) => {
+            if (!isJson) {
+                bypassNextNavigation = true;
+            }
+            return response;
+        })
+        .catch(() => body
+            .then((text) => enqueue({
+                body: text,
+                contentType: request.headers.get('Content-Type'),
+                queuedAt: Date.now(),
+            }))
+            .then(() => self.registration.sync
+                ? self.registration.sync.register(SYNC_TAG).catch(() => undefined)
+                : undefined)
+            .then(() => isJson ? queuedJsonResponse() : queuedHtmlResponse()));
+}
+
+function queuedJsonResponse() {
+    return new Response(JSON.stringify({
+        ok: true,
+        queued: true,
+        message: 'Нет соединения с интернетом. Заявка сохранена и будет отправлена автоматически, ' +
+            'как только соединение восстановится.',
+    }), {status: 202, headers: {'Content-Type': 'application/json'}});
+}
+
+function queuedHtmlResponse() {
+    return new Response(
+        '<!DOCTYPE html><html lang="ru"><head><meta charset="UTF-8">' +
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">' +
+        '<title>Заявка сохранена</title></head><body>' +
+        '<p>Нет соединения с интернетом. Заявка сохранена и будет отправлена автоматически, ' +
+        'как только соединение восстановится.</p><p><a href="/">Вернуться на главную</a></p>' +
+        '</body></html>',
+        {status: 202, headers: {'Content-Type': 'text/html; charset=utf-8'}}
+    );
+}
+
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const open = indexedDB.open(QUEUE_DB, 1);
+        open.onupgradeneeded = () => open.result.createObjectStore(QUEUE_STORE, {autoIncrement: true});
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+}
+
+function enqueue(entry) {
+    return openQueue().then((db) => new Promise((resolve, reject) => {
+        const tx = db.transaction(QUEUE_STORE, 'readwrite');
+        tx.objectStore(QUEUE_STORE).add(entry);
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+    }));
+}
+
+function flushQueue() {
+    if (!flushing) {
+        flushing = sendQueued().finally(() => {
+            flushing = null;
+        });
+    }
+    return flushing;
+}
+
+// Отправка очереди. Заявка удаляется только после ответа 2xx; при 5xx
+// или сбое сети отправка останавливается и заявки ждут следующей попытки.
+// Отказ 4xx (устаревший токен, лимит заявок) запоминается в заявке
+// и показывается посетителю на открытой странице сайта.
+// Промис возвращает true, если в очереди не осталось неотправленных заявок.
+function sendQueued() {
+    return openQueue().then((db) => readEntries(db)
+        .then((entries) => entries
+            .filter((entry) => !entry.value.rejected)
+            .reduce((chain, entry) => chain.then(() => sendEntry(db, entry)), Promise.resolve()))
+        .then(() => true, () => false)
+        .then((done) => reportRejected(db).then(() => done, () => done)))
+        .catch(() => false);
+}
+
+function sendEntry(db, entry) {
+    return fetch(SUBMIT_PATH, {
+        method: 'POST',
+        body: entry.value.body,
+        headers: {'Content-Type': entry.value.contentType},
+        credentials: 'same-origin',
+    }).then((response) => {
+        if (response.ok) {
+            return deleteEntry(db, entry.key);
+        }
+        if (response.status >= 500) {
+            throw new Error('submit: HTTP ' + response.status);
+        }
+        return response.json()
+            .then((data) => data.message, () => 'Ошибка ' + response.status)
+            .then((message) => putEntry(db, entry.key, Object.assign({}, entry.value, {rejected: message})));
+    });
+}
+
+// Отказы передаются открытым страницам сайта; без открытых страниц
+// заявки остаются в очереди до следующей отправки
+function reportRejected(db) {
+    return readEntries(db).then((entries) => {
+        const rejected = entries.filter((entry) => entry.value.rejected);
+        if (!rejected.length) {
+            return undefined;
+        }
+        return self.clients.matchAll({type: 'window'}).then((clients) => {
+            if (!clients.length) {
+                return undefined;
+            }
+            clients.forEach((client) => client.postMessage({
+                type: 'application-rejected',
+                messages: rejected.map((entry) => entry.value.rejected),
+            }));
+            return Promise.all(rejected.map((entry) => deleteEntry(db, entry.key)));
+        });
+    });
+}
+
+function readEntries(db) {
+    return new Promise((resolve, reject) => {
+        const entries = [];
+        const tx = db.transaction(QUEUE_STORE, 'readonly');
+        tx.objectStore(QUEUE_STORE).openCursor().onsuccess = (e) => {
+            const cursor = e.target.result;
+            if (cursor) {
+                entries.push({key: cursor.key, value: cursor.value});
+                cursor.continue();
+            }
+        };
+        tx.oncomplete = () => resolve(entries);
+        tx.onerror = () => reject(tx.error);
+    });
+}
+
+function putEntry(db, key, value) {
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(QUEUE_STORE, 'readwrite');
+        tx.objectStore(QUEUE_STORE).put(value, key);
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+    });
+}
+
+function deleteEntry(db, key) {
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(QUEUE_STORE, 'readwrite');
+        tx.objectStore(QUEUE_STORE).delete(key);
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+    });
+}